@@ -0,0 +1,48 @@
+"""
+Benchmark per-game cost of progress_to_next_game as a set grows.
+
+Standard scoring caps a set at 13 games, so this drives progress_to_next_game
+directly with synthetic advantage-set histories (e.g. 70-68) to show that
+finishing a game costs the same regardless of how many games came before.
+
+Usage:
+    python benchmarks/bench_long_set.py
+"""
+
+import timeit
+
+from pytennisscorer.models import GameHistory, GameState, SetState
+from pytennisscorer.progression import progress_to_next_game
+
+GAME_COUNTS = [10, 100, 1_000, 10_000]
+REPEAT = 5
+NUMBER = 20_000
+
+
+def _long_set(num_games: int) -> SetState:
+    """Build a set state with num_games finished games in its history."""
+    finished = GameState(home_score=4, away_score=2, is_tiebreak=False)
+    games = GameHistory([finished] * num_games)
+    current = GameState(home_score=4, away_score=0, is_tiebreak=False)
+    return SetState(
+        home_score=num_games // 2,
+        away_score=num_games - num_games // 2,
+        current_game=current,
+        games=games,
+    )
+
+
+def main() -> None:
+    """Print the per-game cost for each history length."""
+    print(f"{'games in set':>14} {'ns per game':>12}")
+    for num_games in GAME_COUNTS:
+        set_state = _long_set(num_games)
+        timer = timeit.Timer(
+            lambda s=set_state: progress_to_next_game(s, home_won_game=True, deciding_point=False)
+        )
+        best = min(timer.repeat(repeat=REPEAT, number=NUMBER)) / NUMBER
+        print(f"{num_games:>14} {best * 1e9:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
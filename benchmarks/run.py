@@ -0,0 +1,308 @@
+"""
+Benchmark suite for the scoring hot paths.
+
+Measures per-point and per-call latency, replay throughput and peak memory
+per live scorer. Results can be saved as a baseline and later compared against
+it to catch regressions.
+
+Usage:
+    python benchmarks/run.py                             # print results
+    python benchmarks/run.py --save benchmarks/baseline.json
+    python benchmarks/run.py --compare benchmarks/baseline.json [--threshold 0.2]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from pytennisscorer.formatter import format_match_score
+from pytennisscorer.models import MatchType
+from pytennisscorer.replay import replay
+from pytennisscorer.scorer import TennisScorer
+from pytennisscorer.transitions import TableScorer
+
+REPEAT = 5
+MATCH_POINTS = 300
+LIVE_SCORERS = 200
+
+Result = dict[str, Any]
+
+
+def _best_ns(
+    func: Callable[[Any], int], setup: Callable[[], Any] = lambda: None, repeat: int = REPEAT
+) -> float:
+    """
+    Run func repeatedly and return the best time per operation in nanoseconds.
+
+    Args:
+        func: Callable that performs some operations on the setup value and
+            returns how many it performed
+        setup: Untimed callable whose result is passed to func on each run
+        repeat: Number of runs
+
+    Returns:
+        Best nanoseconds per operation across runs
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        value = setup()
+        start = time.perf_counter_ns()
+        operations = func(value)
+        elapsed = time.perf_counter_ns() - start
+        best = min(best, elapsed / operations)
+    return best
+
+
+def _match_points(match_type: MatchType, seed: int = 0) -> list[bool]:
+    """Return a deterministic point sequence that does not finish the match."""
+    rng = random.Random(seed)
+    scorer = TennisScorer(match_type)
+    points: list[bool] = []
+    while len(points) < MATCH_POINTS:
+        is_home = rng.random() < 0.5
+        scorer.increase_score(is_home)
+        if scorer.get_winner() is not None:
+            scorer = TennisScorer(match_type)
+            points.clear()
+            continue
+        points.append(is_home)
+    return points
+
+
+def _latency(value: float) -> Result:
+    return {"value": value, "unit": "ns", "lower_is_better": True}
+
+
+def _throughput(value: float) -> Result:
+    return {"value": value, "unit": "points/s", "lower_is_better": False}
+
+
+def _memory(value: float) -> Result:
+    return {"value": value, "unit": "bytes", "lower_is_better": True}
+
+
+def bench_constructor() -> dict[str, Result]:
+    """TennisScorer construction cost per match type."""
+    results = {}
+    for match_type in MatchType:
+
+        def construct(_: None, match_type: MatchType = match_type) -> int:
+            for _ in range(10_000):
+                TennisScorer(match_type)
+            return 10_000
+
+        results[f"constructor[{match_type.value}]"] = _latency(_best_ns(construct))
+    return results
+
+
+def bench_increase_score() -> dict[str, Result]:
+    """Per-point latency of TennisScorer.increase_score."""
+    points = _match_points(MatchType.SINGLES_GRANDSLAM)
+
+    def setup() -> list[TennisScorer]:
+        return [TennisScorer(MatchType.SINGLES_GRANDSLAM) for _ in range(20)]
+
+    def run(scorers: list[TennisScorer]) -> int:
+        for scorer in scorers:
+            for is_home in points:
+                scorer.increase_score(is_home)
+        return len(scorers) * len(points)
+
+    return {"increase_score": _latency(_best_ns(run, setup))}
+
+
+def bench_get_score() -> dict[str, Result]:
+    """Cost of polling get_score and of formatting a score from scratch."""
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+    for is_home in _match_points(MatchType.SINGLES_GRANDSLAM):
+        scorer.increase_score(is_home)
+    state = scorer._state
+
+    def poll(_: None) -> int:
+        for _ in range(100_000):
+            scorer.get_score()
+        return 100_000
+
+    def format_uncached(_: None) -> int:
+        for _ in range(20_000):
+            format_match_score(state)
+        return 20_000
+
+    return {
+        "get_score[cached]": _latency(_best_ns(poll)),
+        "get_score[uncached]": _latency(_best_ns(format_uncached)),
+    }
+
+
+def bench_undo() -> dict[str, Result]:
+    """Per-call latency of TennisScorer.undo deep into a match."""
+    points = _match_points(MatchType.SINGLES_GRANDSLAM)
+    undos = 100
+
+    def setup() -> list[TennisScorer]:
+        scorers = []
+        for _ in range(10):
+            scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+            for is_home in points:
+                scorer.increase_score(is_home)
+            scorers.append(scorer)
+        return scorers
+
+    def run(scorers: list[TennisScorer]) -> int:
+        for scorer in scorers:
+            for _ in range(undos):
+                scorer.undo()
+        return len(scorers) * undos
+
+    return {"undo": _latency(_best_ns(run, setup))}
+
+
+def bench_replay() -> dict[str, Result]:
+    """Full-match replay throughput for each scoring path."""
+    points = _match_points(MatchType.SINGLES_GRANDSLAM)
+
+    def tennis_scorer(_: None) -> int:
+        for _ in range(20):
+            scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+            for is_home in points:
+                scorer.increase_score(is_home)
+                scorer.get_score()
+        return 20 * len(points)
+
+    def apply_points(_: None) -> int:
+        for _ in range(20):
+            scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+            scorer.apply_points(points)
+            scorer.get_score()
+        return 20 * len(points)
+
+    def table_scorer(_: None) -> int:
+        for _ in range(20):
+            scorer = TableScorer(MatchType.SINGLES_GRANDSLAM)
+            for is_home in points:
+                scorer.increase_score(is_home)
+                scorer.get_score()
+        return 20 * len(points)
+
+    def streaming(_: None) -> int:
+        for _ in range(20):
+            for _ in replay(MatchType.SINGLES_GRANDSLAM, points):
+                pass
+        return 20 * len(points)
+
+    return {
+        "replay[TennisScorer]": _throughput(1e9 / _best_ns(tennis_scorer)),
+        "replay[apply_points]": _throughput(1e9 / _best_ns(apply_points)),
+        "replay[TableScorer]": _throughput(1e9 / _best_ns(table_scorer)),
+        "replay[stream]": _throughput(1e9 / _best_ns(streaming)),
+    }
+
+
+def bench_memory() -> dict[str, Result]:
+    """Peak traced memory per live scorer while scoring partway through a match."""
+    points = _match_points(MatchType.SINGLES_GRANDSLAM)
+    results = {}
+    for label, max_undo in (("unbounded", None), ("max_undo=50", 50)):
+        tracemalloc.start()
+        scorers = []
+        for _ in range(LIVE_SCORERS):
+            scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM, max_undo=max_undo)
+            for is_home in points:
+                scorer.increase_score(is_home)
+            scorers.append(scorer)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[f"peak_memory_per_scorer[{label}]"] = _memory(peak / len(scorers))
+    return results
+
+
+BENCHMARKS = [
+    bench_constructor,
+    bench_increase_score,
+    bench_get_score,
+    bench_undo,
+    bench_replay,
+    bench_memory,
+]
+
+
+def run_all() -> dict[str, Result]:
+    """Run every benchmark and return results keyed by name."""
+    results: dict[str, Result] = {}
+    for bench in BENCHMARKS:
+        results.update(bench())
+    return results
+
+
+def print_results(results: dict[str, Result]) -> None:
+    """Print results as a table."""
+    print(f"{'benchmark':<40} {'value':>14} unit")
+    for name, result in results.items():
+        print(f"{name:<40} {result['value']:>14,.0f} {result['unit']}")
+
+
+def compare(results: dict[str, Result], baseline: dict[str, Result], threshold: float) -> bool:
+    """
+    Print a comparison against a baseline.
+
+    Args:
+        results: Current results
+        baseline: Stored baseline results
+        threshold: Relative slowdown treated as a regression (0.2 = 20%)
+
+    Returns:
+        True if any benchmark regressed beyond the threshold
+    """
+    regressed = False
+    print(f"{'benchmark':<40} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<40} {'-':>14} {result['value']:>14,.0f}      new")
+            continue
+
+        old = baseline[name]["value"]
+        change = (result["value"] - old) / old if old else 0.0
+        worse = change if result["lower_is_better"] else -change
+        flag = ""
+        if worse > threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        print(f"{name:<40} {old:>14,.0f} {result['value']:>14,.0f} {change:>+8.1%}{flag}")
+    return regressed
+
+
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", type=Path, help="write results to this baseline file")
+    parser.add_argument("--compare", type=Path, help="compare results with this baseline file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="relative slowdown treated as regression"
+    )
+    args = parser.parse_args()
+    if args.compare and not args.compare.is_file():
+        parser.error(f"baseline {args.compare} does not exist; create it with --save")
+
+    results = run_all()
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(results, baseline, args.threshold):
+            return 1
+    else:
+        print_results(results)
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved baseline to {args.save}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
 """Python Tennis Scorer - A package for tennis match scoring."""
 
 from pytennisscorer.models import MatchType
+from pytennisscorer.replay import replay
 from pytennisscorer.scorer import TennisScorer
+from pytennisscorer.transitions import TableScorer
 
 __version__ = "0.1.0"
 
-__all__ = ["MatchType", "TennisScorer"]
+__all__ = ["MatchType", "TableScorer", "TennisScorer", "replay"]
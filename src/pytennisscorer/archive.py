@@ -0,0 +1,264 @@
+"""Memory-mapped columnar archive of bit-packed point sequences."""
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from types import TracebackType
+from typing import Optional, Union
+
+from pytennisscorer.bulk import MatchRecord, MatchResult, score_match
+from pytennisscorer.models import MatchType
+from pytennisscorer.replay import iter_points, replay
+
+# File layout (little-endian):
+#   header      magic, version, number of matches N
+#   types       N x uint8 match type index
+#   counts      N x uint32 points per match
+#   offsets     N + 1 x uint64 byte offset of each match's bits, from the data start
+#   data        point winners, one bit per point (1 = home), least significant bit
+#               first, each match starting on a byte boundary
+# Columns after the types are padded to 8-byte alignment.
+ARCHIVE_MAGIC = b"PTSA"
+ARCHIVE_VERSION = 1
+ARCHIVE_HEADER = struct.Struct("<4sBxxxQ")
+
+_COUNT = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+_MATCH_TYPES = list(MatchType)
+
+# Point winners for every byte value, least significant bit first
+_BYTE_POINTS = [tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256)]
+
+PathLike = Union[str, os.PathLike[str]]
+
+
+def _align(size: int) -> int:
+    """Round size up to a multiple of 8."""
+    return -(-size // 8) * 8
+
+
+def _column_layout(num_matches: int) -> tuple[int, int, int]:
+    """Return the file positions of the counts, offsets and data columns."""
+    counts = _align(ARCHIVE_HEADER.size + num_matches)
+    offsets = _align(counts + num_matches * _COUNT.size)
+    data = offsets + (num_matches + 1) * _OFFSET.size
+    return counts, offsets, data
+
+
+def _pack_points(points: Iterable[bool]) -> tuple[int, bytes]:
+    """Bit-pack point winners, returning (number of points, bytes)."""
+    data = bytearray()
+    byte = 0
+    count = 0
+    for count, is_home in enumerate(points, 1):
+        if is_home:
+            byte |= 1 << ((count - 1) & 7)
+        if not count & 7:
+            data.append(byte)
+            byte = 0
+    if count & 7:
+        data.append(byte)
+    return count, bytes(data)
+
+
+def write_archive(path: PathLike, matches: Iterable[MatchRecord]) -> int:
+    """
+    Write point sequences to a columnar archive file.
+
+    Args:
+        path: Destination file, overwritten if it exists
+        matches: (match_type, points) records; points as accepted by
+            ``replay.iter_points``
+
+    Returns:
+        Number of matches written
+
+    Raises:
+        ValueError: If a match has more than 2**32 - 1 points
+    """
+    types = bytearray()
+    counts = []
+    blobs = []
+    for match_type, points in matches:
+        count, blob = _pack_points(iter_points(points))
+        if count > 0xFFFFFFFF:
+            raise ValueError(f"Match has too many points to archive: {count}")
+        types.append(_MATCH_TYPES.index(match_type))
+        counts.append(count)
+        blobs.append(blob)
+
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+
+    num_matches = len(counts)
+    counts_pos, offsets_pos, data_pos = _column_layout(num_matches)
+    header = bytearray(data_pos)
+    ARCHIVE_HEADER.pack_into(header, 0, ARCHIVE_MAGIC, ARCHIVE_VERSION, num_matches)
+    header[ARCHIVE_HEADER.size : ARCHIVE_HEADER.size + num_matches] = types
+    struct.pack_into(f"<{num_matches}I", header, counts_pos, *counts)
+    struct.pack_into(f"<{num_matches + 1}Q", header, offsets_pos, *offsets)
+
+    with open(path, "wb") as file:
+        file.write(header)
+        file.writelines(blobs)
+    return num_matches
+
+
+class PointArchive:
+    """
+    Read-only, memory-mapped view of an archive written by ``write_archive``.
+
+    Opening an archive reads only its header; the columns and point bits are
+    paged in by the operating system as matches are accessed, so any match
+    can be fetched by id without loading the whole file.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        """
+        Open an archive.
+
+        Args:
+            path: Archive file
+
+        Raises:
+            ValueError: If the file is not a valid archive
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open()
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    def _open(self) -> None:
+        """Validate the header and locate the columns."""
+        data = self._mmap
+        if len(data) < ARCHIVE_HEADER.size:
+            raise ValueError("Truncated point archive")
+        magic, version, num_matches = ARCHIVE_HEADER.unpack_from(data)
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError("Not a point archive")
+        if version != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported point archive version {version}")
+
+        self._num_matches: int = num_matches
+        self._counts, self._offsets, self._data = _column_layout(num_matches)
+        if len(data) < self._data or len(data) != self._data + self._offset(num_matches):
+            raise ValueError("Point archive length does not match its index")
+
+    def _offset(self, index: int) -> int:
+        offset: int = _OFFSET.unpack_from(self._mmap, self._offsets + index * _OFFSET.size)[0]
+        return offset
+
+    def _check_index(self, match_id: int) -> None:
+        if not 0 <= match_id < self._num_matches:
+            raise IndexError(f"Match id {match_id} out of range")
+
+    def __len__(self) -> int:
+        """Number of matches in the archive."""
+        return self._num_matches
+
+    def __enter__(self) -> "PointArchive":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the archive file."""
+        self._mmap.close()
+
+    def match_type(self, match_id: int) -> MatchType:
+        """
+        Get the match type of a match.
+
+        Args:
+            match_id: Index of the match in the archive
+
+        Returns:
+            MatchType of the match
+
+        Raises:
+            IndexError: If match_id is out of range
+        """
+        self._check_index(match_id)
+        return _MATCH_TYPES[self._mmap[ARCHIVE_HEADER.size + match_id]]
+
+    def num_points(self, match_id: int) -> int:
+        """
+        Get the number of points stored for a match.
+
+        Args:
+            match_id: Index of the match in the archive
+
+        Returns:
+            Number of points
+
+        Raises:
+            IndexError: If match_id is out of range
+        """
+        self._check_index(match_id)
+        count: int = _COUNT.unpack_from(self._mmap, self._counts + match_id * _COUNT.size)[0]
+        return count
+
+    def points(self, match_id: int) -> list[bool]:
+        """
+        Get the point winners of a match.
+
+        Args:
+            match_id: Index of the match in the archive
+
+        Returns:
+            True for each home point, False for each away point
+
+        Raises:
+            IndexError: If match_id is out of range
+        """
+        count = self.num_points(match_id)
+        start = self._data + self._offset(match_id)
+        packed = self._mmap[start : start + (count + 7) // 8]
+        return list(chain.from_iterable(_BYTE_POINTS[byte] for byte in packed))[:count]
+
+    def replay(self, match_id: int) -> Iterator[str]:
+        """
+        Replay a match, lazily yielding the score after every point.
+
+        Args:
+            match_id: Index of the match in the archive
+
+        Returns:
+            Iterator of score strings, see ``replay.replay``
+
+        Raises:
+            IndexError: If match_id is out of range
+        """
+        return replay(self.match_type(match_id), self.points(match_id))
+
+    def score(self, match_id: int) -> MatchResult:
+        """
+        Score a match and return its final result.
+
+        Args:
+            match_id: Index of the match in the archive
+
+        Returns:
+            MatchResult, see ``bulk.score_match``
+
+        Raises:
+            IndexError: If match_id is out of range
+        """
+        return score_match(self.match_type(match_id), self.points(match_id))
+
+    def __iter__(self) -> Iterator[MatchRecord]:
+        """Iterate over (match_type, points) records, e.g. for ``bulk_score``."""
+        for match_id in range(self._num_matches):
+            yield self.match_type(match_id), self.points(match_id)
@@ -0,0 +1,205 @@
+"""Vectorized scoring of many matches at once with NumPy."""
+
+from typing import Literal, Optional
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "pytennisscorer.batch requires numpy; install with 'pip install pytennisscorer[numpy]'"
+    ) from exc
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import MatchType
+from pytennisscorer.transitions import (
+    FLAG_BITS,
+    FLAG_GAME_END,
+    FLAG_SET_END,
+    FLAG_TIEBREAK_WRAP,
+    compile_transition_table,
+)
+
+
+class BatchScorer:
+    """
+    Score many matches of the same match type in lock-step.
+
+    Matches are stored as struct-of-arrays: one NumPy array per field, indexed
+    by match. Each call to ``increase_score`` scores one point in every match
+    through the compiled transition table from ``transitions``, so results are
+    identical to ``TennisScorer``.
+    """
+
+    def __init__(self, match_type: MatchType, num_matches: int) -> None:
+        """
+        Initialize a batch of matches at 0-0.
+
+        Args:
+            match_type: Type of tennis match to score
+            num_matches: Number of matches in the batch
+        """
+        rules = create_match_config(match_type).rules
+        table = compile_transition_table(rules)
+
+        self._transitions = np.asarray(table.transitions, dtype=np.int64)
+        self._home_sets = np.asarray(table.home_sets, dtype=np.int8)
+        self._away_sets = np.asarray(table.away_sets, dtype=np.int8)
+        self._home_games = np.asarray(table.home_games, dtype=np.int16)
+        self._away_games = np.asarray(table.away_games, dtype=np.int16)
+        self._home_points = np.asarray(table.home_points, dtype=np.int16)
+        self._away_points = np.asarray(table.away_points, dtype=np.int16)
+        self._is_tiebreak = np.asarray(table.is_tiebreak, dtype=np.bool_)
+        self._is_finished = np.asarray(table.is_finished, dtype=np.bool_)
+        self._game_score_text = table.game_score_text
+
+        self._state = np.full(num_matches, table.initial_state, dtype=np.int64)
+        self._tiebreak_offset = np.zeros(num_matches, dtype=np.int32)
+        self._set_scores: npt.NDArray[np.int16] = np.zeros(
+            (num_matches, rules.best_of, 2), dtype=np.int16
+        )
+
+    def __len__(self) -> int:
+        """Number of matches in the batch."""
+        return len(self._state)
+
+    @property
+    def home_games(self) -> npt.NDArray[np.int16]:
+        """Home games won in the current set of each match."""
+        return self._home_games[self._state]
+
+    @property
+    def away_games(self) -> npt.NDArray[np.int16]:
+        """Away games won in the current set of each match."""
+        return self._away_games[self._state]
+
+    @property
+    def home_points(self) -> npt.NDArray[np.int32]:
+        """Home points in the current game of each match (internal 0-4 scale)."""
+        return self._home_points[self._state] + self._tiebreak_offset
+
+    @property
+    def away_points(self) -> npt.NDArray[np.int32]:
+        """Away points in the current game of each match (internal 0-4 scale)."""
+        return self._away_points[self._state] + self._tiebreak_offset
+
+    @property
+    def set_index(self) -> npt.NDArray[np.int8]:
+        """Index of the current set in each match."""
+        played = self._home_sets[self._state] + self._away_sets[self._state]
+        return np.where(self._is_finished[self._state], played - 1, played).astype(np.int8)
+
+    @property
+    def is_tiebreak(self) -> npt.NDArray[np.bool_]:
+        """Whether each match is currently in a tiebreak."""
+        return self._is_tiebreak[self._state]
+
+    @property
+    def is_finished(self) -> npt.NDArray[np.bool_]:
+        """Whether each match is finished."""
+        return self._is_finished[self._state]
+
+    @property
+    def set_scores(self) -> npt.NDArray[np.int16]:
+        """Games per set as an array of shape (matches, best_of, 2)."""
+        scores: npt.NDArray[np.int16] = self._set_scores.copy()
+        live = np.flatnonzero(~self.is_finished)
+        index = self.set_index[live]
+        scores[live, index, 0] = self.home_games[live]
+        scores[live, index, 1] = self.away_games[live]
+        return scores
+
+    def increase_score(
+        self,
+        is_home: npt.ArrayLike,
+        active: Optional[npt.ArrayLike] = None,
+    ) -> None:
+        """
+        Score one point in every match.
+
+        Args:
+            is_home: Boolean array, True where the home player wins the point
+            active: Optional boolean mask; matches where it is False are skipped
+        """
+        winners = np.asarray(is_home, dtype=np.bool_)
+        if winners.shape != self._state.shape:
+            raise ValueError(f"Expected {len(self._state)} point winners, got {winners.shape}")
+
+        state = self._state
+        codes = self._transitions[state * 2 + (~winners).astype(np.int64)]
+        if active is not None:
+            mask = np.asarray(active, dtype=np.bool_)
+            codes = np.where(mask, codes, state << FLAG_BITS)
+
+        set_end = np.flatnonzero(codes & FLAG_SET_END)
+        if len(set_end):
+            index = self._home_sets[state[set_end]] + self._away_sets[state[set_end]]
+            home_won = winners[set_end]
+            self._set_scores[set_end, index, 0] = self._home_games[state[set_end]] + home_won
+            self._set_scores[set_end, index, 1] = self._away_games[state[set_end]] + ~home_won
+
+        self._tiebreak_offset += (codes & FLAG_TIEBREAK_WRAP).astype(np.int32)
+        self._tiebreak_offset[(codes & FLAG_GAME_END) != 0] = 0
+        self._state = codes >> FLAG_BITS
+
+    def apply_points(self, points: npt.ArrayLike) -> None:
+        """
+        Score a sequence of points in every match.
+
+        Args:
+            points: Boolean array of shape (num_points, num_matches); row i holds
+                the winners of the i-th point
+        """
+        for row in np.asarray(points, dtype=np.bool_):
+            self.increase_score(row)
+
+    def get_score(self, index: int) -> str:
+        """
+        Get the score of one match in tennis notation.
+
+        Args:
+            index: Match index within the batch
+
+        Returns:
+            Score string (e.g., "6:4;3:6;2:2-30:15")
+        """
+        state = int(self._state[index])
+        played = int(self._home_sets[state] + self._away_sets[state])
+        finished_sets = [f"{h}:{a}" for h, a in self._set_scores[index, :played].tolist()]
+
+        if self._is_finished[state]:
+            return ";".join(finished_sets)
+
+        set_score = f"{self._home_games[state]}:{self._away_games[state]}"
+        offset = int(self._tiebreak_offset[index])
+        if offset:
+            game_score = f"{self._home_points[state] + offset}:{self._away_points[state] + offset}"
+        else:
+            game_score = self._game_score_text[state]
+
+        return ";".join([*finished_sets, set_score]) + f"-{game_score}"
+
+    def get_scores(self) -> list[str]:
+        """
+        Get the score of every match in tennis notation.
+
+        Returns:
+            List of score strings in match order
+        """
+        return [self.get_score(i) for i in range(len(self._state))]
+
+    def get_winners(self) -> list[Optional[Literal["home", "away"]]]:
+        """
+        Get the winner of every match.
+
+        Returns:
+            List with "home", "away" or None (not finished) per match
+        """
+        home_sets = self._home_sets[self._state]
+        away_sets = self._away_sets[self._state]
+        return [
+            None if not finished else ("home" if home > away else "away")
+            for finished, home, away in zip(
+                self.is_finished.tolist(), home_sets.tolist(), away_sets.tolist()
+            )
+        ]
@@ -0,0 +1,105 @@
+"""Multi-process bulk scoring of archived point sequences."""
+
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+from pytennisscorer.models import MatchType
+from pytennisscorer.replay import Point, iter_points
+from pytennisscorer.transitions import TableScorer
+
+# Inputs smaller than this are scored in-process; pool start-up would dominate
+MIN_PARALLEL_MATCHES = 256
+
+# Chunks per worker; more chunks balance load better, fewer amortize pickling
+CHUNKS_PER_WORKER = 4
+
+MatchRecord = tuple[MatchType, Iterable[Point]]
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """Final result of a scored match."""
+
+    score: str
+    winner: Optional[Literal["home", "away"]]
+    sets: tuple[tuple[int, int], ...]
+
+
+def score_match(match_type: MatchType, points: Iterable[Point]) -> MatchResult:
+    """
+    Score a complete point sequence and return its final result.
+
+    Points after the end of the match are ignored, as in ``TennisScorer``.
+
+    Args:
+        match_type: Type of tennis match to score
+        points: Point winners, see ``replay.iter_points``
+
+    Returns:
+        MatchResult with the final score, winner and games per set
+    """
+    scorer = TableScorer(match_type)
+    for is_home in iter_points(points):
+        scorer.increase_score(is_home)
+        if scorer.get_winner() is not None:
+            break
+
+    return MatchResult(
+        score=scorer.get_score(),
+        winner=scorer.get_winner(),
+        sets=tuple(scorer.get_set_scores()),
+    )
+
+
+def _score_chunk(chunk: list[MatchRecord]) -> list[MatchResult]:
+    """Score a chunk of match records (runs inside worker processes)."""
+    return [score_match(match_type, points) for match_type, points in chunk]
+
+
+def bulk_score(
+    matches: Iterable[MatchRecord],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> list[MatchResult]:
+    """
+    Score many matches across a pool of worker processes.
+
+    Records are sent to workers in chunks to amortize pickling cost. Inputs
+    smaller than ``MIN_PARALLEL_MATCHES``, or ``workers=1``, are scored
+    in-process. Point sequences must be picklable (strings, bytes or lists).
+
+    Args:
+        matches: (match_type, points) records
+        workers: Number of worker processes, defaults to the CPU count
+        chunk_size: Records per chunk, defaults to an even split giving
+            ``CHUNKS_PER_WORKER`` chunks per worker
+
+    Returns:
+        MatchResult for every record, in input order
+
+    Raises:
+        ValueError: If workers or chunk_size is not positive
+    """
+    records = list(matches)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, got {workers}")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    if workers == 1 or len(records) < MIN_PARALLEL_MATCHES:
+        return _score_chunk(records)
+
+    if chunk_size is None:
+        chunk_size = -(-len(records) // (workers * CHUNKS_PER_WORKER))
+    chunks = [records[i : i + chunk_size] for i in range(0, len(records), chunk_size)]
+
+    results: list[MatchResult] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        for chunk_results in executor.map(_score_chunk, chunks):
+            results.extend(chunk_results)
+    return results
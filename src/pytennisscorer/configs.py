@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 
-from pytennisscorer.models import GameState, MatchState, MatchType, ScoringRules, SetState
+from pytennisscorer.models import NEW_SET, MatchState, MatchType, ScoringRules, SetState
 
 
 @dataclass(frozen=True)
@@ -14,99 +14,108 @@ class MatchConfig:
     initial_state: MatchState
 
 
-def _create_initial_sets(num_sets: int, deciding_point: bool) -> list[SetState]:
+def _create_initial_sets(deciding_point: bool) -> tuple[SetState, ...]:
     """
-    Create initial sets for a match.
+    Create the sets of a match before its first point.
+
+    Later sets are added as the match reaches them.
 
     Args:
-        num_sets: Number of sets to create
         deciding_point: Whether deciding point rule is in effect
 
     Returns:
-        List of SetState objects initialized to 0-0
+        Tuple holding only the first set, at 0-0 (the shared ``NEW_SET``)
     """
-    sets = []
-    for _ in range(num_sets):
-        game = GameState(home_score=0, away_score=0, is_tiebreak=False)
-        set_state = SetState(home_score=0, away_score=0, current_game=game, games=[])
-        sets.append(set_state)
-    return sets
-
-
-def create_match_config(match_type: MatchType) -> MatchConfig:
+    return (NEW_SET,)
+
+
+# Scoring rules for every supported match type
+MATCH_RULES: dict[MatchType, ScoringRules] = {
+    MatchType.SINGLES_GRANDSLAM: ScoringRules(
+        best_of=5,
+        final_set_match_tiebreak=False,
+        match_tiebreak_points=10,
+        regular_tiebreak_points=7,
+        deciding_point=False,
+    ),
+    MatchType.SINGLES_ATP_FINALS: ScoringRules(
+        best_of=3,
+        final_set_match_tiebreak=False,
+        match_tiebreak_points=10,
+        regular_tiebreak_points=7,
+        deciding_point=False,
+    ),
+    MatchType.DOUBLES_DAVISCUP: ScoringRules(
+        best_of=3,
+        final_set_match_tiebreak=False,
+        match_tiebreak_points=10,
+        regular_tiebreak_points=7,
+        deciding_point=False,
+    ),
+    MatchType.DOUBLES_ATPTOUR: ScoringRules(
+        best_of=3,
+        final_set_match_tiebreak=True,
+        match_tiebreak_points=10,
+        regular_tiebreak_points=7,
+        deciding_point=True,
+    ),
+    MatchType.DOUBLES_GRANDSLAM: ScoringRules(
+        best_of=3,
+        final_set_match_tiebreak=True,
+        match_tiebreak_points=10,
+        regular_tiebreak_points=7,
+        deciding_point=False,
+    ),
+}
+
+
+def _build_match_config(match_type: MatchType, rules: ScoringRules) -> MatchConfig:
     """
-    Create a complete match configuration for a given match type.
+    Build the configuration and initial state for a match type.
 
     Args:
         match_type: Type of tennis match
+        rules: Scoring rules for the match type
 
     Returns:
         MatchConfig with rules and initial state
-
-    Raises:
-        ValueError: If match_type is not recognized
     """
-    if match_type == MatchType.SINGLES_GRANDSLAM:
-        rules = ScoringRules(
-            best_of=5,
-            final_set_match_tiebreak=False,
-            match_tiebreak_points=10,
-            regular_tiebreak_points=7,
-            deciding_point=False,
-        )
-        sets = _create_initial_sets(5, deciding_point=False)
-
-    elif match_type == MatchType.SINGLES_ATP_FINALS:
-        rules = ScoringRules(
-            best_of=3,
-            final_set_match_tiebreak=False,
-            match_tiebreak_points=10,
-            regular_tiebreak_points=7,
-            deciding_point=False,
-        )
-        sets = _create_initial_sets(3, deciding_point=False)
-
-    elif match_type == MatchType.DOUBLES_DAVISCUP:
-        rules = ScoringRules(
-            best_of=3,
-            final_set_match_tiebreak=False,
-            match_tiebreak_points=10,
-            regular_tiebreak_points=7,
-            deciding_point=False,
-        )
-        sets = _create_initial_sets(3, deciding_point=False)
-
-    elif match_type == MatchType.DOUBLES_ATPTOUR:
-        rules = ScoringRules(
-            best_of=3,
-            final_set_match_tiebreak=True,
-            match_tiebreak_points=10,
-            regular_tiebreak_points=7,
-            deciding_point=True,
-        )
-        sets = _create_initial_sets(3, deciding_point=True)
-
-    elif match_type == MatchType.DOUBLES_GRANDSLAM:
-        rules = ScoringRules(
-            best_of=3,
-            final_set_match_tiebreak=True,
-            match_tiebreak_points=10,
-            regular_tiebreak_points=7,
-            deciding_point=False,
-        )
-        sets = _create_initial_sets(3, deciding_point=False)
-
-    else:
-        raise ValueError(f"Unknown match type: {match_type}")
-
     initial_state = MatchState(
         home_score=0,
         away_score=0,
         current_set_index=0,
-        sets=sets,
+        sets=_create_initial_sets(deciding_point=rules.deciding_point),
         is_finished=False,
         match_type=match_type,
         rules=rules,
     )
 
     return MatchConfig(match_type=match_type, rules=rules, initial_state=initial_state)
+
+
+# Configurations are immutable, so one instance per match type is shared by all scorers
+MATCH_CONFIGS: dict[MatchType, MatchConfig] = {
+    match_type: _build_match_config(match_type, rules) for match_type, rules in MATCH_RULES.items()
+}
+
+
+def create_match_config(match_type: MatchType) -> MatchConfig:
+    """
+    Get the match configuration for a given match type.
+
+    Configurations are built once at import time and shared, so this is a
+    dictionary lookup.
+
+    Args:
+        match_type: Type of tennis match
+
+    Returns:
+        MatchConfig with rules and initial state
+
+    Raises:
+        ValueError: If match_type is not recognized
+    """
+    try:
+        return MATCH_CONFIGS[match_type]
+    except KeyError:
+        raise ValueError(f"Unknown match type: {match_type}") from None
@@ -1,6 +1,19 @@
 """Pure functions for formatting and parsing tennis scores."""
 
-from pytennisscorer.models import GameState, MatchState
+from typing import Optional
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import (
+    GameHistory,
+    GameState,
+    MatchState,
+    MatchType,
+    ScoringRules,
+    SetState,
+    intern_game,
+)
+from pytennisscorer.progression import check_match_complete, is_set_finished
+from pytennisscorer.scoring import is_game_finished
 
 # Mapping for displaying game points in tennis notation
 GAME_POINT_DISPLAY = {
@@ -11,6 +24,9 @@ GAME_POINT_DISPLAY = {
     4: "Ad",
 }
 
+# Reverse mapping for parsing game points in tennis notation
+GAME_POINT_PARSE = {display: points for points, display in GAME_POINT_DISPLAY.items()}
+
 
 def format_game_score(game: GameState) -> str:
     """
@@ -33,6 +49,19 @@ def format_game_score(game: GameState) -> str:
     return f"{home_display}:{away_display}"
 
 
+def format_set_score(set_state: SetState) -> str:
+    """
+    Format the games score of a set.
+
+    Args:
+        set_state: Set state
+
+    Returns:
+        Formatted set score string (e.g., "6:4")
+    """
+    return f"{set_state.home_score}:{set_state.away_score}"
+
+
 def format_match_score(match: MatchState) -> str:
     """
     Format a complete match score.
@@ -52,8 +81,7 @@ def format_match_score(match: MatchState) -> str:
         if i > match.current_set_index:
             break
 
-        set_score = f"{set_state.home_score}:{set_state.away_score}"
-        set_scores.append(set_score)
+        set_scores.append(format_set_score(set_state))
 
     # Join all set scores
     result = ";".join(set_scores)
@@ -65,3 +93,129 @@ def format_match_score(match: MatchState) -> str:
         result = f"{result}-{game_score}"
 
     return result
+
+
+def _parse_pair(text: str, score: str) -> tuple[str, str]:
+    """Split "home:away" into its two parts."""
+    parts = text.split(":")
+    if len(parts) != 2:
+        raise ValueError(f"Invalid score {score!r}: expected 'home:away', got {text!r}")
+    return parts[0], parts[1]
+
+
+def _parse_games(text: str, score: str) -> tuple[int, int]:
+    """Parse a numeric "home:away" pair."""
+    home, away = _parse_pair(text, score)
+    if not (home.isascii() and home.isdigit() and away.isascii() and away.isdigit()):
+        raise ValueError(f"Invalid score {score!r}: {text!r} is not numeric")
+    return int(home), int(away)
+
+
+def _is_reachable_set(set_state: SetState, rules: ScoringRules, is_final_set: bool) -> bool:
+    """Check whether a set score can occur (e.g. 7:3 and 8:6 cannot)."""
+    home, away = set_state.home_score, set_state.away_score
+    if max(home, away) > 7:
+        return False
+    # A finished set is reachable only from an unfinished score one game earlier
+    if home > away:
+        home -= 1
+    elif away > home:
+        away -= 1
+    return not is_set_finished(
+        SetState(home_score=home, away_score=away, current_game=set_state.current_game, games=()),
+        rules,
+        is_final_set,
+    )
+
+
+def parse_match_score(score: str, match_type: MatchType) -> MatchState:
+    """
+    Parse a score string produced by ``format_match_score`` into a match state.
+
+    The state is built directly from the score, without replaying points.
+    Per-game history is not part of a score string, so every set has an empty
+    ``games`` history.
+
+    Args:
+        score: Score string (e.g., "6:4;3:6;2:2-30:15", or "6:4;6:4" if finished)
+        match_type: Type of tennis match the score belongs to
+
+    Returns:
+        MatchState equal in score to the one the string was formatted from
+
+    Raises:
+        ValueError: If the string is malformed or the score cannot occur
+    """
+    initial = create_match_config(match_type).initial_state
+    rules = initial.rules
+
+    sets_text, separator, game_text = score.strip().partition("-")
+    set_texts = sets_text.split(";")
+    if len(set_texts) > rules.best_of:
+        raise ValueError(f"Invalid score {score!r}: more than {rules.best_of} sets")
+
+    sets: list[SetState] = []
+    home_sets = away_sets = 0
+    last = len(set_texts) - 1
+    for index, text in enumerate(set_texts):
+        home, away = _parse_games(text, score)
+        set_state = SetState(
+            home_score=home, away_score=away, current_game=initial.sets[0].current_game, games=()
+        )
+        is_final_set = index == rules.best_of - 1
+        finished = is_set_finished(set_state, rules, is_final_set)
+        if not _is_reachable_set(set_state, rules, is_final_set) or (index < last and not finished):
+            raise ValueError(f"Invalid score {score!r}: impossible set score {text!r}")
+        if check_match_complete(home_sets, away_sets, rules):
+            raise ValueError(f"Invalid score {score!r}: sets played after the match ended")
+        if finished:
+            home_sets += home > away
+            away_sets += away > home
+        sets.append(set_state)
+
+    current_set = sets[last]
+    is_finished = check_match_complete(home_sets, away_sets, rules)
+    current_game: Optional[GameState] = None
+    if separator:
+        if is_finished or is_set_finished(current_set, rules, last == rules.best_of - 1):
+            raise ValueError(f"Invalid score {score!r}: game score after a finished set")
+        current_game = _parse_game(game_text, current_set, score)
+        if is_game_finished(current_game, rules.deciding_point, rules.regular_tiebreak_points):
+            raise ValueError(f"Invalid score {score!r}: impossible game score {game_text!r}")
+    elif not is_finished:
+        raise ValueError(f"Invalid score {score!r}: missing game score of unfinished match")
+
+    if current_game is None:
+        current_game = initial.sets[0].current_game
+    sets[last] = SetState(
+        home_score=current_set.home_score,
+        away_score=current_set.away_score,
+        current_game=current_game,
+        games=GameHistory(),
+    )
+
+    return MatchState(
+        home_score=home_sets,
+        away_score=away_sets,
+        current_set_index=last,
+        sets=tuple(sets),
+        is_finished=is_finished,
+        match_type=match_type,
+        rules=rules,
+    )
+
+
+def _parse_game(text: str, set_state: SetState, score: str) -> GameState:
+    """Parse the current game score of a set ("30:15", "40:Ad", or "5:3" in a tiebreak)."""
+    if set_state.home_score == set_state.away_score == 6:
+        home, away = _parse_games(text, score)
+        return intern_game(home, away, True)
+
+    home_text, away_text = _parse_pair(text, score)
+    if home_text not in GAME_POINT_PARSE or away_text not in GAME_POINT_PARSE:
+        raise ValueError(f"Invalid score {score!r}: invalid game score {text!r}")
+    home, away = GAME_POINT_PARSE[home_text], GAME_POINT_PARSE[away_text]
+    # Advantage is only possible against 40
+    if max(home, away) == 4 and min(home, away) != 3:
+        raise ValueError(f"Invalid score {score!r}: impossible game score {text!r}")
+    return intern_game(home, away, False)
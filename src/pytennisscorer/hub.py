@@ -0,0 +1,221 @@
+"""Asyncio hub that scores many live matches and pushes score changes to subscribers."""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+from typing import Optional
+
+from pytennisscorer.models import MatchType
+from pytennisscorer.scorer import TennisScorer
+
+
+@dataclass(frozen=True)
+class PointEvent:
+    """A point won in a match, or the undo of the last point when ``undo`` is set."""
+
+    match_id: str
+    is_home: bool = False
+    undo: bool = False
+
+
+class Subscription:
+    """
+    Async iterator over the score changes of one match.
+
+    Each subscription holds only the latest unseen score, so publishing never
+    waits for a consumer: a slow consumer skips intermediate scores and
+    receives the most recent one when it next reads. Iteration ends when the
+    subscription is closed or the match is removed from the hub.
+    """
+
+    def __init__(self, hub: "ScoringHub", match_id: str, score: str) -> None:
+        self._hub = hub
+        self._match_id = match_id
+        self._latest: Optional[str] = score
+        self._closed = False
+        # Created by the first read that has to wait, so the event belongs to the running
+        # loop even when the subscription is made before the loop starts (Python 3.9)
+        self._ready: Optional[asyncio.Event] = None
+
+    def _publish(self, score: str) -> None:
+        """Replace the pending score with a newer one and wake the consumer."""
+        self._latest = score
+        if self._ready is not None:
+            self._ready.set()
+
+    def _end(self) -> None:
+        """End iteration once any pending score has been consumed."""
+        self._closed = True
+        if self._ready is not None:
+            self._ready.set()
+
+    def close(self) -> None:
+        """Stop receiving score changes."""
+        self._hub._unsubscribe(self._match_id, self)
+        self._end()
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self
+
+    async def __anext__(self) -> str:
+        while self._latest is None:
+            if self._closed:
+                raise StopAsyncIteration
+            if self._ready is None:
+                self._ready = asyncio.Event()
+            self._ready.clear()
+            await self._ready.wait()
+
+        score = self._latest
+        self._latest = None
+        return score
+
+
+class ScoringHub:
+    """
+    Scores many matches from a stream of point events in a single event loop.
+
+    Every change of a match's score is pushed to that match's subscriptions.
+    All methods must be called from the event loop thread; the hub needs no
+    locks because scoring happens between awaits.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty hub."""
+        self._scorers: dict[str, TennisScorer] = {}
+        self._subscriptions: dict[str, set[Subscription]] = {}
+
+    def __contains__(self, match_id: str) -> bool:
+        return match_id in self._scorers
+
+    def __len__(self) -> int:
+        return len(self._scorers)
+
+    def add_match(
+        self, match_id: str, match_type: MatchType, max_undo: Optional[int] = None
+    ) -> TennisScorer:
+        """
+        Start scoring a match.
+
+        Args:
+            match_id: Unique id of the match
+            match_type: Type of tennis match to score
+            max_undo: Maximum number of points that can be undone, or None for
+                unlimited
+
+        Returns:
+            The match's scorer
+
+        Raises:
+            ValueError: If a match with this id already exists
+        """
+        if match_id in self._scorers:
+            raise ValueError(f"Match {match_id!r} already exists")
+        scorer = TennisScorer(match_type, max_undo=max_undo)
+        self._scorers[match_id] = scorer
+        self._subscriptions[match_id] = set()
+        return scorer
+
+    def remove_match(self, match_id: str) -> None:
+        """
+        Stop scoring a match and end all of its subscriptions.
+
+        Args:
+            match_id: Id of the match
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        self._scorer(match_id)
+        del self._scorers[match_id]
+        for subscription in self._subscriptions.pop(match_id):
+            subscription._end()
+
+    def get_score(self, match_id: str) -> str:
+        """
+        Get the current score of a match.
+
+        Args:
+            match_id: Id of the match
+
+        Returns:
+            Score string, see ``TennisScorer.get_score``
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        return self._scorer(match_id).get_score()
+
+    def subscribe(self, match_id: str) -> Subscription:
+        """
+        Subscribe to the score changes of a match.
+
+        The first score yielded is the current one.
+
+        Args:
+            match_id: Id of the match
+
+        Returns:
+            Subscription yielding score strings
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        subscription = Subscription(self, match_id, self._scorer(match_id).get_score())
+        self._subscriptions[match_id].add(subscription)
+        return subscription
+
+    def _unsubscribe(self, match_id: str, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(match_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+
+    def _scorer(self, match_id: str) -> TennisScorer:
+        scorer = self._scorers.get(match_id)
+        if scorer is None:
+            raise ValueError(f"Unknown match {match_id!r}")
+        return scorer
+
+    def apply(self, event: PointEvent) -> str:
+        """
+        Apply a point event and notify subscribers if the score changed.
+
+        Args:
+            event: Point or undo event
+
+        Returns:
+            Score of the match after the event
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        scorer = self._scorer(event.match_id)
+        if event.undo:
+            changed = scorer.undo()
+        else:
+            changed = not scorer.state.is_finished
+            scorer.increase_score(event.is_home)
+
+        score = scorer.get_score()
+        if changed:
+            for subscription in self._subscriptions[event.match_id]:
+                subscription._publish(score)
+        return score
+
+    async def run(self, events: AsyncIterable[PointEvent]) -> None:
+        """
+        Apply events from an async source until it is exhausted.
+
+        Args:
+            events: Async iterable of point events, e.g. from a message queue
+
+        Raises:
+            ValueError: If an event refers to an unknown match
+        """
+        async for event in events:
+            self.apply(event)
+
+    def close(self) -> None:
+        """Remove every match, ending all subscriptions."""
+        for match_id in list(self._scorers):
+            self.remove_match(match_id)
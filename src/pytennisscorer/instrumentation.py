@@ -0,0 +1,105 @@
+"""Opt-in counters and per-stage timing for scorers."""
+
+from dataclasses import dataclass
+from time import perf_counter_ns
+
+# Stages timed when timing is enabled
+POINT_STAGE = "point"
+GAME_CHECK_STAGE = "game_check"
+PROGRESSION_STAGE = "progression"
+FORMAT_STAGE = "format"
+STAGES = (POINT_STAGE, GAME_CHECK_STAGE, PROGRESSION_STAGE, FORMAT_STAGE)
+
+
+@dataclass(frozen=True)
+class StatsSnapshot:
+    """Point-in-time copy of a ``ScoringStats`` collector."""
+
+    points: int
+    games: int
+    sets: int
+    tiebreaks: int
+    undos: int
+    stage_ns: dict[str, int]
+    stage_calls: dict[str, int]
+
+
+def _no_clock() -> int:
+    return 0
+
+
+class ScoringStats:
+    """
+    Mutable counters, and optionally nanosecond stage timings, for scorers.
+
+    Pass a collector to ``TennisScorer(..., stats=...)`` to enable
+    instrumentation; several scorers may share one collector. Scorers without
+    a collector skip instrumentation entirely. Stages are scoring the point
+    (``point``), checking whether the game ended (``game_check``), progressing
+    the set and match after a game (``progression``) and formatting the score
+    (``format``). Collectors are not thread-safe.
+    """
+
+    __slots__ = (
+        "points",
+        "games",
+        "sets",
+        "tiebreaks",
+        "undos",
+        "clock",
+        "_stage_ns",
+        "_stage_calls",
+    )
+
+    def __init__(self, timing: bool = False) -> None:
+        """
+        Initialize a collector with all counters at zero.
+
+        Args:
+            timing: Whether to record nanosecond timings per stage
+        """
+        self.clock = perf_counter_ns if timing else _no_clock
+        self.reset()
+
+    @property
+    def timing(self) -> bool:
+        """Whether stage timings are recorded."""
+        return self.clock is not _no_clock
+
+    def reset(self) -> None:
+        """Reset all counters and timings to zero."""
+        self.points = 0
+        self.games = 0
+        self.sets = 0
+        self.tiebreaks = 0
+        self.undos = 0
+        self._stage_ns = dict.fromkeys(STAGES, 0)
+        self._stage_calls = dict.fromkeys(STAGES, 0)
+
+    def add_time(self, stage: str, elapsed_ns: int) -> None:
+        """
+        Record one timed call of a stage.
+
+        Args:
+            stage: One of ``STAGES``
+            elapsed_ns: Time spent in the stage
+        """
+        self._stage_ns[stage] += elapsed_ns
+        self._stage_calls[stage] += 1
+
+    def snapshot(self) -> StatsSnapshot:
+        """
+        Copy the current counters and timings.
+
+        Returns:
+            StatsSnapshot; stage timings are zero unless timing is enabled
+        """
+        return StatsSnapshot(
+            points=self.points,
+            games=self.games,
+            sets=self.sets,
+            tiebreaks=self.tiebreaks,
+            undos=self.undos,
+            stage_ns=dict(self._stage_ns),
+            stage_calls=dict(self._stage_calls),
+        )
@@ -0,0 +1,179 @@
+"""Incremental match statistics maintained point by point."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from pytennisscorer.models import MatchState
+
+# Per-player counters; the home count is at the index and the away count at index + 1
+_POINTS = 0
+_GAMES = 2
+_TIEBREAKS = 4
+_HOLDS = 6
+_BREAKS = 8
+_DECIDING_POINTS = 10
+_LONGEST_STREAK = 12
+# Match counters
+_TIEBREAKS_PLAYED = 14
+_DEUCE_GAMES = 15
+_DECIDING_POINTS_PLAYED = 16
+_GAMES_PLAYED = 17
+# Length of the current run of points, positive for home and negative for away
+_STREAK = 18
+_NUM_COUNTERS = 19
+
+
+@dataclass(frozen=True)
+class PlayerMatchStats:
+    """Statistics of one player."""
+
+    points_won: int
+    games_won: int
+    tiebreaks_won: int
+    service_games_held: int
+    breaks_of_serve: int
+    deciding_points_won: int
+    longest_point_streak: int
+
+
+@dataclass(frozen=True)
+class MatchStats:
+    """Point-in-time copy of a ``MatchStatsTracker``."""
+
+    home: PlayerMatchStats
+    away: PlayerMatchStats
+    tiebreaks_played: int
+    deuce_games: int
+    deciding_points_played: int
+
+
+class MatchStatsTracker:
+    """
+    Match statistics updated in O(1) per point.
+
+    Pass a tracker to ``TennisScorer(..., tracker=...)``; the scorer records
+    every point and keeps the statistics consistent under ``undo``, ``redo``
+    and ``seek`` by restoring them from the same checkpoints as the match
+    state. Holds and breaks are counted only when the first server is known;
+    serve alternates every game, with a tiebreak counting as one game.
+    """
+
+    __slots__ = ("_home_serves_first", "_counts", "_checkpoints", "_attached")
+
+    def __init__(self, home_serves_first: Optional[bool] = None) -> None:
+        """
+        Initialize a tracker with all statistics at zero.
+
+        Args:
+            home_serves_first: Whether home serves the first game, or None if
+                unknown, in which case holds and breaks stay at zero
+        """
+        self._home_serves_first = home_serves_first
+        self._counts = [0] * _NUM_COUNTERS
+        # _checkpoints[k] holds the counts at the scorer's k-th state checkpoint
+        self._checkpoints: list[list[int]] = []
+        self._attached = False
+
+    @property
+    def home_serving(self) -> Optional[bool]:
+        """Whether home serves the current game, or None if the first server is unknown."""
+        if self._home_serves_first is None:
+            return None
+        return self._home_serves_first == (self._counts[_GAMES_PLAYED] % 2 == 0)
+
+    def record_point(self, before: MatchState, after: MatchState, is_home: bool) -> None:
+        """
+        Update the statistics for one point.
+
+        Args:
+            before: Match state before the point
+            after: Match state after the point
+            is_home: True if home won the point, False if away won it
+        """
+        counts = self._counts
+        side = 0 if is_home else 1
+        game = before.sets[before.current_set_index].current_game
+        new_game = after.sets[after.current_set_index].current_game
+
+        counts[_POINTS + side] += 1
+        streak = counts[_STREAK]
+        if is_home:
+            streak = streak + 1 if streak > 0 else 1
+        else:
+            streak = streak - 1 if streak < 0 else -1
+        counts[_STREAK] = streak
+        if abs(streak) > counts[_LONGEST_STREAK + side]:
+            counts[_LONGEST_STREAK + side] = abs(streak)
+
+        if not game.is_tiebreak:
+            home, away = game.home_score, game.away_score
+            if home == away == 3:
+                if before.rules.deciding_point:
+                    counts[_DECIDING_POINTS_PLAYED] += 1
+                    counts[_DECIDING_POINTS + side] += 1
+            # 40-30 or 30-40 won by the trailing player is the first deuce of the game
+            elif home + away == 5 and min(home, away) == 2 and (home < away) == is_home:
+                counts[_DEUCE_GAMES] += 1
+
+        # A finished game is always followed by a new game at 0-0
+        if new_game.home_score + new_game.away_score == 0:
+            counts[_GAMES + side] += 1
+            if game.is_tiebreak:
+                counts[_TIEBREAKS_PLAYED] += 1
+                counts[_TIEBREAKS + side] += 1
+            else:
+                home_serving = self.home_serving
+                if home_serving is not None:
+                    counts[(_HOLDS if home_serving == is_home else _BREAKS) + side] += 1
+            counts[_GAMES_PLAYED] += 1
+
+    def snapshot(self) -> MatchStats:
+        """
+        Copy the current statistics.
+
+        Returns:
+            MatchStats for both players and the match
+        """
+        counts = self._counts
+        home, away = (
+            PlayerMatchStats(
+                points_won=counts[_POINTS + side],
+                games_won=counts[_GAMES + side],
+                tiebreaks_won=counts[_TIEBREAKS + side],
+                service_games_held=counts[_HOLDS + side],
+                breaks_of_serve=counts[_BREAKS + side],
+                deciding_points_won=counts[_DECIDING_POINTS + side],
+                longest_point_streak=counts[_LONGEST_STREAK + side],
+            )
+            for side in (0, 1)
+        )
+        return MatchStats(
+            home=home,
+            away=away,
+            tiebreaks_played=counts[_TIEBREAKS_PLAYED],
+            deuce_games=counts[_DEUCE_GAMES],
+            deciding_points_played=counts[_DECIDING_POINTS_PLAYED],
+        )
+
+    def _attach(self) -> None:
+        """Claim the tracker for one scorer and store its initial checkpoint."""
+        if self._attached:
+            raise ValueError("MatchStatsTracker is already attached to a scorer")
+        self._attached = True
+        self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        """Store the current counts alongside a new scorer checkpoint."""
+        self._checkpoints.append(list(self._counts))
+
+    def _restore_checkpoint(self, index: int) -> None:
+        """Reset the counts to those stored with a scorer checkpoint."""
+        self._counts = list(self._checkpoints[index])
+
+    def _truncate_checkpoints(self, count: int) -> None:
+        """Keep only the first count checkpoints."""
+        del self._checkpoints[count:]
+
+    def _drop_first_checkpoint(self) -> None:
+        """Drop the oldest checkpoint once the scorer trims its log."""
+        del self._checkpoints[0]
@@ -1,7 +1,10 @@
 """Core data models for tennis scoring."""
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
+from typing import Any, Optional, Union, overload
 
 
 class MatchType(str, Enum):
@@ -14,10 +17,32 @@ class MatchType(str, Enum):
     DOUBLES_GRANDSLAM = "DOUBLES_GRANDSLAM"
 
 
+class _FrozenSlots:
+    """
+    Pickle support for frozen dataclasses that define ``__slots__``.
+
+    Slotted instances have no ``__dict__``, and the default slot-state restore
+    assigns attributes one by one, which frozen dataclasses reject.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), tuple(getattr(self, field.name) for field in fields(self)))  # type: ignore[arg-type]
+
+
 @dataclass(frozen=True)
-class ScoringRules:
+class ScoringRules(_FrozenSlots):
     """Immutable scoring rules for a tennis match."""
 
+    __slots__ = (
+        "best_of",
+        "final_set_match_tiebreak",
+        "match_tiebreak_points",
+        "regular_tiebreak_points",
+        "deciding_point",
+    )
+
     best_of: int
     final_set_match_tiebreak: bool
     match_tiebreak_points: int
@@ -26,32 +51,226 @@ class ScoringRules:
 
 
 @dataclass(frozen=True)
-class GameState:
+class GameState(_FrozenSlots):
     """Immutable state for a single game within a set."""
 
+    __slots__ = ("home_score", "away_score", "is_tiebreak")
+
     home_score: int
     away_score: int
     is_tiebreak: bool
 
+    def __eq__(self, other: object) -> bool:
+        # Interned games compare by identity; other instances fall back to their fields
+        if self is other:
+            return True
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return (
+            self.home_score == other.home_score
+            and self.away_score == other.away_score
+            and self.is_tiebreak == other.is_tiebreak
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (intern_game, (self.home_score, self.away_score, self.is_tiebreak))
+
+
+# Maximum number of distinct tiebreak games kept interned beyond the preallocated table;
+# least recently used scores are evicted
+TIEBREAK_CACHE_SIZE = 128
+
+# Tiebreak scores up to this many points per side are preallocated and never evicted
+_TIEBREAK_TABLE_POINTS = 12
+
+# Canonical instances of every regular game score (0-4 points per side) and of early
+# tiebreak scores, keyed by (home_score, away_score, is_tiebreak)
+_GAMES: dict[tuple[int, int, bool], GameState] = {
+    **{(home, away, False): GameState(home, away, False) for home in range(5) for away in range(5)},
+    **{
+        (home, away, True): GameState(home, away, True)
+        for home in range(_TIEBREAK_TABLE_POINTS + 1)
+        for away in range(_TIEBREAK_TABLE_POINTS + 1)
+    },
+}
+
+
+@lru_cache(maxsize=TIEBREAK_CACHE_SIZE)
+def _intern_long_game(home_score: int, away_score: int, is_tiebreak: bool) -> GameState:
+    """Intern a game score outside the preallocated table."""
+    return GameState(home_score=home_score, away_score=away_score, is_tiebreak=is_tiebreak)
+
+
+def intern_game(home_score: int, away_score: int, is_tiebreak: bool) -> GameState:
+    """
+    Get the canonical shared instance of a game score.
+
+    Regular game scores and early tiebreak scores come from a preallocated
+    table, so scoring a point allocates no new GameState. Long tiebreak
+    scores are kept in a bounded least-recently-used cache.
+
+    Args:
+        home_score: Internal home score
+        away_score: Internal away score
+        is_tiebreak: Whether the game is a tiebreak
+
+    Returns:
+        Shared, immutable GameState equal to
+        ``GameState(home_score, away_score, is_tiebreak)``
+    """
+    game = _GAMES.get((home_score, away_score, is_tiebreak))
+    if game is None:
+        game = _intern_long_game(home_score, away_score, is_tiebreak)
+    return game
+
+
+class GameHistory(Sequence[GameState]):
+    """
+    Persistent, structurally shared sequence of finished games.
+
+    ``append`` returns a new history in O(1) that shares every earlier game
+    with the original, so progressing through a long set never copies the
+    games played so far. Reading the last game is O(1); any other index or
+    slice builds a tuple of the whole history, O(n), so loops over the games
+    should iterate rather than index.
+    """
+
+    __slots__ = ("_last", "_previous", "_length")
+
+    _last: Optional[GameState]
+    _previous: Optional["GameHistory"]
+    _length: int
+
+    def __init__(self, games: Iterable[GameState] = ()) -> None:
+        """
+        Create a history containing the given games.
+
+        Args:
+            games: Finished games in the order they were played
+        """
+        self._last = None
+        self._previous = None
+        self._length = 0
+        for game in games:
+            self._previous = GameHistory._from_parts(self._last, self._previous, self._length)
+            self._last = game
+            self._length += 1
+
+    @staticmethod
+    def _from_parts(
+        last: Optional[GameState], previous: Optional["GameHistory"], length: int
+    ) -> "GameHistory":
+        """Create a history node without copying."""
+        history = GameHistory.__new__(GameHistory)
+        history._last = last
+        history._previous = previous
+        history._length = length
+        return history
+
+    def append(self, game: GameState) -> "GameHistory":
+        """
+        Return a new history with a game added at the end.
+
+        Args:
+            game: Finished game to add
+
+        Returns:
+            New GameHistory sharing all existing games
+        """
+        return GameHistory._from_parts(game, self, self._length + 1)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[GameState]:
+        games: list[GameState] = []
+        node: Optional[GameHistory] = self
+        while node is not None and node._last is not None:
+            games.append(node._last)
+            node = node._previous
+        return reversed(games)
+
+    @overload
+    def __getitem__(self, index: int) -> GameState: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[GameState]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[GameState, Sequence[GameState]]:
+        if (index == -1 or index == self._length - 1) and self._last is not None:
+            return self._last
+        return tuple(self)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (GameHistory, list, tuple)):
+            return len(self) == len(other) and (self is other or tuple(self) == tuple(other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"GameHistory({list(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle and copy as a flat tuple; the default slot state nests one level per game
+        return (GameHistory, (tuple(self),))
+
 
 @dataclass(frozen=True)
-class SetState:
+class SetState(_FrozenSlots):
     """Immutable state for a set within a match."""
 
+    __slots__ = ("home_score", "away_score", "current_game", "games")
+
     home_score: int
     away_score: int
     current_game: GameState
-    games: list[GameState]
+    games: Sequence[GameState]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.games, GameHistory):
+            object.__setattr__(self, "games", GameHistory(self.games))
+
+
+# Shared state of every set before its first point; sets never change in place, so all
+# matches start their sets from this one instance
+NEW_SET = SetState(
+    home_score=0,
+    away_score=0,
+    current_game=intern_game(0, 0, False),
+    games=GameHistory(),
+)
 
 
 @dataclass(frozen=True)
-class MatchState:
-    """Immutable state for a complete tennis match."""
+class MatchState(_FrozenSlots):
+    """
+    Immutable state for a complete tennis match.
+
+    ``sets`` holds the finished sets followed by the current set; the next
+    set is added when the current one ends, so a match that ends in three
+    sets never allocates a fourth.
+    """
+
+    __slots__ = (
+        "home_score",
+        "away_score",
+        "current_set_index",
+        "sets",
+        "is_finished",
+        "match_type",
+        "rules",
+    )
 
     home_score: int
     away_score: int
     current_set_index: int
-    sets: list[SetState]
+    sets: Sequence[SetState]
     is_finished: bool
     match_type: MatchType
     rules: ScoringRules
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.sets, tuple):
+            object.__setattr__(self, "sets", tuple(self.sets))
@@ -0,0 +1,150 @@
+"""Compact, lossless byte encoding of match states."""
+
+from typing import Union
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import (
+    GameHistory,
+    GameState,
+    MatchState,
+    MatchType,
+    SetState,
+    intern_game,
+)
+
+_MATCH_TYPES = list(MatchType)
+
+# Any buffer of packed bytes, e.g. a memoryview over a slice of an mmap
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Append a non-negative integer as an unsigned LEB128 varint."""
+    if value < 0:
+        raise ValueError(f"Cannot pack negative value {value}")
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: Buffer, pos: int) -> tuple[int, int]:
+    """Read an unsigned LEB128 varint, returning (value, next position)."""
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated packed match state")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _write_game(out: bytearray, game: GameState) -> None:
+    """Append a game as two varints, with the tiebreak flag in the low bit of the first."""
+    _write_varint(out, game.home_score << 1 | game.is_tiebreak)
+    _write_varint(out, game.away_score)
+
+
+def _read_game(data: Buffer, pos: int) -> tuple[GameState, int]:
+    """Read a game written by ``_write_game``."""
+    home, pos = _read_varint(data, pos)
+    away, pos = _read_varint(data, pos)
+    return intern_game(home >> 1, away, bool(home & 1)), pos
+
+
+def pack_match_state(match: MatchState) -> bytes:
+    """
+    Encode a match state as a compact byte string.
+
+    Every integer is stored as a varint, so a typical state takes one byte per
+    score plus two bytes per finished game. The rules are not stored; they are
+    restored from the match type.
+
+    Args:
+        match: Match state to encode
+
+    Returns:
+        Packed bytes that ``unpack_match_state`` turns back into an equal state
+
+    Raises:
+        ValueError: If the state's rules differ from those of its match type
+    """
+    if match.rules != create_match_config(match.match_type).rules:
+        raise ValueError(f"Rules of {match.match_type.value} state differ from its match type")
+
+    out = bytearray()
+    _write_varint(out, _MATCH_TYPES.index(match.match_type) << 1 | match.is_finished)
+    _write_varint(out, match.home_score)
+    _write_varint(out, match.away_score)
+    _write_varint(out, match.current_set_index)
+    _write_varint(out, len(match.sets))
+
+    for set_state in match.sets:
+        _write_varint(out, set_state.home_score)
+        _write_varint(out, set_state.away_score)
+        _write_game(out, set_state.current_game)
+        _write_varint(out, len(set_state.games))
+        for game in set_state.games:
+            _write_game(out, game)
+
+    return bytes(out)
+
+
+def unpack_match_state(data: Buffer) -> MatchState:
+    """
+    Decode a match state packed by ``pack_match_state``.
+
+    Args:
+        data: Packed bytes, or any buffer over them
+
+    Returns:
+        MatchState equal to the one that was packed
+
+    Raises:
+        ValueError: If the data is truncated or malformed
+    """
+    header, pos = _read_varint(data, 0)
+    if header >> 1 >= len(_MATCH_TYPES):
+        raise ValueError(f"Unknown match type index {header >> 1}")
+    match_type = _MATCH_TYPES[header >> 1]
+
+    home_score, pos = _read_varint(data, pos)
+    away_score, pos = _read_varint(data, pos)
+    current_set_index, pos = _read_varint(data, pos)
+    num_sets, pos = _read_varint(data, pos)
+
+    sets = []
+    for _ in range(num_sets):
+        set_home, pos = _read_varint(data, pos)
+        set_away, pos = _read_varint(data, pos)
+        current_game, pos = _read_game(data, pos)
+        num_games, pos = _read_varint(data, pos)
+        games = GameHistory()
+        for _ in range(num_games):
+            game, pos = _read_game(data, pos)
+            games = games.append(game)
+        sets.append(
+            SetState(
+                home_score=set_home,
+                away_score=set_away,
+                current_game=current_game,
+                games=games,
+            )
+        )
+
+    if pos != len(data):
+        raise ValueError(f"Unexpected {len(data) - pos} trailing bytes in packed match state")
+
+    return MatchState(
+        home_score=home_score,
+        away_score=away_score,
+        current_set_index=current_set_index,
+        sets=tuple(sets),
+        is_finished=bool(header & 1),
+        match_type=match_type,
+        rules=create_match_config(match_type).rules,
+    )
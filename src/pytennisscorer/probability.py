@@ -0,0 +1,285 @@
+"""Exact win probabilities via memoized dynamic programming."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Union
+
+from pytennisscorer.models import NEW_SET, GameState, MatchState, ScoringRules, SetState
+from pytennisscorer.progression import check_match_complete, is_set_finished, progress_to_next_game
+from pytennisscorer.scorer import TennisScorer
+from pytennisscorer.scoring import is_game_finished, score_game_point, score_tiebreak_point
+
+# Maximum number of (rules, probabilities) models kept; least recently used are evicted
+MODEL_CACHE_SIZE = 256
+
+# Probabilities of the four ways a set can end, indexed by _outcome_index
+_Outcomes = tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class WinProbabilities:
+    """Probabilities that the home player wins the current game, set and match."""
+
+    game: float
+    set: float
+    match: float
+
+
+def _validate_probability(name: str, value: float) -> None:
+    """Raise ValueError unless value is a probability."""
+    if not 0.0 <= value <= 1.0:
+        raise ValueError(f"{name} must be between 0 and 1, got {value}")
+
+
+def _outcome_index(home_won_set: bool, home_serves_next: bool) -> int:
+    """Index into set outcomes: who won the set and who serves the next game."""
+    return (0 if home_won_set else 2) + (0 if home_serves_next else 1)
+
+
+def _tiebreak_home_serves(points_played: int, home_served_first: bool) -> bool:
+    """Whether home serves the next tiebreak point (serve changes every two points)."""
+    return home_served_first != ((points_played + 1) // 2 % 2 == 1)
+
+
+class ProbabilityModel:
+    """
+    Exact win probabilities for one set of rules and point-win probabilities.
+
+    Game, tiebreak, set and match probabilities are memoized per state, so
+    every evaluation after the first touches only a handful of cached values.
+    Transitions use the functions in ``scoring`` and ``progression``, so the
+    model follows the same rules as ``TennisScorer``. Endless deuce and
+    tiebreak loops are resolved in closed form.
+    """
+
+    def __init__(self, rules: ScoringRules, home_serve_win: float, away_serve_win: float) -> None:
+        """
+        Initialize a model.
+
+        Args:
+            rules: Scoring rules for the match
+            home_serve_win: Probability that home wins a point on home serve
+            away_serve_win: Probability that away wins a point on away serve
+        """
+        self.rules = rules
+        self.home_serve_win = home_serve_win
+        self.away_serve_win = away_serve_win
+        self._games: dict[tuple[int, int, bool, bool], float] = {}
+        self._sets: dict[tuple[int, int, bool, bool, bool], _Outcomes] = {}
+        self._matches: dict[tuple[int, int, bool], float] = {}
+
+    def _point(self, home_serves: bool) -> float:
+        """Probability that home wins the next point."""
+        return self.home_serve_win if home_serves else 1.0 - self.away_serve_win
+
+    def game(self, game: GameState, home_serves: bool) -> float:
+        """
+        Probability that home wins a game from the given score.
+
+        Args:
+            game: Current game state
+            home_serves: Whether home serves the game (for a tiebreak, whether
+                home served its first point)
+
+        Returns:
+            Probability that home wins the game
+        """
+        key = (game.home_score, game.away_score, game.is_tiebreak, home_serves)
+        cached = self._games.get(key)
+        if cached is not None:
+            return cached
+
+        if game.is_tiebreak:
+            result = self._tiebreak(game, home_serves)
+        else:
+            result = self._regular_game(game, home_serves)
+        self._games[key] = result
+        return result
+
+    def _regular_game(self, game: GameState, home_serves: bool) -> float:
+        deciding_point = self.rules.deciding_point
+        if is_game_finished(game, deciding_point):
+            return 1.0 if game.home_score > game.away_score else 0.0
+
+        p = self._point(home_serves)
+        if not deciding_point and game.home_score == game.away_score == 3:
+            # Deuce: first to win two points in a row
+            return p * p / (p * p + (1 - p) * (1 - p))
+
+        won = score_game_point(game, is_home=True, deciding_point=deciding_point)
+        lost = score_game_point(game, is_home=False, deciding_point=deciding_point)
+        return p * self.game(won, home_serves) + (1 - p) * self.game(lost, home_serves)
+
+    def _tiebreak(self, game: GameState, home_served_first: bool) -> float:
+        tiebreak_points = self.rules.regular_tiebreak_points
+        if is_game_finished(game, deciding_point=False, tiebreak_points=tiebreak_points):
+            return 1.0 if game.home_score > game.away_score else 0.0
+
+        played = game.home_score + game.away_score
+        p = self._point(_tiebreak_home_serves(played, home_served_first))
+        if game.home_score == game.away_score >= tiebreak_points - 1:
+            # Tied late in the tiebreak: the next two points are served one each,
+            # and the tie repeats unless one player wins both
+            q = self._point(_tiebreak_home_serves(played + 1, home_served_first))
+            both = p * q
+            neither = (1 - p) * (1 - q)
+            return both / (both + neither) if both + neither else 0.5
+
+        won = score_tiebreak_point(game, is_home=True, tiebreak_points=tiebreak_points)
+        lost = score_tiebreak_point(game, is_home=False, tiebreak_points=tiebreak_points)
+        return p * self.game(won, home_served_first) + (1 - p) * self.game(lost, home_served_first)
+
+    def _after_game(
+        self, set_state: SetState, home_won_game: bool, home_served: bool, is_final_set: bool
+    ) -> _Outcomes:
+        """Set outcomes once the current game of set_state has been decided."""
+        new_set = progress_to_next_game(
+            set_state, home_won_game, deciding_point=self.rules.deciding_point
+        )
+        home_serves_next = not home_served
+        if is_set_finished(new_set, self.rules, is_final_set):
+            outcomes = [0.0, 0.0, 0.0, 0.0]
+            home_won_set = new_set.home_score > new_set.away_score
+            outcomes[_outcome_index(home_won_set, home_serves_next)] = 1.0
+            return outcomes[0], outcomes[1], outcomes[2], outcomes[3]
+
+        return self._set_from_game_start(new_set, home_serves_next, is_final_set)
+
+    def _set_outcomes(
+        self, set_state: SetState, home_serves: bool, is_final_set: bool
+    ) -> _Outcomes:
+        """Set outcomes from a set with a game in progress."""
+        p = self.game(set_state.current_game, home_serves)
+        won = self._after_game(set_state, True, home_serves, is_final_set)
+        lost = self._after_game(set_state, False, home_serves, is_final_set)
+        return (
+            p * won[0] + (1 - p) * lost[0],
+            p * won[1] + (1 - p) * lost[1],
+            p * won[2] + (1 - p) * lost[2],
+            p * won[3] + (1 - p) * lost[3],
+        )
+
+    def _set_from_game_start(
+        self, set_state: SetState, home_serves: bool, is_final_set: bool
+    ) -> _Outcomes:
+        """Memoized set outcomes at the start of a game."""
+        key = (
+            set_state.home_score,
+            set_state.away_score,
+            set_state.current_game.is_tiebreak,
+            home_serves,
+            is_final_set,
+        )
+        cached = self._sets.get(key)
+        if cached is None:
+            cached = self._set_outcomes(set_state, home_serves, is_final_set)
+            self._sets[key] = cached
+        return cached
+
+    def _match_from_outcomes(self, outcomes: _Outcomes, home_sets: int, away_sets: int) -> float:
+        """Match probability after the current set ends with the given outcomes."""
+        total = 0.0
+        for home_won_set in (True, False):
+            for home_serves_next in (True, False):
+                weight = outcomes[_outcome_index(home_won_set, home_serves_next)]
+                if weight:
+                    total += weight * self._match_from_set_start(
+                        home_sets + (1 if home_won_set else 0),
+                        away_sets + (0 if home_won_set else 1),
+                        home_serves_next,
+                    )
+        return total
+
+    def _match_from_set_start(self, home_sets: int, away_sets: int, home_serves: bool) -> float:
+        """Memoized match probability at the start of a set."""
+        if check_match_complete(home_sets, away_sets, self.rules):
+            return 1.0 if home_sets > away_sets else 0.0
+
+        key = (home_sets, away_sets, home_serves)
+        cached = self._matches.get(key)
+        if cached is None:
+            is_final_set = home_sets + away_sets == self.rules.best_of - 1
+            outcomes = self._set_from_game_start(NEW_SET, home_serves, is_final_set)
+            cached = self._match_from_outcomes(outcomes, home_sets, away_sets)
+            self._matches[key] = cached
+        return cached
+
+    def evaluate(self, match: MatchState, home_serving: bool) -> WinProbabilities:
+        """
+        Compute exact win probabilities from a match state.
+
+        Args:
+            match: Current match state
+            home_serving: Whether home serves the current game (for a tiebreak
+                in progress, whether home served its first point)
+
+        Returns:
+            WinProbabilities for the home player
+        """
+        if match.is_finished:
+            won = float(match.home_score > match.away_score)
+            return WinProbabilities(game=won, set=won, match=won)
+
+        set_state = match.sets[match.current_set_index]
+        is_final_set = match.current_set_index == match.rules.best_of - 1
+        outcomes = self._set_outcomes(set_state, home_serving, is_final_set)
+
+        return WinProbabilities(
+            game=self.game(set_state.current_game, home_serving),
+            set=outcomes[0] + outcomes[1],
+            match=self._match_from_outcomes(outcomes, match.home_score, match.away_score),
+        )
+
+
+@lru_cache(maxsize=MODEL_CACHE_SIZE)
+def get_probability_model(
+    rules: ScoringRules, home_serve_win: float, away_serve_win: float
+) -> ProbabilityModel:
+    """
+    Get the shared model for a set of rules and point-win probabilities.
+
+    Models are kept in an LRU cache of ``MODEL_CACHE_SIZE`` entries, so all
+    matches priced with the same rules and probabilities share memo tables
+    while memory stays bounded.
+
+    Args:
+        rules: Scoring rules for the match
+        home_serve_win: Probability that home wins a point on home serve
+        away_serve_win: Probability that away wins a point on away serve
+
+    Returns:
+        Shared ProbabilityModel
+
+    Raises:
+        ValueError: If a probability is outside [0, 1]
+    """
+    _validate_probability("home_serve_win", home_serve_win)
+    _validate_probability("away_serve_win", away_serve_win)
+    return ProbabilityModel(rules, home_serve_win, away_serve_win)
+
+
+def exact_win_probabilities(
+    match: Union[MatchState, TennisScorer],
+    home_serve_win: float,
+    away_serve_win: float,
+    home_serving: bool,
+) -> WinProbabilities:
+    """
+    Compute exact win probabilities from a match state or live scorer.
+
+    Args:
+        match: Current match state, or a live scorer
+        home_serve_win: Probability that home wins a point on home serve
+        away_serve_win: Probability that away wins a point on away serve
+        home_serving: Whether home serves the current game (for a tiebreak in
+            progress, whether home served its first point)
+
+    Returns:
+        WinProbabilities for the home player
+
+    Raises:
+        ValueError: If a probability is outside [0, 1]
+    """
+    state = match.state if isinstance(match, TennisScorer) else match
+    model = get_probability_model(state.rules, home_serve_win, away_serve_win)
+    return model.evaluate(state, home_serving)
@@ -1,8 +1,19 @@
 """Pure functions for set and match progression logic."""
 
+from collections.abc import Sequence
+from dataclasses import replace
 from typing import Literal, Optional
 
-from pytennisscorer.models import GameState, MatchState, ScoringRules, SetState
+from pytennisscorer.models import (
+    NEW_SET,
+    GameHistory,
+    GameState,
+    MatchState,
+    ScoringRules,
+    SetState,
+    intern_game,
+)
+from pytennisscorer.scoring import is_game_finished, score_game_point, score_tiebreak_point
 
 
 def is_set_finished(set_state: SetState, rules: ScoringRules, is_final_set: bool) -> bool:
@@ -54,10 +65,13 @@ def progress_to_next_game(
     is_tiebreak = new_home_score == 6 and new_away_score == 6
 
     # Create new game
-    new_game = GameState(home_score=0, away_score=0, is_tiebreak=is_tiebreak)
+    new_game = intern_game(0, 0, is_tiebreak)
 
-    # Add current game to games history
-    new_games = list(set_state.games) + [set_state.current_game]
+    # Add current game to games history (shares all earlier games)
+    games = set_state.games
+    if not isinstance(games, GameHistory):
+        games = GameHistory(games)
+    new_games = games.append(set_state.current_game)
 
     return SetState(
         home_score=new_home_score,
@@ -75,10 +89,9 @@ def progress_to_next_set(deciding_point: bool) -> SetState:
         deciding_point: Whether deciding point rule is in effect
 
     Returns:
-        New SetState at 0-0
+        Shared SetState at 0-0 (``NEW_SET``)
     """
-    new_game = GameState(home_score=0, away_score=0, is_tiebreak=False)
-    return SetState(home_score=0, away_score=0, current_game=new_game, games=[])
+    return NEW_SET
 
 
 def check_match_complete(home_sets_won: int, away_sets_won: int, rules: ScoringRules) -> bool:
@@ -115,3 +128,116 @@ def get_match_winner(match: MatchState) -> Optional[Literal["home", "away"]]:
     if match.home_score > match.away_score:
         return "home"
     return "away"
+
+
+def _replace_set(sets: Sequence[SetState], index: int, set_state: SetState) -> tuple[SetState, ...]:
+    """
+    Return a new sets tuple with one set replaced, sharing all other sets.
+
+    An index equal to ``len(sets)`` appends the set instead.
+    """
+    return (*sets[:index], set_state, *sets[index + 1 :])
+
+
+def replace_current_game(match: MatchState, game: GameState) -> MatchState:
+    """
+    Replace the game in progress of a match.
+
+    Args:
+        match: Current match state
+        game: New state of the current game
+
+    Returns:
+        New MatchState, or match itself if game is already its current game
+    """
+    index = match.current_set_index
+    current_set = match.sets[index]
+    if current_set.current_game is game:
+        return match
+    new_set = replace(current_set, current_game=game)
+    return replace(match, sets=_replace_set(match.sets, index, new_set))
+
+
+def score_match_point(match: MatchState, is_home: bool) -> MatchState:
+    """
+    Score a point in a match and return new match state.
+
+    Applies the point to the current game and progresses to the next game,
+    set and match as required. A finished match is returned unchanged.
+
+    Args:
+        match: Current match state
+        is_home: True if home player scores, False if away player scores
+
+    Returns:
+        New MatchState with updated scores
+    """
+    if match.is_finished:
+        return match
+
+    rules = match.rules
+    current_game = match.sets[match.current_set_index].current_game
+
+    # Score the point in the current game
+    if current_game.is_tiebreak:
+        new_game = score_tiebreak_point(
+            current_game, is_home, tiebreak_points=rules.regular_tiebreak_points
+        )
+        game_finished = is_game_finished(
+            new_game, deciding_point=False, tiebreak_points=rules.regular_tiebreak_points
+        )
+    else:
+        new_game = score_game_point(current_game, is_home, deciding_point=rules.deciding_point)
+        game_finished = is_game_finished(new_game, deciding_point=rules.deciding_point)
+
+    if not game_finished:
+        return replace_current_game(match, new_game)
+    return finish_game(match, new_game)
+
+
+def finish_game(match: MatchState, game: GameState) -> MatchState:
+    """
+    Record a finished game and progress to the next game, set and match.
+
+    Args:
+        match: Match state before the game's final point
+        game: Finished state of the current game
+
+    Returns:
+        New MatchState after the game
+    """
+    rules = match.rules
+    index = match.current_set_index
+    new_set = replace(match.sets[index], current_game=game)
+
+    # Progress to next game
+    home_won_game = game.home_score > game.away_score
+    new_set = progress_to_next_game(new_set, home_won_game, deciding_point=rules.deciding_point)
+
+    is_final_set = index == rules.best_of - 1
+    if not is_set_finished(new_set, rules, is_final_set):
+        return replace(match, sets=_replace_set(match.sets, index, new_set))
+
+    # Update match score
+    home_won_set = new_set.home_score > new_set.away_score
+    new_home_score = match.home_score + (1 if home_won_set else 0)
+    new_away_score = match.away_score + (0 if home_won_set else 1)
+    is_match_finished = check_match_complete(new_home_score, new_away_score, rules)
+
+    # Start the next set if the match is not finished
+    new_sets = _replace_set(match.sets, index, new_set)
+    new_set_index = index
+    if not is_match_finished and new_set_index < rules.best_of - 1:
+        new_set_index += 1
+        new_sets = _replace_set(
+            new_sets, new_set_index, progress_to_next_set(deciding_point=rules.deciding_point)
+        )
+
+    return replace(
+        match,
+        home_score=new_home_score,
+        away_score=new_away_score,
+        current_set_index=new_set_index,
+        sets=new_sets,
+        is_finished=is_match_finished,
+    )
@@ -0,0 +1,189 @@
+"""Thread-safe registry of live scorers with striped locks."""
+
+import threading
+from collections.abc import Hashable
+from typing import Literal, Optional
+
+from pytennisscorer.models import MatchState, MatchType
+from pytennisscorer.scorer import TennisScorer
+
+# Default number of lock stripes; matches on different stripes never contend
+DEFAULT_STRIPES = 64
+
+
+class _Stripe:
+    """A lock and the scorers it guards."""
+
+    __slots__ = ("lock", "scorers")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.scorers: dict[Hashable, TennisScorer] = {}
+
+
+class ScorerRegistry:
+    """
+    Many ``TennisScorer`` instances keyed by match id, safe to use from many threads.
+
+    Match ids are hashed onto a fixed number of stripes, each with its own lock
+    and dictionary. Operations on one match are serialized, while operations on
+    matches in different stripes run without contending for a lock.
+    """
+
+    def __init__(self, num_stripes: int = DEFAULT_STRIPES) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+            num_stripes: Number of lock stripes
+
+        Raises:
+            ValueError: If num_stripes is not positive
+        """
+        if num_stripes < 1:
+            raise ValueError(f"num_stripes must be positive, got {num_stripes}")
+        self._stripes = tuple(_Stripe() for _ in range(num_stripes))
+
+    def _stripe(self, match_id: Hashable) -> _Stripe:
+        return self._stripes[hash(match_id) % len(self._stripes)]
+
+    def __len__(self) -> int:
+        return sum(len(stripe.scorers) for stripe in self._stripes)
+
+    def __contains__(self, match_id: Hashable) -> bool:
+        return match_id in self._stripe(match_id).scorers
+
+    def add(
+        self, match_id: Hashable, match_type: MatchType, max_undo: Optional[int] = None
+    ) -> None:
+        """
+        Start scoring a match.
+
+        Args:
+            match_id: Unique id of the match
+            match_type: Type of tennis match to score
+            max_undo: Maximum number of points that can be undone, or None for
+                unlimited
+
+        Raises:
+            ValueError: If a match with this id already exists
+        """
+        scorer = TennisScorer(match_type, max_undo=max_undo)
+        stripe = self._stripe(match_id)
+        with stripe.lock:
+            if match_id in stripe.scorers:
+                raise ValueError(f"Match {match_id!r} already exists")
+            stripe.scorers[match_id] = scorer
+
+    def remove(self, match_id: Hashable) -> MatchState:
+        """
+        Stop scoring a match.
+
+        Args:
+            match_id: Id of the match
+
+        Returns:
+            Final state of the match
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        stripe = self._stripe(match_id)
+        with stripe.lock:
+            return self._scorer(stripe, match_id, remove=True).state
+
+    @staticmethod
+    def _scorer(stripe: _Stripe, match_id: Hashable, remove: bool = False) -> TennisScorer:
+        """Look up a scorer; the caller must hold the stripe lock."""
+        scorer = stripe.scorers.pop(match_id, None) if remove else stripe.scorers.get(match_id)
+        if scorer is None:
+            raise ValueError(f"Unknown match {match_id!r}")
+        return scorer
+
+    def increase_score(self, match_id: Hashable, is_home: bool) -> str:
+        """
+        Score a point in a match.
+
+        Args:
+            match_id: Id of the match
+            is_home: True to score for home player, False for away player
+
+        Returns:
+            Score after the point
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        stripe = self._stripe(match_id)
+        with stripe.lock:
+            scorer = self._scorer(stripe, match_id)
+            scorer.increase_score(is_home)
+            return scorer.get_score()
+
+    def undo(self, match_id: Hashable) -> bool:
+        """
+        Undo the last point of a match.
+
+        Args:
+            match_id: Id of the match
+
+        Returns:
+            True if undo was successful, False if no history to undo
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        stripe = self._stripe(match_id)
+        with stripe.lock:
+            return self._scorer(stripe, match_id).undo()
+
+    def get_score(self, match_id: Hashable) -> str:
+        """
+        Get the current score of a match.
+
+        Args:
+            match_id: Id of the match
+
+        Returns:
+            Score string, see ``TennisScorer.get_score``
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        stripe = self._stripe(match_id)
+        with stripe.lock:
+            return self._scorer(stripe, match_id).get_score()
+
+    def get_winner(self, match_id: Hashable) -> Optional[Literal["home", "away"]]:
+        """
+        Get the winner of a match.
+
+        Args:
+            match_id: Id of the match
+
+        Returns:
+            "home" if home won, "away" if away won, None if match not finished
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        stripe = self._stripe(match_id)
+        with stripe.lock:
+            return self._scorer(stripe, match_id).get_winner()
+
+    def get_state(self, match_id: Hashable) -> MatchState:
+        """
+        Get the current immutable state of a match.
+
+        Args:
+            match_id: Id of the match
+
+        Returns:
+            Current MatchState, safe to use without holding any lock
+
+        Raises:
+            ValueError: If the match does not exist
+        """
+        stripe = self._stripe(match_id)
+        with stripe.lock:
+            return self._scorer(stripe, match_id).state
@@ -0,0 +1,95 @@
+"""Streaming replay of point-by-point feeds."""
+
+from collections.abc import Iterable, Iterator
+from typing import Union
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import MatchState, MatchType
+from pytennisscorer.progression import score_match_point
+from pytennisscorer.transitions import TableScorer
+
+# Characters accepted in string point feeds
+HOME_POINT_CHARS = frozenset("Hh1")
+AWAY_POINT_CHARS = frozenset("Aa0")
+
+Point = Union[bool, int, str, bytes]
+
+
+def iter_points(points: Iterable[Point]) -> Iterator[bool]:
+    """
+    Normalize a feed of point winners to booleans.
+
+    Booleans and integers are taken as ``is_home``. Strings are read character
+    by character: "H"/"1" is a home point, "A"/"0" an away point and whitespace
+    is skipped, so both ``"HHAHA"`` and the lines of a text file work. Bytes
+    are read the same way as strings, whether passed as the whole feed
+    (``b"HHAHA"``) or as the lines of a file opened in binary mode.
+
+    Args:
+        points: Iterable of point winners
+
+    Yields:
+        True for each home point, False for each away point
+
+    Raises:
+        ValueError: If a string or bytes contains any other character
+    """
+    if isinstance(points, (bytes, bytearray)):
+        # Iterating bytes would yield integer codes, each taken as a home point
+        points = [bytes(points)]
+    for point in points:
+        if isinstance(point, (bytes, bytearray)):
+            point = point.decode("latin-1")
+        if not isinstance(point, str):
+            yield bool(point)
+            continue
+
+        for char in point:
+            if char in HOME_POINT_CHARS:
+                yield True
+            elif char in AWAY_POINT_CHARS:
+                yield False
+            elif not char.isspace():
+                raise ValueError(f"Invalid point character: {char!r}")
+
+
+def replay(match_type: MatchType, points: Iterable[Point]) -> Iterator[str]:
+    """
+    Replay a point feed and lazily yield the score after every point.
+
+    Uses constant memory: points are consumed one at a time and no history is
+    kept. Iteration stops once the match is finished; remaining points are not
+    consumed.
+
+    Args:
+        match_type: Type of tennis match to score
+        points: Point winners, see ``iter_points``
+
+    Yields:
+        Score string after each point, as returned by ``TennisScorer.get_score``
+    """
+    scorer = TableScorer(match_type)
+    for is_home in iter_points(points):
+        scorer.increase_score(is_home)
+        yield scorer.get_score()
+        if scorer.get_winner() is not None:
+            return
+
+
+def replay_states(match_type: MatchType, points: Iterable[Point]) -> Iterator[MatchState]:
+    """
+    Replay a point feed and lazily yield the match state after every point.
+
+    Args:
+        match_type: Type of tennis match to score
+        points: Point winners, see ``iter_points``
+
+    Yields:
+        MatchState after each point; iteration stops once the match is finished
+    """
+    state = create_match_config(match_type).initial_state
+    for is_home in iter_points(points):
+        state = score_match_point(state, is_home)
+        yield state
+        if state.is_finished:
+            return
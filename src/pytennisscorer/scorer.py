@@ -1,43 +1,131 @@
 """Main TennisScorer API."""
 
-from dataclasses import replace
+import struct
+from collections.abc import Iterable
 from typing import Literal, Optional
 
 from pytennisscorer.configs import create_match_config
-from pytennisscorer.formatter import format_match_score
+from pytennisscorer.formatter import format_game_score, format_set_score, parse_match_score
+from pytennisscorer.instrumentation import (
+    FORMAT_STAGE,
+    GAME_CHECK_STAGE,
+    POINT_STAGE,
+    PROGRESSION_STAGE,
+    ScoringStats,
+)
+from pytennisscorer.match_stats import MatchStatsTracker
 from pytennisscorer.models import MatchState, MatchType
+from pytennisscorer.packing import Buffer, pack_match_state, unpack_match_state
 from pytennisscorer.progression import (
-    check_match_complete,
+    finish_game,
     get_match_winner,
-    is_set_finished,
-    progress_to_next_game,
-    progress_to_next_set,
-)
-from pytennisscorer.scoring import (
-    is_game_finished,
-    score_game_point,
-    score_tiebreak_point,
+    replace_current_game,
+    score_match_point,
 )
+from pytennisscorer.scoring import is_game_finished, score_game_point, score_tiebreak_point
+
+# Number of points between stored MatchState checkpoints in the undo log
+CHECKPOINT_INTERVAL = 16
+
+# Snapshot header: magic, version, match type index, max_undo (-1 for unlimited),
+# undo depth, index of the first logged point, logged points, packed base
+# checkpoint length, packed state length
+SNAPSHOT_MAGIC = b"PTSS"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_HEADER = struct.Struct("<4sBBxxiIIIII")
+
+_MATCH_TYPES = list(MatchType)
 
 
 class TennisScorer:
     """High-level API for tennis match scoring."""
 
-    def __init__(self, match_type: MatchType) -> None:
+    def __init__(
+        self,
+        match_type: MatchType,
+        max_undo: Optional[int] = None,
+        stats: Optional[ScoringStats] = None,
+        tracker: Optional[MatchStatsTracker] = None,
+    ) -> None:
         """
         Initialize a tennis scorer with a specific match type.
 
+        Undo history is kept as a log of point winners with a MatchState
+        checkpoint every ``CHECKPOINT_INTERVAL`` points; undoing a point or
+        seeking to an earlier point replays the log from the nearest
+        checkpoint. Undone points are kept for ``redo`` and forward ``seek``
+        until a new point is scored.
+
         Args:
             match_type: Type of tennis match to score
+            max_undo: Maximum number of points that can be undone, or None for
+                unlimited. Bounds the undo log to a constant size per match.
+            stats: Collector for instrumentation counters and stage timings,
+                or None to disable instrumentation
+            tracker: New match statistics tracker to update on every point,
+                or None to keep no match statistics
+
+        Raises:
+            ValueError: If max_undo is negative or the tracker is already
+                attached to another scorer
         """
+        if max_undo is not None and max_undo < 0:
+            raise ValueError(f"max_undo must be non-negative, got {max_undo}")
+        if tracker is not None:
+            tracker._attach()
+
         config = create_match_config(match_type)
         self._state = config.initial_state
-        self._history: list[MatchState] = [self._state]
+        self._max_undo = max_undo
+        self._stats = stats
+        self._tracker = tracker
+        # _checkpoints[k] is the state after the first k * CHECKPOINT_INTERVAL points of the
+        # log followed by the redo log. After from_bytes only a prefix is present; the rest
+        # is rebuilt on demand.
+        self._checkpoints: list[MatchState] = [self._state]
+        self._points = bytearray()
+        # Point index of _points[0]; advances as max_undo trims the log
+        self._log_start = 0
+        self._undo_depth = 0
+        # Undone points, in order, that redo and forward seeks re-apply
+        self._redo = bytearray()
+        # Cached score string, and the formatted finished sets it starts with
+        self._score: Optional[str] = None
+        self._sets_prefix = ""
+        self._sets_prefix_count = 0
+
+    @property
+    def state(self) -> MatchState:
+        """Current immutable match state."""
+        return self._state
+
+    @property
+    def point_index(self) -> int:
+        """Number of points scored so far (the position in the point log)."""
+        return self._log_start + len(self._points)
+
+    @property
+    def seek_range(self) -> tuple[int, int]:
+        """Earliest and latest point index reachable with ``seek``, inclusive."""
+        index = self.point_index
+        return index - self._undo_depth, index + len(self._redo)
+
+    @property
+    def stats(self) -> Optional[ScoringStats]:
+        """Instrumentation collector, or None if instrumentation is disabled."""
+        return self._stats
+
+    @property
+    def tracker(self) -> Optional[MatchStatsTracker]:
+        """Match statistics tracker, or None if match statistics are not kept."""
+        return self._tracker
 
     def increase_score(self, is_home: bool) -> None:
         """
         Score a point for the specified player.
 
+        Scoring a point discards any undone points kept for redo.
+
         Args:
             is_home: True to score for home player, False for away player
         """
@@ -45,94 +133,147 @@ class TennisScorer:
         if self._state.is_finished:
             return
 
-        # Save current state to history
-        self._history.append(self._state)
+        if self._redo:
+            self._discard_redo()
+        self._score_point(is_home)
 
-        # Get current set and game
-        current_set = self._state.sets[self._state.current_set_index]
-        current_game = current_set.current_game
+    def _discard_redo(self) -> None:
+        """Drop undone points and the checkpoints that lie beyond the current point."""
+        self._redo.clear()
+        del self._checkpoints[len(self._points) // CHECKPOINT_INTERVAL + 1 :]
+        if self._tracker is not None:
+            self._tracker._truncate_checkpoints(len(self._checkpoints))
 
-        # Score the point in the current game
-        if current_game.is_tiebreak:
-            new_game = score_tiebreak_point(
-                current_game,
-                is_home,
-                tiebreak_points=self._state.rules.regular_tiebreak_points,
-            )
+    def _score_point(self, is_home: bool) -> None:
+        """Score and log a point in an unfinished match."""
+        if len(self._points) >= len(self._checkpoints) * CHECKPOINT_INTERVAL:
+            self._fill_checkpoints()
+        state = self._state
+        if self._stats is None:
+            self._state = score_match_point(state, is_home)
         else:
-            new_game = score_game_point(
-                current_game, is_home, deciding_point=self._state.rules.deciding_point
-            )
+            self._state = self._score_point_instrumented(self._stats, is_home)
+        self._score = None
+        self._points.append(is_home)
+        tracker = self._tracker
+        if tracker is not None:
+            tracker.record_point(state, self._state, is_home)
+        if len(self._points) == len(self._checkpoints) * CHECKPOINT_INTERVAL:
+            self._checkpoints.append(self._state)
+            if tracker is not None:
+                tracker._checkpoint()
+        self._count_undo()
 
-        # Update current set with new game
-        new_set = replace(current_set, current_game=new_game)
+    def apply_points(self, points: Iterable[bool]) -> None:
+        """
+        Score a sequence of points, as if calling ``increase_score`` for each.
 
-        # Check if game is finished
-        if current_game.is_tiebreak:
-            game_finished = is_game_finished(
-                new_game,
-                deciding_point=False,
-                tiebreak_points=self._state.rules.regular_tiebreak_points,
-            )
-        else:
-            game_finished = is_game_finished(
-                new_game, deciding_point=self._state.rules.deciding_point
-            )
+        Points inside a game only advance a GameState; a full MatchState is
+        built when a game ends and at undo checkpoints. Points after the end
+        of the match are ignored. With instrumentation or a match statistics
+        tracker, points are scored one at a time so every point is recorded.
+        Like ``increase_score``, this discards any undone points kept for redo.
 
-        if game_finished:
-            # Progress to next game
-            home_won_game = new_game.home_score > new_game.away_score
-            new_set = progress_to_next_game(
-                new_set, home_won_game, deciding_point=self._state.rules.deciding_point
-            )
+        Args:
+            points: Point winners, True for home and False for away
+        """
+        if self._redo and not self._state.is_finished:
+            self._discard_redo()
+        if len(self._points) >= len(self._checkpoints) * CHECKPOINT_INTERVAL:
+            self._fill_checkpoints()
+
+        if self._stats is not None or self._tracker is not None:
+            for is_home in points:
+                if self._state.is_finished:
+                    break
+                self._score_point(is_home)
+            return
 
-            # Check if set is finished
-            is_final_set = self._state.current_set_index == len(self._state.sets) - 1
-            if is_set_finished(new_set, self._state.rules, is_final_set):
-                # Update match score
-                home_won_set = new_set.home_score > new_set.away_score
-                new_home_score = self._state.home_score + (1 if home_won_set else 0)
-                new_away_score = self._state.away_score + (0 if home_won_set else 1)
-
-                # Check if match is complete
-                is_match_finished = check_match_complete(
-                    new_home_score, new_away_score, self._state.rules
-                )
-
-                # Update sets list
-                new_sets = list(self._state.sets)
-                new_sets[self._state.current_set_index] = new_set
-
-                # Create new set if match not finished and not at last set
-                if (
-                    not is_match_finished
-                    and self._state.current_set_index < len(self._state.sets) - 1
-                ):
-                    new_set_index = self._state.current_set_index + 1
-                    new_sets[new_set_index] = progress_to_next_set(
-                        deciding_point=self._state.rules.deciding_point
-                    )
-                else:
-                    new_set_index = self._state.current_set_index
-
-                self._state = replace(
-                    self._state,
-                    home_score=new_home_score,
-                    away_score=new_away_score,
-                    current_set_index=new_set_index,
-                    sets=new_sets,
-                    is_finished=is_match_finished,
-                )
+        state = self._state
+        rules = state.rules
+        deciding_point = rules.deciding_point
+        tiebreak_points = rules.regular_tiebreak_points
+        game = state.sets[state.current_set_index].current_game
+        log = self._points
+        checkpoints = self._checkpoints
+
+        for is_home in points:
+            if state.is_finished:
+                break
+
+            if game.is_tiebreak:
+                new_game = score_tiebreak_point(game, is_home, tiebreak_points)
+                game_finished = is_game_finished(new_game, False, tiebreak_points)
+            else:
+                new_game = score_game_point(game, is_home, deciding_point)
+                game_finished = is_game_finished(new_game, deciding_point)
+
+            if game_finished:
+                state = finish_game(state, new_game)
+                game = state.sets[state.current_set_index].current_game
             else:
-                # Set not finished, just update the set
-                new_sets = list(self._state.sets)
-                new_sets[self._state.current_set_index] = new_set
-                self._state = replace(self._state, sets=new_sets)
+                game = new_game
+
+            log.append(is_home)
+            if len(log) == len(checkpoints) * CHECKPOINT_INTERVAL:
+                state = replace_current_game(state, game)
+                checkpoints.append(state)
+            self._count_undo()
+
+        self._state = replace_current_game(state, game)
+        self._score = None
+
+    def _score_point_instrumented(self, stats: ScoringStats, is_home: bool) -> MatchState:
+        """Score a point like ``score_match_point``, counting and timing each stage."""
+        clock = stats.clock
+        state = self._state
+        rules = state.rules
+        game = state.sets[state.current_set_index].current_game
+
+        start = clock()
+        if game.is_tiebreak:
+            tiebreak_points = rules.regular_tiebreak_points
+            new_game = score_tiebreak_point(game, is_home, tiebreak_points)
+            scored = clock()
+            game_finished = is_game_finished(new_game, False, tiebreak_points)
+        else:
+            new_game = score_game_point(game, is_home, rules.deciding_point)
+            scored = clock()
+            game_finished = is_game_finished(new_game, rules.deciding_point)
+        checked = clock()
+        if game_finished:
+            new_state = finish_game(state, new_game)
         else:
-            # Game not finished, just update the game in the set
-            new_sets = list(self._state.sets)
-            new_sets[self._state.current_set_index] = new_set
-            self._state = replace(self._state, sets=new_sets)
+            new_state = replace_current_game(state, new_game)
+        done = clock()
+
+        stats.add_time(POINT_STAGE, scored - start)
+        stats.add_time(GAME_CHECK_STAGE, checked - scored)
+        stats.add_time(PROGRESSION_STAGE, done - checked)
+        stats.points += 1
+        if game_finished:
+            stats.games += 1
+            stats.tiebreaks += game.is_tiebreak
+            if new_state.home_score + new_state.away_score != state.home_score + state.away_score:
+                stats.sets += 1
+        return new_state
+
+    def _count_undo(self) -> None:
+        """Track undo depth for a logged point and trim the log to max_undo."""
+        self._undo_depth += 1
+        if self._max_undo is not None:
+            self._undo_depth = min(self._undo_depth, self._max_undo)
+            self._trim_log(self._max_undo)
+
+    def _trim_log(self, max_undo: int) -> None:
+        """Drop the oldest checkpoint blocks once they are out of undo reach."""
+        while len(self._points) >= max_undo + CHECKPOINT_INTERVAL:
+            self._fill_checkpoints()
+            del self._points[:CHECKPOINT_INTERVAL]
+            del self._checkpoints[0]
+            if self._tracker is not None:
+                self._tracker._drop_first_checkpoint()
+            self._log_start += CHECKPOINT_INTERVAL
 
     def undo(self) -> bool:
         """
@@ -141,14 +282,229 @@ class TennisScorer:
         Returns:
             True if undo was successful, False if no history to undo
         """
-        if len(self._history) <= 1:
+        if self._undo_depth == 0:
             return False
 
-        # Remove current state and restore previous
-        self._history.pop()
-        self._state = self._history[-1]
+        self._rewind(1)
+        if self._stats is not None:
+            self._stats.undos += 1
+        return True
+
+    def redo(self) -> bool:
+        """
+        Re-apply the last undone point.
+
+        Returns:
+            True if redo was successful, False if there is nothing to redo
+        """
+        if not self._redo:
+            return False
+        self.seek(self.point_index + 1)
         return True
 
+    def seek(self, point_index: int) -> None:
+        """
+        Move to the state after ``point_index`` points.
+
+        Seeking backward keeps the skipped points, and their checkpoints, for
+        redo, so the scorer can move back and forth along the same points.
+        Either direction restores the nearest checkpoint and replays fewer
+        than ``CHECKPOINT_INTERVAL`` points.
+
+        Args:
+            point_index: Target position, within ``seek_range``
+
+        Raises:
+            ValueError: If point_index is outside ``seek_range``
+        """
+        first, last = self.seek_range
+        if not first <= point_index <= last:
+            raise ValueError(
+                f"Point index {point_index} is outside the reachable range {first}..{last}"
+            )
+
+        current = self.point_index
+        if point_index < current:
+            self._rewind(current - point_index)
+        elif point_index > current:
+            self._forward(point_index - current)
+
+    def _rewind(self, count: int) -> None:
+        """Move count logged points back onto the redo log and restore the state."""
+        split = len(self._points) - count
+        self._redo[:0] = self._points[split:]
+        del self._points[split:]
+        self._undo_depth -= count
+        self._restore()
+
+    def _forward(self, count: int) -> None:
+        """Move count points from the redo log back onto the log and restore the state."""
+        self._points += self._redo[:count]
+        del self._redo[:count]
+        self._undo_depth += count
+        if self._max_undo is not None:
+            self._undo_depth = min(self._undo_depth, self._max_undo)
+            self._trim_log(self._max_undo)
+        self._restore()
+
+    def _restore(self) -> None:
+        """Set the state from the nearest checkpoint, replaying the points after it."""
+        self._fill_checkpoints()
+        checkpoint = min(len(self._points) // CHECKPOINT_INTERVAL, len(self._checkpoints) - 1)
+        state = self._checkpoints[checkpoint]
+        points = self._points[checkpoint * CHECKPOINT_INTERVAL :]
+        tracker = self._tracker
+        if tracker is None:
+            for is_home in points:
+                state = score_match_point(state, bool(is_home))
+        else:
+            tracker._restore_checkpoint(checkpoint)
+            for is_home in points:
+                new_state = score_match_point(state, bool(is_home))
+                tracker.record_point(state, new_state, bool(is_home))
+                state = new_state
+
+        self._state = state
+        self._score = None
+        # Reopening a finished set makes the cached finished-sets text stale
+        if state.current_set_index < self._sets_prefix_count:
+            self._sets_prefix = ""
+            self._sets_prefix_count = 0
+
+    @classmethod
+    def from_score(
+        cls, match_type: MatchType, score: str, max_undo: Optional[int] = None
+    ) -> "TennisScorer":
+        """
+        Create a scorer positioned at a score string, without replaying points.
+
+        Points scored before the given score cannot be undone.
+
+        Args:
+            match_type: Type of tennis match to score
+            score: Score string (e.g., "6:4;3:6;2:2-30:15")
+            max_undo: Maximum number of points that can be undone, or None for
+                unlimited
+
+        Returns:
+            TennisScorer whose ``get_score()`` equals the given score
+
+        Raises:
+            ValueError: If the score is malformed or cannot occur, or max_undo
+                is negative
+        """
+        scorer = cls(match_type, max_undo)
+        scorer._state = parse_match_score(score, match_type)
+        scorer._checkpoints = [scorer._state]
+        return scorer
+
+    def _fill_checkpoints(self) -> None:
+        """
+        Rebuild checkpoints missing after ``from_bytes`` by replaying the log.
+
+        A restored scorer has only its oldest checkpoint; the first undo, seek
+        or scored point fills in the rest, so later ones replay fewer than
+        ``CHECKPOINT_INTERVAL`` points.
+        """
+        state = self._checkpoints[-1]
+        start = (len(self._checkpoints) - 1) * CHECKPOINT_INTERVAL
+        end = len(self._points) // CHECKPOINT_INTERVAL * CHECKPOINT_INTERVAL
+        for index in range(start, end):
+            state = score_match_point(state, bool(self._points[index]))
+            if (index + 1) % CHECKPOINT_INTERVAL == 0:
+                self._checkpoints.append(state)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the scorer, including its undo log, to a binary snapshot.
+
+        The snapshot is a fixed-size header followed by the point log (one byte
+        per point), the packed oldest checkpoint and the packed current state.
+        Intermediate checkpoints are not stored; they are rebuilt by the first
+        undo, seek or point scored after ``from_bytes``. Undone points kept for redo and match
+        statistics are not stored.
+
+        Returns:
+            Snapshot bytes accepted by ``from_bytes``
+        """
+        base = pack_match_state(self._checkpoints[0])
+        state = pack_match_state(self._state)
+        header = SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_VERSION,
+            _MATCH_TYPES.index(self._state.match_type),
+            -1 if self._max_undo is None else self._max_undo,
+            self._undo_depth,
+            self._log_start,
+            len(self._points),
+            len(base),
+            len(state),
+        )
+        return b"".join((header, self._points, base, state))
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TennisScorer":
+        """
+        Restore a scorer from a snapshot written by ``to_bytes``.
+
+        The header is read in place and the point log is copied in one block,
+        so no points are replayed. Any buffer works, including a slice of an
+        ``mmap``.
+
+        Args:
+            data: Snapshot bytes
+
+        Returns:
+            TennisScorer with the same score and undo history
+
+        Raises:
+            ValueError: If the snapshot is malformed or from another version
+        """
+        view = memoryview(data)
+        if len(view) < SNAPSHOT_HEADER.size:
+            raise ValueError("Truncated scorer snapshot")
+        (
+            magic,
+            version,
+            match_type_index,
+            max_undo,
+            undo_depth,
+            log_start,
+            num_points,
+            base_length,
+            state_length,
+        ) = SNAPSHOT_HEADER.unpack_from(view)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a scorer snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported scorer snapshot version {version}")
+        if match_type_index >= len(_MATCH_TYPES):
+            raise ValueError(f"Unknown match type index {match_type_index}")
+        points_end = SNAPSHOT_HEADER.size + num_points
+        base_end = points_end + base_length
+        if len(view) != base_end + state_length:
+            raise ValueError("Scorer snapshot length does not match its header")
+        if undo_depth > num_points:
+            raise ValueError("Scorer snapshot undo depth exceeds its point log")
+
+        points = bytearray(view[SNAPSHOT_HEADER.size : points_end])
+        if points.translate(None, b"\x00\x01"):
+            raise ValueError("Scorer snapshot point log must contain only 0 and 1 bytes")
+
+        match_type = _MATCH_TYPES[match_type_index]
+        base = unpack_match_state(view[points_end:base_end])
+        state = unpack_match_state(view[base_end:])
+        if base.match_type != match_type or state.match_type != match_type:
+            raise ValueError("Scorer snapshot states do not match its match type")
+
+        scorer = cls(match_type, None if max_undo < 0 else max_undo)
+        scorer._checkpoints = [base]
+        scorer._state = state
+        scorer._points = points
+        scorer._log_start = log_start
+        scorer._undo_depth = undo_depth
+        return scorer
+
     def get_score(self) -> str:
         """
         Get the current match score in tennis notation.
@@ -156,7 +512,39 @@ class TennisScorer:
         Returns:
             Score string (e.g., "6:4;3:6;2:2-30:15")
         """
-        return format_match_score(self._state)
+        if self._score is None:
+            stats = self._stats
+            if stats is None:
+                self._score = self._format_score()
+            else:
+                start = stats.clock()
+                self._score = self._format_score()
+                stats.add_time(FORMAT_STAGE, stats.clock() - start)
+        return self._score
+
+    def _format_score(self) -> str:
+        """
+        Format the current score, reusing the cached text of finished sets.
+
+        Finished set scores never change, so only the current set and game are
+        formatted on each call unless a set boundary was crossed.
+
+        Returns:
+            Score string identical to ``format_match_score``
+        """
+        state = self._state
+        index = state.current_set_index
+        if self._sets_prefix_count != index:
+            self._sets_prefix = "".join(
+                f"{format_set_score(set_state)};" for set_state in state.sets[:index]
+            )
+            self._sets_prefix_count = index
+
+        current_set = state.sets[index]
+        score = self._sets_prefix + format_set_score(current_set)
+        if not state.is_finished:
+            score = f"{score}-{format_game_score(current_set.current_game)}"
+        return score
 
     def get_winner(self) -> Optional[Literal["home", "away"]]:
         """
@@ -1,9 +1,8 @@
 """Pure functions for tennis point scoring logic."""
 
-from dataclasses import replace
 from typing import Optional
 
-from pytennisscorer.models import GameState
+from pytennisscorer.models import GameState, intern_game
 
 
 def is_game_finished(
@@ -66,7 +65,7 @@ def score_game_point(game: GameState, is_home: bool, deciding_point: bool) -> Ga
         deciding_point: Whether deciding point rule is in effect
 
     Returns:
-        New GameState with updated scores
+        Shared GameState with updated scores, see ``intern_game``
     """
     # Don't modify if game is already finished
     if is_game_finished(game, deciding_point):
@@ -85,7 +84,7 @@ def score_game_point(game: GameState, is_home: bool, deciding_point: bool) -> Ga
         new_home_score = 3
         new_away_score = 3
 
-    return replace(game, home_score=new_home_score, away_score=new_away_score)
+    return intern_game(new_home_score, new_away_score, game.is_tiebreak)
 
 
 def score_tiebreak_point(game: GameState, is_home: bool, tiebreak_points: int) -> GameState:
@@ -98,7 +97,7 @@ def score_tiebreak_point(game: GameState, is_home: bool, tiebreak_points: int) -
         tiebreak_points: Points required to win tiebreak (7 for regular, 10 for match)
 
     Returns:
-        New GameState with updated scores
+        Shared GameState with updated scores, see ``intern_game``
     """
     # Don't modify if tiebreak is already finished
     if is_game_finished(game, deciding_point=False, tiebreak_points=tiebreak_points):
@@ -111,4 +110,4 @@ def score_tiebreak_point(game: GameState, is_home: bool, tiebreak_points: int) -
         new_home_score = game.home_score
         new_away_score = game.away_score + 1
 
-    return replace(game, home_score=new_home_score, away_score=new_away_score)
+    return intern_game(new_home_score, new_away_score, game.is_tiebreak)
@@ -0,0 +1,355 @@
+"""Vectorized game, tiebreak and set segmentation of one match's point sequence."""
+
+from dataclasses import dataclass
+from functools import cache
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "pytennisscorer.segmentation requires numpy; "
+        "install with 'pip install pytennisscorer[numpy]'"
+    ) from exc
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import MatchType, ScoringRules, SetState, intern_game
+from pytennisscorer.progression import check_match_complete, is_set_finished, progress_to_next_game
+from pytennisscorer.scoring import is_game_finished, score_game_point
+from pytennisscorer.timeline import Points, PointTimeline, point_array
+
+# Set scores are clipped to this many games before table lookups; every set ends by then
+_MAX_SET_GAMES = 7
+
+# Points per block of the automaton scan; larger blocks mean more array work per point
+# but fewer Python steps per match
+_SCAN_BLOCK = 8
+
+
+@dataclass(frozen=True)
+class _SegmentTables:
+    """Small lookup tables compiled from the scoring rules of one match type."""
+
+    # Regular game automaton: next state per (away won, state); the last two states mean
+    # "game just won by home/away" and behave like 0:0 for the next point
+    game_transitions: "npt.NDArray[np.intp]"
+    game_home_points: "npt.NDArray[np.int16]"
+    game_away_points: "npt.NDArray[np.int16]"
+    game_finished: "npt.NDArray[np.bool_]"
+    initial_game: int
+    # Indexed by [is final set, home games, away games]
+    set_finished: "npt.NDArray[np.bool_]"
+    # Whether the game after reaching [home games, away games] is a tiebreak
+    next_tiebreak: "npt.NDArray[np.bool_]"
+    # Indexed by normalized tiebreak points [home, away]
+    tiebreak_finished: "npt.NDArray[np.bool_]"
+    tiebreak_points: int
+
+
+@cache
+def _segment_tables(rules: ScoringRules) -> _SegmentTables:
+    """Compile segmentation tables with the functions in ``scoring`` and ``progression``."""
+    deciding_point = rules.deciding_point
+    initial = intern_game(0, 0, False)
+    games = [initial]
+    index = {initial: 0}
+    for game in games:
+        for is_home in (True, False):
+            new_game = score_game_point(game, is_home, deciding_point)
+            if not is_game_finished(new_game, deciding_point) and new_game not in index:
+                index[new_game] = len(games)
+                games.append(new_game)
+
+    home_won, away_won = len(games), len(games) + 1
+    num_states = len(games) + 2
+    transitions = np.zeros((2, num_states), dtype=np.intp)
+    for state, game in enumerate(games):
+        for column, is_home in enumerate((True, False)):
+            new_game = score_game_point(game, is_home, deciding_point)
+            if is_game_finished(new_game, deciding_point):
+                transitions[column, state] = home_won if is_home else away_won
+            else:
+                transitions[column, state] = index[new_game]
+    transitions[:, home_won:] = transitions[:, :1]
+
+    home_points = np.zeros(num_states, dtype=np.int16)
+    away_points = np.zeros(num_states, dtype=np.int16)
+    home_points[: len(games)] = [game.home_score for game in games]
+    away_points[: len(games)] = [game.away_score for game in games]
+    game_finished = np.zeros(num_states, dtype=np.bool_)
+    game_finished[len(games) :] = True
+
+    size = _MAX_SET_GAMES + 1
+    set_finished = np.zeros((2, size, size), dtype=np.bool_)
+    next_tiebreak = np.zeros((size, size), dtype=np.bool_)
+    for home in range(size):
+        for away in range(size):
+            set_state = SetState(home_score=home, away_score=away, current_game=initial, games=())
+            for is_final_set in (False, True):
+                set_finished[int(is_final_set), home, away] = is_set_finished(
+                    set_state, rules, is_final_set
+                )
+            if home or away:
+                previous = SetState(
+                    home_score=home - (home > 0),
+                    away_score=away - (home == 0),
+                    current_game=initial,
+                    games=(),
+                )
+                next_set = progress_to_next_game(previous, home > 0, deciding_point)
+                next_tiebreak[home, away] = next_set.current_game.is_tiebreak
+
+    tiebreak_points = rules.regular_tiebreak_points
+    tiebreak_size = tiebreak_points + 2
+    tiebreak_finished = np.array(
+        [
+            [
+                is_game_finished(intern_game(home, away, True), False, tiebreak_points)
+                for away in range(tiebreak_size)
+            ]
+            for home in range(tiebreak_size)
+        ],
+        dtype=np.bool_,
+    )
+
+    return _SegmentTables(
+        game_transitions=transitions,
+        game_home_points=home_points,
+        game_away_points=away_points,
+        game_finished=game_finished,
+        initial_game=0,
+        set_finished=set_finished,
+        next_tiebreak=next_tiebreak,
+        tiebreak_finished=tiebreak_finished,
+        tiebreak_points=tiebreak_points,
+    )
+
+
+def _compose_prefixes(maps: "npt.NDArray[np.intp]") -> None:
+    """
+    Replace each state map by its composition with all earlier maps of its group, in place.
+
+    Uses log2(group length) array steps, composing each map with the one
+    ``step`` positions earlier at every step.
+
+    Args:
+        maps: State maps of shape (groups, group length, states); must be
+            C-contiguous
+    """
+    num_groups, length, num_states = maps.shape
+    flat = maps.reshape(-1)
+    # Offset of each map in the flattened array
+    rows = np.arange(0, maps.size, num_states, dtype=np.intp).reshape(num_groups, length, 1)
+    step = 1
+    while step < length:
+        maps[:, step:] = flat[rows[:, step:] + maps[:, :-step]]
+        step *= 2
+
+
+def _scan(
+    transitions: "npt.NDArray[np.intp]", winners: "npt.NDArray[np.bool_]", start: int
+) -> "npt.NDArray[np.intp]":
+    """
+    Run an automaton over a point sequence with a two-level prefix scan.
+
+    Each point is a map from state to state. Maps are composed within blocks
+    of ``_SCAN_BLOCK`` points, then the block totals are composed across
+    blocks to give the entry state of every block, so the number of array
+    steps grows with log2 of the number of points.
+
+    Args:
+        transitions: Next state per (away won, state)
+        winners: Point winners, True for home
+        start: State before the first point
+
+    Returns:
+        State after each point
+    """
+    num_states = transitions.shape[1]
+    num_blocks = -(-len(winners) // _SCAN_BLOCK)
+    maps = np.empty((num_blocks * _SCAN_BLOCK, num_states), dtype=np.intp)
+    maps[: len(winners)] = transitions[(~winners).astype(np.intp)]
+    maps[len(winners) :] = np.arange(num_states)  # identity maps pad the last block
+    blocks = maps.reshape(num_blocks, _SCAN_BLOCK, num_states)
+    _compose_prefixes(blocks)
+
+    totals = np.ascontiguousarray(blocks[np.newaxis, :, -1])
+    _compose_prefixes(totals)
+    entries = np.empty(num_blocks, dtype=np.intp)
+    entries[:1] = start
+    entries[1:] = totals[0, :-1, start]
+
+    states: npt.NDArray[np.intp] = blocks[
+        np.arange(num_blocks)[:, np.newaxis], np.arange(_SCAN_BLOCK), entries[:, np.newaxis]
+    ]
+    return states.reshape(-1)[: len(winners)]
+
+
+def segment_match(match_type: MatchType, points: Points) -> PointTimeline:
+    """
+    Compute the point-by-point timeline of one match with array operations.
+
+    Regular games are segmented by a prefix scan over a small game automaton,
+    and set ends and tiebreaks by cumulative sums of game and tiebreak point
+    winners, with tables compiled from ``scoring.is_game_finished`` and
+    ``progression.is_set_finished``. No Python code runs per point: each set
+    and tiebreak takes a fixed number of array operations, and the scan takes
+    O(log n) of them. Every tiebreak puts the automaton out of phase, so the
+    rest of the match is scanned again after it. The result equals
+    ``point_timeline`` for the same points.
+
+    Args:
+        match_type: Type of tennis match to score
+        points: Point winners, as a boolean array or any feed accepted by
+            ``replay.iter_points``
+
+    Returns:
+        PointTimeline of the single match, with the columns in ``timeline.COLUMNS``
+    """
+    rules = create_match_config(match_type).rules
+    tables = _segment_tables(rules)
+    winners = point_array(points)
+    num_points = len(winners)
+
+    home_cumulative = np.zeros(num_points + 1, dtype=np.int64)
+    np.cumsum(winners, out=home_cumulative[1:])
+    away_cumulative = np.arange(num_points + 1, dtype=np.int64) - home_cumulative
+
+    game_state = np.zeros(num_points, dtype=np.intp)
+    game_end = np.zeros(num_points, dtype=np.bool_)
+    set_end = np.zeros(num_points, dtype=np.bool_)
+    tiebreak = np.zeros(num_points, dtype=np.bool_)
+    tiebreaks: list[tuple[int, int]] = []
+    home_sets = away_sets = 0
+    length = num_points
+    match_finished = False
+    start = 0
+    # Whether game_state[start:] comes from a scan in phase with the games from start
+    in_phase = False
+
+    while start < num_points:
+        if not in_phase:
+            game_state[start:] = _scan(
+                tables.game_transitions, winners[start:], tables.initial_game
+            )
+            in_phase = True
+
+        # Game ends, and the set score after each of them
+        ends = start + np.flatnonzero(tables.game_finished[game_state[start:]])
+        home_games = np.cumsum(winners[ends])
+        away_games = np.arange(1, len(ends) + 1) - home_games
+        home_games = np.minimum(home_games, _MAX_SET_GAMES)
+        away_games = np.minimum(away_games, _MAX_SET_GAMES)
+        is_final_set = home_sets + away_sets == rules.best_of - 1
+        finished = tables.set_finished[int(is_final_set), home_games, away_games]
+        stops = np.flatnonzero(finished | tables.next_tiebreak[home_games, away_games])
+        if not len(stops):
+            game_end[ends] = True
+            break
+
+        game = stops[0]
+        game_end[ends[: game + 1]] = True
+        last = int(ends[game])
+        if not finished[game]:
+            # Tiebreak: points won since its first point decide it
+            first = last + 1
+            home = home_cumulative[first + 1 :] - home_cumulative[first]
+            away = away_cumulative[first + 1 :] - away_cumulative[first]
+            shift = np.maximum(np.minimum(home, away) - (tables.tiebreak_points - 1), 0)
+            limit = tables.tiebreak_points + 1
+            done = tables.tiebreak_finished[
+                np.minimum(home - shift, limit), np.minimum(away - shift, limit)
+            ]
+            tiebreak_ends = np.flatnonzero(done)
+            if not len(tiebreak_ends):
+                tiebreak[first:] = True
+                tiebreaks.append((first, num_points))
+                break
+            last = first + int(tiebreak_ends[0])
+            tiebreak[first : last + 1] = True
+            tiebreaks.append((first, last + 1))
+            game_end[last] = True
+            in_phase = False
+
+        set_end[last] = True
+        home_sets += bool(winners[last])
+        away_sets += not winners[last]
+        if check_match_complete(home_sets, away_sets, rules):
+            match_finished = True
+            length = last + 1
+            break
+        start = last + 1
+
+    return _timeline_columns(
+        tables,
+        winners[:length],
+        game_state[:length],
+        game_end[:length],
+        set_end[:length],
+        tiebreak[:length],
+        tiebreaks,
+        home_cumulative,
+        match_finished,
+    )
+
+
+def _timeline_columns(
+    tables: _SegmentTables,
+    winners: "npt.NDArray[np.bool_]",
+    game_state: "npt.NDArray[np.intp]",
+    game_end: "npt.NDArray[np.bool_]",
+    set_end: "npt.NDArray[np.bool_]",
+    tiebreak: "npt.NDArray[np.bool_]",
+    tiebreaks: list[tuple[int, int]],
+    home_cumulative: "npt.NDArray[np.int64]",
+    match_finished: bool,
+) -> PointTimeline:
+    """Derive the timeline columns of a segmented match."""
+    length = len(winners)
+    match_end = np.zeros(length, dtype=np.bool_)
+    if match_finished:
+        match_end[-1] = True
+
+    # Game score after each point; a finished game shows the next game at 0:0
+    home_points = tables.game_home_points[game_state]
+    away_points = tables.game_away_points[game_state]
+    for first, end in tiebreaks:
+        end = min(end, length)
+        played = np.arange(1, end - first + 1)
+        home = home_cumulative[first + 1 : end + 1] - home_cumulative[first]
+        home_points[first:end] = home
+        away_points[first:end] = played - home
+        if game_end[end - 1]:
+            home_points[end - 1] = away_points[end - 1] = 0
+
+    # Games in the current set: games won so far minus those won before the set began;
+    # a finished set shows the next set at 0:0 unless it ended the match
+    new_set = set_end & ~match_end
+    home_won_games = np.cumsum(game_end & winners)
+    away_won_games = np.cumsum(game_end & ~winners)
+    home_games: npt.NDArray[np.int64] = home_won_games - np.maximum.accumulate(
+        np.where(new_set, home_won_games, 0)
+    )
+    away_games: npt.NDArray[np.int64] = away_won_games - np.maximum.accumulate(
+        np.where(new_set, away_won_games, 0)
+    )
+
+    home_sets = np.cumsum(set_end & winners)
+    away_sets = np.cumsum(set_end & ~winners)
+    columns = {
+        "match": np.zeros(length, dtype=np.int32),
+        "point": np.arange(length, dtype=np.int32),
+        "home_won": winners.copy(),
+        "home_points": home_points,
+        "away_points": away_points,
+        "home_games": home_games.astype(np.int16),
+        "away_games": away_games.astype(np.int16),
+        "home_sets": home_sets.astype(np.int8),
+        "away_sets": away_sets.astype(np.int8),
+        "set_index": (home_sets + away_sets - match_end).astype(np.int8),
+        "tiebreak": tiebreak,
+        "game_end": game_end,
+        "set_end": set_end,
+        "match_end": match_end,
+    }
+    return PointTimeline(offsets=np.array([0, length], dtype=np.int64), columns=columns)
@@ -0,0 +1,121 @@
+"""Monte Carlo estimation of win probabilities with vectorized NumPy draws."""
+
+from typing import Optional, Union
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "pytennisscorer.simulation requires numpy; install with 'pip install pytennisscorer[numpy]'"
+    ) from exc
+
+from pytennisscorer.models import MatchState
+from pytennisscorer.probability import WinProbabilities, _validate_probability
+from pytennisscorer.scorer import TennisScorer
+from pytennisscorer.transitions import (
+    FLAG_BITS,
+    FLAG_GAME_END,
+    FLAG_SET_END,
+    compile_transition_table,
+)
+
+
+def simulate_win_probabilities(
+    match: Union[MatchState, TennisScorer],
+    home_serve_win: float,
+    away_serve_win: float,
+    home_serving: bool,
+    num_simulations: int = 100_000,
+    seed: Optional[int] = None,
+) -> WinProbabilities:
+    """
+    Estimate win probabilities by simulating continuations of a match.
+
+    All simulations advance together through the compiled transition table of
+    the match's ``ScoringRules``, so they follow exactly the same rules as
+    ``TennisScorer``. Serve alternates every game; in a tiebreak the first
+    point is served by the player due to serve, then serve changes every two
+    points.
+
+    Args:
+        match: Current match state, or a live scorer
+        home_serve_win: Probability that home wins a point on home serve
+        away_serve_win: Probability that away wins a point on away serve
+        home_serving: Whether home serves the current game (for a tiebreak in
+            progress, whether home served its first point)
+        num_simulations: Number of simulated continuations
+        seed: Seed for the random generator
+
+    Returns:
+        WinProbabilities for the home player; for a finished match every
+        probability is 1.0 or 0.0 according to the winner
+
+    Raises:
+        ValueError: If a probability is outside [0, 1] or num_simulations < 1
+    """
+    _validate_probability("home_serve_win", home_serve_win)
+    _validate_probability("away_serve_win", away_serve_win)
+    if num_simulations < 1:
+        raise ValueError(f"num_simulations must be positive, got {num_simulations}")
+
+    state = match.state if isinstance(match, TennisScorer) else match
+    if state.is_finished:
+        won = float(state.home_score > state.away_score)
+        return WinProbabilities(game=won, set=won, match=won)
+
+    table = compile_transition_table(state.rules)
+    start, _ = table.state_of(state)
+    current_game = state.sets[state.current_set_index].current_game
+
+    transitions = np.asarray(table.transitions, dtype=np.int64)
+    is_tiebreak = np.asarray(table.is_tiebreak, dtype=np.bool_)
+    is_finished = np.asarray(table.is_finished, dtype=np.bool_)
+    home_sets = np.asarray(table.home_sets, dtype=np.int8)
+    away_sets = np.asarray(table.away_sets, dtype=np.int8)
+
+    rng = np.random.default_rng(seed)
+    states = np.full(num_simulations, start, dtype=np.int64)
+    home_serves_game = np.full(num_simulations, home_serving, dtype=np.bool_)
+    tiebreak_points = np.full(
+        num_simulations,
+        current_game.home_score + current_game.away_score if current_game.is_tiebreak else 0,
+        dtype=np.int64,
+    )
+    # -1 until the current game / set ends, then 1 if home won it, 0 otherwise
+    game_won = np.full(num_simulations, -1, dtype=np.int8)
+    set_won = np.full(num_simulations, -1, dtype=np.int8)
+
+    active = np.arange(num_simulations)
+    while active.size:
+        current = states[active]
+        in_tiebreak = is_tiebreak[current]
+        played = tiebreak_points[active]
+
+        # In a tiebreak, serve switches after the first point and every two points after
+        switched = in_tiebreak & ((played + 1) // 2 % 2 == 1)
+        home_serves = home_serves_game[active] ^ switched
+        p_home = np.where(home_serves, home_serve_win, 1.0 - away_serve_win)
+        home_won = rng.random(active.size) < p_home
+
+        codes = transitions[current * 2 + (~home_won).astype(np.int64)]
+        game_end = (codes & FLAG_GAME_END) != 0
+        set_end = (codes & FLAG_SET_END) != 0
+
+        first_game = game_end & (game_won[active] < 0)
+        game_won[active[first_game]] = home_won[first_game]
+        first_set = set_end & (set_won[active] < 0)
+        set_won[active[first_set]] = home_won[first_set]
+
+        home_serves_game[active[game_end]] ^= True
+        tiebreak_points[active] = np.where(game_end, 0, played + in_tiebreak)
+
+        next_states = codes >> FLAG_BITS
+        states[active] = next_states
+        active = active[~is_finished[next_states]]
+
+    match_won = home_sets[states] > away_sets[states]
+    return WinProbabilities(
+        game=float(np.mean(game_won == 1)),
+        set=float(np.mean(set_won == 1)),
+        match=float(np.mean(match_won)),
+    )
@@ -0,0 +1,89 @@
+"""Bulk snapshot files for persisting many live scorers at once."""
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from typing import Union
+
+from pytennisscorer.scorer import TennisScorer
+
+# File header: magic, version, number of snapshots; followed by count + 1
+# little-endian uint64 offsets and the concatenated TennisScorer.to_bytes() blobs
+FILE_MAGIC = b"PTSF"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<4sBxxxI")
+
+PathLike = Union[str, os.PathLike[str]]
+
+
+def save_snapshots(path: PathLike, scorers: Iterable[TennisScorer]) -> int:
+    """
+    Write snapshots of many scorers to a single file.
+
+    Args:
+        path: Destination file, overwritten if it exists
+        scorers: Scorers to persist, in order
+
+    Returns:
+        Number of snapshots written
+    """
+    blobs = [scorer.to_bytes() for scorer in scorers]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+
+    with open(path, "wb") as file:
+        file.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, len(blobs)))
+        file.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        file.writelines(blobs)
+    return len(blobs)
+
+
+def load_snapshots(path: PathLike) -> list[TennisScorer]:
+    """
+    Restore every scorer from a file written by ``save_snapshots``.
+
+    The file is memory-mapped and each snapshot is decoded straight from the
+    mapping, without reading the file into an intermediate buffer.
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        Restored scorers, in the order they were saved
+
+    Raises:
+        ValueError: If the file is malformed or from another version
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        view = memoryview(data)
+        try:
+            return _load(view)
+        finally:
+            view.release()
+
+
+def _load(view: memoryview) -> list[TennisScorer]:
+    """Decode the snapshots in a mapped snapshot file."""
+    if len(view) < FILE_HEADER.size:
+        raise ValueError("Truncated snapshot file")
+    magic, version, count = FILE_HEADER.unpack_from(view)
+    if magic != FILE_MAGIC:
+        raise ValueError("Not a snapshot file")
+    if version != FILE_VERSION:
+        raise ValueError(f"Unsupported snapshot file version {version}")
+
+    index = struct.Struct(f"<{count + 1}Q")
+    start = FILE_HEADER.size + index.size
+    if len(view) < start:
+        raise ValueError("Truncated snapshot file")
+    offsets = index.unpack_from(view, FILE_HEADER.size)
+    if start + offsets[-1] != len(view):
+        raise ValueError("Snapshot file length does not match its index")
+
+    scorers = []
+    for begin, end in zip(offsets, offsets[1:]):
+        with view[start + begin : start + end] as blob:
+            scorers.append(TennisScorer.from_bytes(blob))
+    return scorers
@@ -0,0 +1,300 @@
+"""Columnar point-by-point timelines of matches as NumPy arrays."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any, Union
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "pytennisscorer.timeline requires numpy; install with 'pip install pytennisscorer[numpy]'"
+    ) from exc
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import MatchType
+from pytennisscorer.replay import Point, iter_points
+from pytennisscorer.transitions import (
+    FLAG_BITS,
+    FLAG_GAME_END,
+    FLAG_MASK,
+    FLAG_SET_END,
+    FLAG_TIEBREAK_WRAP,
+    compile_transition_table,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pyarrow
+
+# Column names of a timeline, in order; every row describes one point
+COLUMNS = (
+    "match",  # index of the match in the input
+    "point",  # index of the point within its match
+    "home_won",  # whether home won the point
+    "home_points",  # game score after the point (0-4 scale, or tiebreak points)
+    "away_points",
+    "home_games",  # games in the current set after the point
+    "away_games",
+    "home_sets",  # sets won after the point
+    "away_sets",
+    "set_index",  # index of the set the score refers to
+    "tiebreak",  # whether the point was played in a tiebreak
+    "game_end",  # whether the point finished a game
+    "set_end",  # whether the point finished a set
+    "match_end",  # whether the point finished the match
+)
+
+# Point winners of one match: a NumPy array or any feed accepted by replay.iter_points
+Points = Union["npt.NDArray[np.bool_]", Iterable[Point]]
+
+
+@dataclass(frozen=True)
+class PointTimeline:
+    """
+    Per-point columns of one or more matches, concatenated in match order.
+
+    The points of match ``m`` are rows ``offsets[m]:offsets[m + 1]`` of every
+    column. Points after the end of a match are not included.
+    """
+
+    offsets: "npt.NDArray[np.int64]"
+    columns: dict[str, "npt.NDArray[Any]"]
+
+    def __len__(self) -> int:
+        """Total number of points across all matches."""
+        return int(self.offsets[-1])
+
+    @property
+    def num_matches(self) -> int:
+        """Number of matches in the timeline."""
+        return len(self.offsets) - 1
+
+    def match(self, index: int) -> dict[str, "npt.NDArray[Any]"]:
+        """
+        Get the columns of one match.
+
+        Args:
+            index: Index of the match in the input
+
+        Returns:
+            Dictionary of column name to a view of that match's rows
+        """
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return {name: column[start:end] for name, column in self.columns.items()}
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """
+        Convert the timeline to an Arrow table.
+
+        Returns:
+            pyarrow.Table with one column per entry of ``COLUMNS``
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow
+        except ImportError as exc:  # pragma: no cover - exercised only without pyarrow
+            raise ImportError(
+                "PointTimeline.to_arrow requires pyarrow; "
+                "install with 'pip install pytennisscorer[arrow]'"
+            ) from exc
+        return pyarrow.table(self.columns)
+
+
+@dataclass(frozen=True)
+class _TableArrays:
+    """Transition table fields of one match type as NumPy arrays."""
+
+    initial_state: int
+    transitions: "npt.NDArray[np.int64]"
+    home_sets: "npt.NDArray[np.int8]"
+    away_sets: "npt.NDArray[np.int8]"
+    home_games: "npt.NDArray[np.int16]"
+    away_games: "npt.NDArray[np.int16]"
+    home_points: "npt.NDArray[np.int16]"
+    away_points: "npt.NDArray[np.int16]"
+    is_tiebreak: "npt.NDArray[np.bool_]"
+    is_finished: "npt.NDArray[np.bool_]"
+
+
+@cache
+def _table_arrays(match_type: MatchType) -> _TableArrays:
+    """Compile and cache the transition table of a match type as arrays."""
+    table = compile_transition_table(create_match_config(match_type).rules)
+    return _TableArrays(
+        initial_state=table.initial_state,
+        transitions=np.asarray(table.transitions, dtype=np.int64),
+        home_sets=np.asarray(table.home_sets, dtype=np.int8),
+        away_sets=np.asarray(table.away_sets, dtype=np.int8),
+        home_games=np.asarray(table.home_games, dtype=np.int16),
+        away_games=np.asarray(table.away_games, dtype=np.int16),
+        home_points=np.asarray(table.home_points, dtype=np.int16),
+        away_points=np.asarray(table.away_points, dtype=np.int16),
+        is_tiebreak=np.asarray(table.is_tiebreak, dtype=np.bool_),
+        is_finished=np.asarray(table.is_finished, dtype=np.bool_),
+    )
+
+
+def point_array(points: Points) -> "npt.NDArray[np.bool_]":
+    """
+    Convert point winners to a boolean array.
+
+    Args:
+        points: Point winners, as a NumPy array or any feed accepted by
+            ``replay.iter_points``
+
+    Returns:
+        Array with True for each home point, without copying a boolean array
+    """
+    if isinstance(points, np.ndarray):
+        return points.astype(np.bool_, copy=False)
+    return np.fromiter(iter_points(points), dtype=np.bool_)
+
+
+def _score_group(
+    tables: _TableArrays, winners: "npt.NDArray[np.bool_]", lengths: "npt.NDArray[np.int64]"
+) -> tuple["npt.NDArray[Any]", ...]:
+    """
+    Score matches of one match type in lock-step, one NumPy step per point position.
+
+    Args:
+        tables: Transition table arrays of the match type
+        winners: Point winners of shape (matches, longest match), padded with False
+        lengths: Number of points given for each match
+
+    Returns:
+        Tuple of (state after, state before, flags, tiebreak offset after, valid) arrays of
+        shape (matches, longest match); valid is False for padding and for points after
+        the end of a match
+    """
+    num_matches, num_points = winners.shape
+    after = np.zeros((num_matches, num_points), dtype=np.int64)
+    before = np.zeros((num_matches, num_points), dtype=np.int64)
+    flags = np.zeros((num_matches, num_points), dtype=np.int64)
+    offsets = np.zeros((num_matches, num_points), dtype=np.int64)
+    valid = np.zeros((num_matches, num_points), dtype=np.bool_)
+
+    state = np.full(num_matches, tables.initial_state, dtype=np.int64)
+    offset = np.zeros(num_matches, dtype=np.int64)
+    live = np.flatnonzero(lengths > 0)
+    for index in range(num_points):
+        if not len(live):
+            break
+        current = state[live]
+        codes = tables.transitions[current * 2 + ~winners[live, index]]
+        new_state = codes >> FLAG_BITS
+        new_offset = np.where(codes & FLAG_GAME_END, 0, offset[live] + (codes & FLAG_TIEBREAK_WRAP))
+
+        state[live] = new_state
+        offset[live] = new_offset
+        after[live, index] = new_state
+        before[live, index] = current
+        flags[live, index] = codes & FLAG_MASK
+        offsets[live, index] = new_offset
+        valid[live, index] = True
+
+        live = live[~tables.is_finished[new_state] & (lengths[live] > index + 1)]
+
+    return after, before, flags, offsets, valid
+
+
+def point_timelines(matches: Iterable[tuple[MatchType, Points]]) -> PointTimeline:
+    """
+    Build the point-by-point timeline of many matches as NumPy columns.
+
+    Matches of the same match type are scored together through the compiled
+    transition table, one array operation per point position across all of
+    them, so no per-point Python objects are created. Scores are identical to
+    ``TennisScorer``.
+
+    Args:
+        matches: (match type, point winners) records, e.g. a ``PointArchive``
+
+    Returns:
+        PointTimeline with the columns in ``COLUMNS``, in input order
+    """
+    records = [(match_type, point_array(points)) for match_type, points in matches]
+    lengths = np.zeros(len(records), dtype=np.int64)
+    groups: dict[MatchType, list[int]] = {}
+    for index, (match_type, _) in enumerate(records):
+        groups.setdefault(match_type, []).append(index)
+
+    # Score each match type, recording the rows of every match before concatenation
+    group_rows = []
+    for match_type, members in groups.items():
+        points = [records[index][1] for index in members]
+        group_lengths = np.array([len(p) for p in points], dtype=np.int64)
+        winners = np.zeros((len(points), int(group_lengths.max(initial=0))), dtype=np.bool_)
+        for row, match_points in enumerate(points):
+            winners[row, : len(match_points)] = match_points
+
+        tables = _table_arrays(match_type)
+        after, before, flags, offset, valid = _score_group(tables, winners, group_lengths)
+        lengths[members] = valid.sum(axis=1)
+        scored = (winners[valid], after[valid], before[valid], flags[valid], offset[valid])
+        group_rows.append((members, tables, *scored))
+
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    total = int(offsets[-1])
+    columns: dict[str, npt.NDArray[Any]] = {
+        "match": np.repeat(np.arange(len(records), dtype=np.int32), lengths),
+        "point": (np.arange(total, dtype=np.int64) - np.repeat(offsets[:-1], lengths)).astype(
+            np.int32
+        ),
+        "home_won": np.zeros(total, dtype=np.bool_),
+        "home_points": np.zeros(total, dtype=np.int16),
+        "away_points": np.zeros(total, dtype=np.int16),
+        "home_games": np.zeros(total, dtype=np.int16),
+        "away_games": np.zeros(total, dtype=np.int16),
+        "home_sets": np.zeros(total, dtype=np.int8),
+        "away_sets": np.zeros(total, dtype=np.int8),
+        "set_index": np.zeros(total, dtype=np.int8),
+        "tiebreak": np.zeros(total, dtype=np.bool_),
+        "game_end": np.zeros(total, dtype=np.bool_),
+        "set_end": np.zeros(total, dtype=np.bool_),
+        "match_end": np.zeros(total, dtype=np.bool_),
+    }
+
+    for members, tables, winners, after, before, flags, offset in group_rows:
+        # Destination rows of the group's points, in match order
+        member_lengths = lengths[members]
+        starts = np.repeat(offsets[members], member_lengths)
+        first_row = np.repeat(np.cumsum(member_lengths) - member_lengths, member_lengths)
+        rows = starts + np.arange(len(after), dtype=np.int64) - first_row
+
+        finished = tables.is_finished[after]
+        home_sets = tables.home_sets[after]
+        away_sets = tables.away_sets[after]
+        columns["home_won"][rows] = winners
+        columns["home_points"][rows] = tables.home_points[after] + offset
+        columns["away_points"][rows] = tables.away_points[after] + offset
+        columns["home_games"][rows] = tables.home_games[after]
+        columns["away_games"][rows] = tables.away_games[after]
+        columns["home_sets"][rows] = home_sets
+        columns["away_sets"][rows] = away_sets
+        columns["set_index"][rows] = home_sets + away_sets - finished
+        columns["tiebreak"][rows] = tables.is_tiebreak[before]
+        columns["game_end"][rows] = (flags & FLAG_GAME_END) != 0
+        columns["set_end"][rows] = (flags & FLAG_SET_END) != 0
+        columns["match_end"][rows] = finished
+
+    return PointTimeline(offsets=offsets, columns=columns)
+
+
+def point_timeline(match_type: MatchType, points: Points) -> PointTimeline:
+    """
+    Build the point-by-point timeline of one match as NumPy columns.
+
+    Args:
+        match_type: Type of tennis match to score
+        points: Point winners, as a boolean array or any feed accepted by
+            ``replay.iter_points``
+
+    Returns:
+        PointTimeline of the single match
+    """
+    return point_timelines([(match_type, points)])
@@ -0,0 +1,356 @@
+"""Precomputed finite-state transition tables for fast point scoring."""
+
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Literal, Optional
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.formatter import format_game_score
+from pytennisscorer.models import (
+    GameState,
+    MatchState,
+    MatchType,
+    ScoringRules,
+    SetState,
+    intern_game,
+)
+from pytennisscorer.progression import (
+    check_match_complete,
+    is_set_finished,
+    progress_to_next_game,
+    progress_to_next_set,
+)
+from pytennisscorer.scoring import is_game_finished, score_game_point, score_tiebreak_point
+
+# Flags packed into the low bits of every transition entry
+FLAG_TIEBREAK_WRAP = 1  # Tiebreak score was shifted down one point each side (e.g. 7:7 -> 6:6)
+FLAG_GAME_END = 2  # The point finished a game
+FLAG_SET_END = 4  # The point finished a set
+FLAG_BITS = 3
+FLAG_MASK = (1 << FLAG_BITS) - 1
+
+# (home sets, away sets, home games, away games, home points, away points, tiebreak, finished)
+_StateKey = tuple[int, int, int, int, int, int, bool, bool]
+
+
+@dataclass(frozen=True)
+class TransitionTable:
+    """
+    Compiled scoring automaton for one set of scoring rules.
+
+    States are dense integers starting at ``initial_state``. The entry at
+    ``transitions[state * 2 + (0 if is_home else 1)]`` holds the next state
+    shifted left by ``FLAG_BITS`` with ``FLAG_*`` bits in the low bits.
+
+    Tiebreak scores are unbounded, so tiebreak states are normalized once both
+    players reach ``regular_tiebreak_points - 1`` (7:7 is stored as 6:6). The
+    ``FLAG_TIEBREAK_WRAP`` bit tells the caller to add one point to each side
+    when displaying the score.
+    """
+
+    rules: ScoringRules
+    initial_state: int
+    transitions: tuple[int, ...]
+    home_sets: tuple[int, ...]
+    away_sets: tuple[int, ...]
+    home_games: tuple[int, ...]
+    away_games: tuple[int, ...]
+    home_points: tuple[int, ...]
+    away_points: tuple[int, ...]
+    is_tiebreak: tuple[bool, ...]
+    is_finished: tuple[bool, ...]
+    game_score_text: tuple[str, ...]
+    state_index: dict[_StateKey, int] = field(compare=False, repr=False)
+
+    @property
+    def num_states(self) -> int:
+        """Number of distinct states in the table."""
+        return len(self.is_finished)
+
+    def state_of(self, match: MatchState) -> tuple[int, int]:
+        """
+        Find the table state corresponding to a match state.
+
+        Args:
+            match: Match state scored under this table's rules
+
+        Returns:
+            Tuple of (state index, tiebreak display offset)
+
+        Raises:
+            ValueError: If the match state is not reachable under these rules
+        """
+        current_set = match.sets[match.current_set_index]
+        game, offset = _normalize_tiebreak(
+            current_set.current_game, self.rules.regular_tiebreak_points
+        )
+        key = _state_key(
+            match.home_score,
+            match.away_score,
+            SetState(
+                home_score=current_set.home_score,
+                away_score=current_set.away_score,
+                current_game=game,
+                games=(),
+            ),
+            match.is_finished,
+        )
+        state = self.state_index.get(key)
+        if state is None:
+            raise ValueError(f"Match state is not reachable under {self.rules}")
+        return state, offset
+
+
+def _normalize_tiebreak(game: GameState, tiebreak_points: int) -> tuple[GameState, int]:
+    """
+    Shift a long tiebreak back to the first equivalent score.
+
+    Args:
+        game: Tiebreak game state
+        tiebreak_points: Points required to win the tiebreak
+
+    Returns:
+        Tuple of (normalized game, points removed from each side)
+    """
+    shift = min(game.home_score, game.away_score) - (tiebreak_points - 1)
+    if not game.is_tiebreak or shift <= 0:
+        return game, 0
+
+    normalized = intern_game(game.home_score - shift, game.away_score - shift, True)
+    return normalized, shift
+
+
+def _state_key(home_sets: int, away_sets: int, set_state: SetState, finished: bool) -> _StateKey:
+    """Build the hashable key identifying a scoring state."""
+    game = set_state.current_game
+    return (
+        home_sets,
+        away_sets,
+        set_state.home_score,
+        set_state.away_score,
+        game.home_score,
+        game.away_score,
+        game.is_tiebreak,
+        finished,
+    )
+
+
+@cache
+def compile_transition_table(rules: ScoringRules) -> TransitionTable:
+    """
+    Compile scoring rules into a transition table.
+
+    Every reachable state is enumerated once by applying the functions in
+    ``scoring`` and ``progression``, so the table scores exactly like
+    ``TennisScorer``. Tables are cached per ``ScoringRules``.
+
+    Args:
+        rules: Scoring rules for the match
+
+    Returns:
+        TransitionTable covering every reachable match state
+    """
+    tiebreak_points = rules.regular_tiebreak_points
+    final_set_index = rules.best_of - 1
+
+    initial_set = progress_to_next_set(deciding_point=rules.deciding_point)
+    initial_key = _state_key(0, 0, initial_set, False)
+
+    index: dict[_StateKey, int] = {initial_key: 0}
+    keys: list[_StateKey] = [initial_key]
+    transitions: list[int] = []
+    queue: deque[tuple[int, int, SetState, bool]] = deque([(0, 0, initial_set, False)])
+
+    def intern(home_sets: int, away_sets: int, set_state: SetState, finished: bool) -> int:
+        key = _state_key(home_sets, away_sets, set_state, finished)
+        state = index.get(key)
+        if state is None:
+            state = len(keys)
+            index[key] = state
+            keys.append(key)
+            queue.append((home_sets, away_sets, set_state, finished))
+        return state
+
+    while queue:
+        home_sets, away_sets, set_state, finished = queue.popleft()
+        state = len(transitions) // 2
+
+        for is_home in (True, False):
+            if finished:
+                transitions.append(state << FLAG_BITS)
+                continue
+
+            game = set_state.current_game
+            if game.is_tiebreak:
+                new_game = score_tiebreak_point(game, is_home, tiebreak_points=tiebreak_points)
+                game_finished = is_game_finished(
+                    new_game, deciding_point=False, tiebreak_points=tiebreak_points
+                )
+            else:
+                new_game = score_game_point(game, is_home, deciding_point=rules.deciding_point)
+                game_finished = is_game_finished(new_game, deciding_point=rules.deciding_point)
+
+            flags = 0
+            new_home_sets, new_away_sets, new_finished = home_sets, away_sets, False
+
+            if not game_finished:
+                new_game, wrapped = _normalize_tiebreak(new_game, tiebreak_points)
+                if wrapped:
+                    flags |= FLAG_TIEBREAK_WRAP
+                new_set = SetState(
+                    home_score=set_state.home_score,
+                    away_score=set_state.away_score,
+                    current_game=new_game,
+                    games=[],
+                )
+            else:
+                flags |= FLAG_GAME_END
+                home_won_game = new_game.home_score > new_game.away_score
+                new_set = progress_to_next_game(
+                    set_state, home_won_game, deciding_point=rules.deciding_point
+                )
+                new_set = SetState(
+                    home_score=new_set.home_score,
+                    away_score=new_set.away_score,
+                    current_game=new_set.current_game,
+                    games=[],
+                )
+
+                is_final_set = home_sets + away_sets == final_set_index
+                if is_set_finished(new_set, rules, is_final_set):
+                    flags |= FLAG_SET_END
+                    if new_set.home_score > new_set.away_score:
+                        new_home_sets += 1
+                    else:
+                        new_away_sets += 1
+                    new_finished = check_match_complete(new_home_sets, new_away_sets, rules)
+                    if not new_finished:
+                        new_set = progress_to_next_set(deciding_point=rules.deciding_point)
+
+            next_state = intern(new_home_sets, new_away_sets, new_set, new_finished)
+            transitions.append(next_state << FLAG_BITS | flags)
+
+    game_score_text = tuple(
+        format_game_score(GameState(home_score=k[4], away_score=k[5], is_tiebreak=k[6]))
+        for k in keys
+    )
+
+    return TransitionTable(
+        rules=rules,
+        initial_state=0,
+        transitions=tuple(transitions),
+        home_sets=tuple(k[0] for k in keys),
+        away_sets=tuple(k[1] for k in keys),
+        home_games=tuple(k[2] for k in keys),
+        away_games=tuple(k[3] for k in keys),
+        home_points=tuple(k[4] for k in keys),
+        away_points=tuple(k[5] for k in keys),
+        is_tiebreak=tuple(k[6] for k in keys),
+        is_finished=tuple(k[7] for k in keys),
+        game_score_text=game_score_text,
+        state_index=index,
+    )
+
+
+class TableScorer:
+    """
+    Tennis scorer driven by a precomputed transition table.
+
+    Scores exactly like ``TennisScorer`` but each point is a single table
+    lookup. Only the score is tracked, not per-game history or undo.
+    """
+
+    def __init__(self, match_type: MatchType) -> None:
+        """
+        Initialize a table-driven scorer with a specific match type.
+
+        Args:
+            match_type: Type of tennis match to score
+        """
+        table = compile_transition_table(create_match_config(match_type).rules)
+        self._table = table
+        self._transitions = table.transitions
+        self._state = table.initial_state
+        self._tiebreak_offset = 0
+        self._finished_sets: list[tuple[int, int]] = []
+        self._finished_text: list[str] = []
+
+    @property
+    def state(self) -> int:
+        """Current state index in the transition table."""
+        return self._state
+
+    def increase_score(self, is_home: bool) -> None:
+        """
+        Score a point for the specified player.
+
+        Args:
+            is_home: True to score for home player, False for away player
+        """
+        state = self._state
+        code = self._transitions[state * 2 + (0 if is_home else 1)]
+        self._state = code >> FLAG_BITS
+
+        if code & FLAG_MASK:
+            if code & FLAG_TIEBREAK_WRAP:
+                self._tiebreak_offset += 1
+            if code & FLAG_GAME_END:
+                self._tiebreak_offset = 0
+            if code & FLAG_SET_END:
+                table = self._table
+                home_games = table.home_games[state] + (1 if is_home else 0)
+                away_games = table.away_games[state] + (0 if is_home else 1)
+                self._finished_sets.append((home_games, away_games))
+                self._finished_text.append(f"{home_games}:{away_games}")
+
+    def get_score(self) -> str:
+        """
+        Get the current match score in tennis notation.
+
+        Returns:
+            Score string (e.g., "6:4;3:6;2:2-30:15")
+        """
+        table = self._table
+        state = self._state
+
+        if table.is_finished[state]:
+            return ";".join(self._finished_text)
+
+        set_score = f"{table.home_games[state]}:{table.away_games[state]}"
+        if table.is_tiebreak[state] and self._tiebreak_offset:
+            offset = self._tiebreak_offset
+            game_score = f"{table.home_points[state] + offset}:{table.away_points[state] + offset}"
+        else:
+            game_score = table.game_score_text[state]
+
+        return ";".join([*self._finished_text, set_score]) + f"-{game_score}"
+
+    def get_set_scores(self) -> list[tuple[int, int]]:
+        """
+        Get the games score of every set played so far.
+
+        Returns:
+            List of (home games, away games), including the current set
+        """
+        table = self._table
+        state = self._state
+        if table.is_finished[state]:
+            return list(self._finished_sets)
+        return [*self._finished_sets, (table.home_games[state], table.away_games[state])]
+
+    def get_winner(self) -> Optional[Literal["home", "away"]]:
+        """
+        Get the winner of the match.
+
+        Returns:
+            "home" if home won, "away" if away won, None if match not finished
+        """
+        table = self._table
+        state = self._state
+        if not table.is_finished[state]:
+            return None
+
+        if table.home_sets[state] > table.away_sets[state]:
+            return "home"
+        return "away"
@@ -0,0 +1,10 @@
+"""Shared closed-form probabilities for the probability and simulation tests."""
+
+
+def game_win_probability(p: float, deciding_point: bool) -> float:
+    """Closed-form probability that the server wins a game from 0-0."""
+    q = 1 - p
+    before_deuce = p**4 * (1 + 4 * q + 10 * q**2)
+    reach_deuce = 20 * p**3 * q**3
+    from_deuce = p if deciding_point else p**2 / (1 - 2 * p * q)
+    return before_deuce + reach_deuce * from_deuce
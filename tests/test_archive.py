@@ -0,0 +1,112 @@
+"""Tests for the memory-mapped point archive."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from pytennisscorer.archive import PointArchive, write_archive
+from pytennisscorer.bulk import bulk_score, score_match
+from pytennisscorer.models import MatchType
+from pytennisscorer.replay import replay
+
+
+def _records(count: int, seed: int = 0) -> list[tuple[MatchType, list[bool]]]:
+    rng = random.Random(seed)
+    match_types = list(MatchType)
+    return [
+        (match_types[i % len(match_types)], [rng.random() < 0.5 for _ in range(rng.randrange(300))])
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+def test_round_trip_points_and_types(tmp_path: Path) -> None:
+    """Test that every match reads back with its type and points."""
+    records = _records(50)
+    path = tmp_path / "points.archive"
+    assert write_archive(path, records) == len(records)
+
+    with PointArchive(path) as archive:
+        assert len(archive) == len(records)
+        for match_id, (match_type, points) in enumerate(records):
+            assert archive.match_type(match_id) == match_type
+            assert archive.num_points(match_id) == len(points)
+            assert archive.points(match_id) == points
+        assert list(archive) == records
+
+
+@pytest.mark.unit
+def test_points_are_bit_packed(tmp_path: Path) -> None:
+    """Test that the data column takes one bit per point."""
+    path = tmp_path / "points.archive"
+    write_archive(path, [(MatchType.SINGLES_GRANDSLAM, "HA" * 400)])
+    assert path.stat().st_size < 800 // 8 + 64
+
+
+@pytest.mark.unit
+def test_long_match_round_trip(tmp_path: Path) -> None:
+    """Test packing a match far longer than any real one, with a partial last byte."""
+    rng = random.Random(7)
+    points = [rng.random() < 0.5 for _ in range(200_003)]
+    path = tmp_path / "points.archive"
+    write_archive(path, [(MatchType.SINGLES_GRANDSLAM, points)])
+
+    with PointArchive(path) as archive:
+        assert archive.points(0) == points
+
+
+@pytest.mark.unit
+def test_replay_and_score_by_id(tmp_path: Path) -> None:
+    """Test replaying and scoring individual matches straight from the archive."""
+    records = _records(10, seed=1)
+    path = tmp_path / "points.archive"
+    write_archive(
+        path,
+        [
+            (match_type, "".join("H" if p else "A" for p in points))
+            for match_type, points in records
+        ],
+    )
+
+    with PointArchive(path) as archive:
+        match_type, points = records[7]
+        assert list(archive.replay(7)) == list(replay(match_type, points))
+        assert archive.score(7) == score_match(match_type, points)
+        assert bulk_score(archive, workers=1) == [score_match(t, p) for t, p in records]
+
+
+@pytest.mark.unit
+def test_empty_archive(tmp_path: Path) -> None:
+    """Test an archive without matches."""
+    path = tmp_path / "empty.archive"
+    write_archive(path, [])
+    with PointArchive(path) as archive:
+        assert len(archive) == 0
+        assert list(archive) == []
+
+
+@pytest.mark.unit
+def test_invalid_match_id_and_files(tmp_path: Path) -> None:
+    """Test out-of-range ids and rejection of malformed files."""
+    path = tmp_path / "points.archive"
+    write_archive(path, _records(3))
+    with PointArchive(path) as archive:
+        with pytest.raises(IndexError):
+            archive.points(3)
+        with pytest.raises(IndexError):
+            archive.match_type(-1)
+
+    data = path.read_bytes()
+    path.write_bytes(data[:-1])
+    with pytest.raises(ValueError, match="length"):
+        PointArchive(path)
+    path.write_bytes(b"XXXX" + data[4:])
+    with pytest.raises(ValueError, match="Not a point archive"):
+        PointArchive(path)
+    path.write_bytes(data[:4] + b"\x02" + data[5:])
+    with pytest.raises(ValueError, match="version"):
+        PointArchive(path)
+    path.write_bytes(data[:8])
+    with pytest.raises(ValueError, match="Truncated"):
+        PointArchive(path)
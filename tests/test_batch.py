@@ -0,0 +1,78 @@
+"""Tests for the vectorized batch scorer."""
+
+import random
+
+import pytest
+
+from pytennisscorer.models import MatchType
+from pytennisscorer.scorer import TennisScorer
+
+np = pytest.importorskip("numpy")
+
+from pytennisscorer.batch import BatchScorer  # noqa: E402
+
+
+@pytest.mark.unit
+def test_batch_scorer_initial_scores() -> None:
+    """Test that all matches in a new batch start at 0:0-0:0."""
+    batch = BatchScorer(MatchType.DOUBLES_DAVISCUP, 3)
+    assert len(batch) == 3
+    assert batch.get_scores() == ["0:0-0:0"] * 3
+    assert batch.get_winners() == [None, None, None]
+
+
+@pytest.mark.unit
+def test_batch_scorer_rejects_wrong_shape() -> None:
+    """Test that a winners array of the wrong length is rejected."""
+    batch = BatchScorer(MatchType.DOUBLES_DAVISCUP, 3)
+    with pytest.raises(ValueError):
+        batch.increase_score([True, False])
+
+
+@pytest.mark.unit
+def test_batch_scorer_active_mask_skips_matches() -> None:
+    """Test that inactive matches are left unchanged."""
+    batch = BatchScorer(MatchType.DOUBLES_DAVISCUP, 2)
+    batch.increase_score([True, True], active=[True, False])
+    assert batch.get_scores() == ["0:0-15:0", "0:0-0:0"]
+
+
+@pytest.mark.unit
+def test_batch_scorer_exposes_struct_of_arrays() -> None:
+    """Test the per-field array views of the batch."""
+    batch = BatchScorer(MatchType.DOUBLES_DAVISCUP, 2)
+    points = np.zeros((24, 2), dtype=bool)
+    points[:, 0] = True
+    points[:12, 1] = True
+    batch.apply_points(points)
+    batch.increase_score([False, True])
+
+    assert batch.set_index.tolist() == [1, 0]
+    assert batch.home_games.tolist() == [0, 3]
+    assert batch.away_games.tolist() == [0, 3]
+    assert batch.home_points.tolist() == [0, 1]
+    assert batch.away_points.tolist() == [1, 0]
+    assert batch.set_scores[0, 0].tolist() == [6, 0]
+    assert batch.is_finished.tolist() == [False, False]
+    assert batch.is_tiebreak.tolist() == [False, False]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("match_type", list(MatchType))
+def test_batch_scorer_matches_tennis_scorer(match_type: MatchType) -> None:
+    """Test that every match in a batch agrees with TennisScorer."""
+    rng = random.Random(match_type.value)
+    num_matches = 16
+    references = [TennisScorer(match_type) for _ in range(num_matches)]
+    biases = [rng.uniform(0.3, 0.7) for _ in range(num_matches)]
+    batch = BatchScorer(match_type, num_matches)
+
+    while not batch.is_finished.all():
+        winners = [rng.random() < bias for bias in biases]
+        for scorer, is_home in zip(references, winners):
+            scorer.increase_score(is_home)
+        batch.increase_score(winners)
+
+        assert batch.get_scores() == [scorer.get_score() for scorer in references]
+
+    assert batch.get_winners() == [scorer.get_winner() for scorer in references]
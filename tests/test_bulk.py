@@ -0,0 +1,67 @@
+"""Tests for multi-process bulk scoring."""
+
+import random
+
+import pytest
+
+from pytennisscorer import bulk
+from pytennisscorer.bulk import MatchResult, bulk_score, score_match
+from pytennisscorer.models import MatchType
+from pytennisscorer.scorer import TennisScorer
+
+
+def _random_records(count: int) -> list[tuple[MatchType, str]]:
+    """Build random (match_type, points) records."""
+    rng = random.Random(count)
+    match_types = list(MatchType)
+    return [
+        (rng.choice(match_types), "".join(rng.choice("HA") for _ in range(400)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.unit
+def test_score_match_returns_final_result() -> None:
+    """Test scoring a single complete match."""
+    result = score_match(MatchType.DOUBLES_DAVISCUP, "H" * 48 + "A" * 8)
+    assert result == MatchResult(score="6:0;6:0", winner="home", sets=((6, 0), (6, 0)))
+
+
+@pytest.mark.unit
+def test_score_match_unfinished() -> None:
+    """Test that unfinished matches report no winner."""
+    result = score_match(MatchType.DOUBLES_DAVISCUP, "HHHHA")
+    assert result == MatchResult(score="1:0-0:15", winner=None, sets=((1, 0),))
+
+
+@pytest.mark.unit
+def test_bulk_score_in_process_matches_tennis_scorer() -> None:
+    """Test that small inputs are scored in-process and agree with TennisScorer."""
+    records = _random_records(20)
+    results = bulk_score(records, workers=4)
+
+    for (match_type, points), result in zip(records, results):
+        scorer = TennisScorer(match_type)
+        for char in points:
+            scorer.increase_score(char == "H")
+        assert result.score == scorer.get_score()
+        assert result.winner == scorer.get_winner()
+
+
+@pytest.mark.unit
+def test_bulk_score_rejects_invalid_arguments() -> None:
+    """Test that non-positive workers and chunk sizes are rejected."""
+    with pytest.raises(ValueError):
+        bulk_score([], workers=0)
+    with pytest.raises(ValueError):
+        bulk_score([], workers=2, chunk_size=0)
+
+
+@pytest.mark.integration
+def test_bulk_score_process_pool_preserves_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the process pool returns results in input order."""
+    monkeypatch.setattr(bulk, "MIN_PARALLEL_MATCHES", 0)
+    records = _random_records(30)
+
+    assert bulk_score(records, workers=2, chunk_size=7) == bulk_score(records, workers=1)
+    assert bulk_score(records, workers=2) == bulk_score(records, workers=1)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from pytennisscorer.configs import create_match_config
+from pytennisscorer.configs import MATCH_CONFIGS, create_match_config
 from pytennisscorer.models import MatchType
 
 
@@ -77,12 +77,30 @@ def test_config_creates_initial_match_state() -> None:
 
 
 @pytest.mark.unit
-def test_config_creates_correct_number_of_sets() -> None:
-    """Test that configs create the correct number of sets."""
-    # Best of 5
+def test_config_creates_only_the_first_set() -> None:
+    """Test that configs start with one set and later sets are added when reached."""
     config_bo5 = create_match_config(MatchType.SINGLES_GRANDSLAM)
-    assert len(config_bo5.initial_state.sets) == 5
+    assert len(config_bo5.initial_state.sets) == 1
+    assert config_bo5.rules.best_of == 5
 
-    # Best of 3
     config_bo3 = create_match_config(MatchType.DOUBLES_DAVISCUP)
-    assert len(config_bo3.initial_state.sets) == 3
+    assert len(config_bo3.initial_state.sets) == 1
+    assert config_bo3.rules.best_of == 3
+
+
+@pytest.mark.unit
+def test_configs_are_shared_per_match_type() -> None:
+    """Test that repeated lookups return the same immutable config."""
+    first = create_match_config(MatchType.SINGLES_GRANDSLAM)
+    second = create_match_config(MatchType.SINGLES_GRANDSLAM)
+
+    assert first is second
+    assert first.initial_state is second.initial_state
+    assert set(MATCH_CONFIGS) == set(MatchType)
+
+
+@pytest.mark.unit
+def test_unknown_match_type_raises() -> None:
+    """Test that an unknown match type is rejected."""
+    with pytest.raises(ValueError):
+        create_match_config("UNKNOWN")  # type: ignore[arg-type]
@@ -1,9 +1,18 @@
 """Tests for score formatting and parsing."""
 
+import random
+
 import pytest
 
-from pytennisscorer.formatter import format_game_score, format_match_score
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.formatter import (
+    format_game_score,
+    format_match_score,
+    format_set_score,
+    parse_match_score,
+)
 from pytennisscorer.models import GameState, MatchState, MatchType, ScoringRules, SetState
+from pytennisscorer.progression import score_match_point
 
 
 @pytest.mark.unit
@@ -169,3 +178,74 @@ def test_format_match_score_finished_match() -> None:
 
     # Finished match shows only set scores
     assert format_match_score(match) == "6:4;6:2"
+
+
+@pytest.mark.unit
+def test_format_set_score() -> None:
+    """Test formatting the games score of a set."""
+    game = GameState(home_score=0, away_score=0, is_tiebreak=False)
+    set_state = SetState(home_score=6, away_score=4, current_game=game, games=[])
+    assert format_set_score(set_state) == "6:4"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("match_type", list(MatchType))
+def test_parse_match_score_round_trips_every_point(match_type: MatchType) -> None:
+    """Test that every formatted score parses back to the same score."""
+    rng = random.Random(7)
+    state = create_match_config(match_type).initial_state
+    while not state.is_finished:
+        state = score_match_point(state, rng.random() < 0.5)
+        text = format_match_score(state)
+        parsed = parse_match_score(text, match_type)
+        assert format_match_score(parsed) == text
+        assert parsed.is_finished == state.is_finished
+        assert parsed.current_set_index == state.current_set_index
+        assert (parsed.home_score, parsed.away_score) == (state.home_score, state.away_score)
+        assert [s.current_game for s in parsed.sets] == [s.current_game for s in state.sets]
+
+
+@pytest.mark.unit
+def test_parse_match_score_tiebreak_and_advantage() -> None:
+    """Test parsing tiebreak and advantage game scores."""
+    tiebreak = parse_match_score("6:4;6:6-9:8", MatchType.SINGLES_GRANDSLAM)
+    assert tiebreak.sets[1].current_game == GameState(home_score=9, away_score=8, is_tiebreak=True)
+    advantage = parse_match_score("2:3-40:Ad", MatchType.SINGLES_GRANDSLAM)
+    assert advantage.sets[0].current_game == GameState(
+        home_score=3, away_score=4, is_tiebreak=False
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "score",
+    [
+        "",
+        "6:4;3",
+        "6:4;a:b-0:0",
+        "6:4;3:2-15:20",
+        "6:4;3:2",
+        "6:4;6:4-0:0",
+        "7:3-0:0",
+        "8:6;0:0-0:0",
+        "5:4;0:0-0:0",
+        "6:4;6:4;6:4;0:0-0:0",
+        "6:4;6:4;6:4;6:4",
+        "6:4;6:4;1:0;1:0;1:0;1:0-0:0",
+        "1:1-Ad:15",
+        "1:1-Ad:Ad",
+        "6:6-7:5",
+        "1:1-0:0-0:0",
+    ],
+)
+def test_parse_match_score_rejects_impossible_scores(score: str) -> None:
+    """Test that malformed and unreachable scores raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid score"):
+        parse_match_score(score, MatchType.SINGLES_GRANDSLAM)
+
+
+@pytest.mark.unit
+def test_parse_match_score_deciding_point_has_no_advantage() -> None:
+    """Test that advantage scores are rejected under the deciding point rule."""
+    with pytest.raises(ValueError, match="impossible game score"):
+        parse_match_score("1:1-Ad:40", MatchType.DOUBLES_ATPTOUR)
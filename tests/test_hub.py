@@ -0,0 +1,136 @@
+"""Tests for the asyncio live scoring hub."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+
+import pytest
+
+from pytennisscorer.hub import PointEvent, ScoringHub
+from pytennisscorer.models import MatchType
+
+
+async def _source(events: Iterable[PointEvent]) -> AsyncIterator[PointEvent]:
+    """In-memory event source that yields control between events."""
+    for event in events:
+        yield event
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+def test_subscriber_receives_every_score_when_keeping_up() -> None:
+    """Test that a fast subscriber sees each score change in order."""
+
+    async def scenario() -> list[str]:
+        hub = ScoringHub()
+        hub.add_match("court-1", MatchType.DOUBLES_DAVISCUP)
+        subscription = hub.subscribe("court-1")
+        received: list[str] = []
+
+        async def consume() -> None:
+            async for score in subscription:
+                received.append(score)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        events = [PointEvent("court-1", is_home=True)] * 2 + [PointEvent("court-1", undo=True)]
+        await hub.run(_source(events))
+        await asyncio.sleep(0)
+        hub.close()
+        await consumer
+        return received
+
+    assert asyncio.run(scenario()) == ["0:0-0:0", "0:0-15:0", "0:0-30:0", "0:0-15:0"]
+
+
+@pytest.mark.unit
+def test_subscription_made_before_the_loop_starts() -> None:
+    """Test waiting on a subscription created outside the event loop that reads it."""
+    hub = ScoringHub()
+    hub.add_match("court-1", MatchType.DOUBLES_DAVISCUP)
+    subscription = hub.subscribe("court-1")
+
+    async def scenario() -> list[str]:
+        received = [await subscription.__anext__()]
+        waiter = asyncio.create_task(subscription.__anext__())
+        await asyncio.sleep(0)
+        hub.apply(PointEvent("court-1", is_home=True))
+        received.append(await waiter)
+        return received
+
+    assert asyncio.run(scenario()) == ["0:0-0:0", "0:0-15:0"]
+
+
+@pytest.mark.unit
+def test_slow_subscriber_gets_latest_score_only() -> None:
+    """Test that scores published while a consumer is busy are coalesced."""
+
+    async def scenario() -> tuple[str, str]:
+        hub = ScoringHub()
+        hub.add_match("court-1", MatchType.DOUBLES_DAVISCUP)
+        subscription = hub.subscribe("court-1")
+        first = await subscription.__anext__()
+        for _ in range(5):
+            hub.apply(PointEvent("court-1", is_home=False))
+        latest = await subscription.__anext__()
+        subscription.close()
+        assert [score async for score in subscription] == []
+        return first, latest
+
+    assert asyncio.run(scenario()) == ("0:0-0:0", "0:1-0:15")
+
+
+@pytest.mark.unit
+def test_matches_are_independent() -> None:
+    """Test that events only notify subscribers of their own match."""
+
+    async def scenario() -> list[str]:
+        hub = ScoringHub()
+        hub.add_match("a", MatchType.DOUBLES_DAVISCUP)
+        hub.add_match("b", MatchType.SINGLES_GRANDSLAM)
+        subscription = hub.subscribe("b")
+        await subscription.__anext__()
+        await hub.run(_source([PointEvent("a", is_home=True)] * 4))
+        hub.remove_match("b")
+        assert hub.get_score("a") == "1:0-0:0"
+        assert "b" not in hub and len(hub) == 1
+        return [score async for score in subscription]
+
+    assert asyncio.run(scenario()) == []
+
+
+@pytest.mark.unit
+def test_finished_match_and_failed_undo_do_not_notify() -> None:
+    """Test that events which do not change the score publish nothing."""
+
+    async def scenario() -> None:
+        hub = ScoringHub()
+        hub.add_match("court-1", MatchType.DOUBLES_DAVISCUP)
+        for _ in range(48):
+            hub.apply(PointEvent("court-1", is_home=True))
+        subscription = hub.subscribe("court-1")
+        assert await subscription.__anext__() == "6:0;6:0"
+        hub.apply(PointEvent("court-1", is_home=False))
+        hub.remove_match("court-1")
+        assert [score async for score in subscription] == []
+
+        hub.add_match("court-2", MatchType.DOUBLES_DAVISCUP)
+        subscription = hub.subscribe("court-2")
+        await subscription.__anext__()
+        assert hub.apply(PointEvent("court-2", undo=True)) == "0:0-0:0"
+        hub.close()
+        assert [score async for score in subscription] == []
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.unit
+def test_unknown_and_duplicate_matches_raise() -> None:
+    """Test errors for unknown and duplicate match ids."""
+    hub = ScoringHub()
+    hub.add_match("court-1", MatchType.DOUBLES_DAVISCUP)
+    with pytest.raises(ValueError, match="already exists"):
+        hub.add_match("court-1", MatchType.DOUBLES_DAVISCUP)
+    with pytest.raises(ValueError, match="Unknown match"):
+        hub.apply(PointEvent("court-2", is_home=True))
+    with pytest.raises(ValueError, match="Unknown match"):
+        hub.remove_match("court-2")
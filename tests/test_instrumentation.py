@@ -0,0 +1,79 @@
+"""Tests for scorer instrumentation."""
+
+import random
+
+import pytest
+
+from pytennisscorer.instrumentation import STAGES, ScoringStats
+from pytennisscorer.models import MatchType
+from pytennisscorer.scorer import TennisScorer
+
+
+def _tiebreak_set() -> list[bool]:
+    """Points for a set won 7:6 by home through a tiebreak."""
+    return [game % 2 == 0 for game in range(12) for _ in range(4)] + [True] * 7
+
+
+@pytest.mark.unit
+def test_counters_track_points_games_sets_and_tiebreaks() -> None:
+    """Test the counters over two sets, one with a tiebreak, and undos."""
+    stats = ScoringStats()
+    scorer = TennisScorer(MatchType.SINGLES_ATP_FINALS, stats=stats)
+    assert scorer.stats is stats
+
+    scorer.apply_points(_tiebreak_set())
+    for _ in range(24):
+        scorer.increase_score(is_home=True)
+    assert scorer.get_winner() == "home"
+    scorer.increase_score(is_home=False)  # ignored, match finished
+    scorer.apply_points([False, True])  # ignored, match finished
+    assert scorer.undo()
+
+    snapshot = stats.snapshot()
+    assert snapshot.points == 48 + 7 + 24
+    assert snapshot.games == 13 + 6
+    assert snapshot.sets == 2
+    assert snapshot.tiebreaks == 1
+    assert snapshot.undos == 1
+    assert snapshot.stage_ns == dict.fromkeys(STAGES, 0)
+    assert snapshot.stage_calls["point"] == snapshot.points
+
+
+@pytest.mark.unit
+def test_timing_records_every_stage() -> None:
+    """Test that timing mode records nanoseconds for every stage."""
+    stats = ScoringStats(timing=True)
+    assert stats.timing
+    scorer = TennisScorer(MatchType.DOUBLES_DAVISCUP, stats=stats)
+    for _ in range(8):
+        scorer.increase_score(is_home=True)
+        scorer.get_score()
+    scorer.get_score()  # cached, not timed again
+
+    snapshot = stats.snapshot()
+    assert snapshot.stage_calls == {"point": 8, "game_check": 8, "progression": 8, "format": 8}
+    assert all(snapshot.stage_ns[stage] > 0 for stage in STAGES)
+
+    stats.reset()
+    assert stats.snapshot().points == 0
+    assert stats.snapshot().stage_ns == dict.fromkeys(STAGES, 0)
+
+
+@pytest.mark.unit
+def test_instrumented_scorer_matches_plain_scorer() -> None:
+    """Test that instrumentation does not change scoring, and collectors can be shared."""
+    rng = random.Random(17)
+    stats = ScoringStats(timing=True)
+    plain = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+    instrumented = [TennisScorer(MatchType.SINGLES_GRANDSLAM, stats=stats) for _ in range(2)]
+    assert plain.stats is None
+
+    points = 0
+    while plain.get_winner() is None:
+        is_home = rng.random() < 0.5
+        plain.increase_score(is_home)
+        for scorer in instrumented:
+            scorer.increase_score(is_home)
+            assert scorer.state == plain.state
+        points += 1
+    assert stats.snapshot().points == 2 * points
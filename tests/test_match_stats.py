@@ -0,0 +1,127 @@
+"""Tests for incremental match statistics."""
+
+import random
+from typing import Optional
+
+import pytest
+
+from pytennisscorer.match_stats import MatchStats, MatchStatsTracker, PlayerMatchStats
+from pytennisscorer.models import MatchType
+from pytennisscorer.scorer import TennisScorer
+
+
+def _reference_stats(
+    match_type: MatchType, points: list[bool], home_serves_first: bool
+) -> MatchStats:
+    """Statistics of a fresh scorer that scored the points without undo."""
+    tracker = MatchStatsTracker(home_serves_first)
+    scorer = TennisScorer(match_type, tracker=tracker)
+    for is_home in points:
+        scorer.increase_score(is_home)
+    return tracker.snapshot()
+
+
+@pytest.mark.unit
+def test_counts_points_games_holds_breaks_and_deuce() -> None:
+    """Test statistics over a hold to love, a deuce game break and a streak."""
+    tracker = MatchStatsTracker(home_serves_first=True)
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM, tracker=tracker)
+    assert scorer.tracker is tracker
+    assert tracker.home_serving is True
+
+    # Home holds to love, then away serves and is broken after two deuces
+    for is_home in [True] * 4 + [False, False, True, True, False, True, True, False, True, True]:
+        scorer.increase_score(is_home)
+    assert scorer.get_score() == "2:0-0:0"
+    assert tracker.home_serving is True
+
+    stats = tracker.snapshot()
+    assert stats.home == PlayerMatchStats(
+        points_won=10,
+        games_won=2,
+        tiebreaks_won=0,
+        service_games_held=1,
+        breaks_of_serve=1,
+        deciding_points_won=0,
+        longest_point_streak=4,
+    )
+    assert stats.away.points_won == 4
+    assert stats.away.longest_point_streak == 2
+    assert stats.deuce_games == 1
+    assert stats.deciding_points_played == 0
+    assert stats.tiebreaks_played == 0
+
+
+@pytest.mark.unit
+def test_counts_tiebreaks_and_deciding_points() -> None:
+    """Test tiebreak and deciding point statistics without a known server."""
+    tracker = MatchStatsTracker()
+    scorer = TennisScorer(MatchType.DOUBLES_ATPTOUR, tracker=tracker)
+    assert tracker.home_serving is None
+
+    # A deciding point won by away, then games traded to a tiebreak won by home
+    scorer.apply_points([True, False] * 3 + [False])
+    scorer.apply_points([game % 2 == 0 for game in range(11) for _ in range(4)] + [True] * 7)
+    assert scorer.get_score() == "7:6;0:0-0:0"
+
+    stats = tracker.snapshot()
+    assert stats.deciding_points_played == 1
+    assert stats.away.deciding_points_won == 1
+    assert stats.deuce_games == 1
+    assert stats.tiebreaks_played == 1
+    assert stats.home.tiebreaks_won == 1
+    assert stats.home.games_won == 7
+    assert stats.away.games_won == 6
+    assert stats.home.service_games_held == stats.home.breaks_of_serve == 0
+
+
+@pytest.mark.unit
+def test_tracker_attaches_to_one_scorer() -> None:
+    """Test that a tracker cannot be shared between scorers."""
+    tracker = MatchStatsTracker()
+    TennisScorer(MatchType.SINGLES_GRANDSLAM, tracker=tracker)
+    with pytest.raises(ValueError, match="already attached"):
+        TennisScorer(MatchType.SINGLES_GRANDSLAM, tracker=tracker)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_undo", [None, 20])
+def test_statistics_stay_consistent_under_undo_and_seek(max_undo: Optional[int]) -> None:
+    """Test random points, undos, redos and seeks against a reference replay."""
+    rng = random.Random(5)
+    match_type = MatchType.DOUBLES_ATPTOUR
+    tracker = MatchStatsTracker(home_serves_first=False)
+    scorer = TennisScorer(match_type, max_undo=max_undo, tracker=tracker)
+    points: list[bool] = []
+    position = 0
+
+    for _ in range(600):
+        action = rng.random()
+        if action < 0.15:
+            if scorer.undo():
+                position -= 1
+        elif action < 0.2:
+            if scorer.redo():
+                position += 1
+        elif action < 0.25:
+            first, last = scorer.seek_range
+            position = rng.randint(first, last)
+            scorer.seek(position)
+        elif not scorer.state.is_finished:
+            is_home = rng.random() < 0.55
+            scorer.increase_score(is_home)
+            del points[position:]
+            points.append(is_home)
+            position += 1
+        assert tracker.snapshot() == _reference_stats(match_type, points[:position], False)
+
+
+@pytest.mark.unit
+def test_apply_points_records_every_point() -> None:
+    """Test that apply_points with a tracker matches scoring point by point."""
+    rng = random.Random(9)
+    points = [rng.random() < 0.5 for _ in range(300)]
+    tracker = MatchStatsTracker(home_serves_first=True)
+    TennisScorer(MatchType.SINGLES_GRANDSLAM, tracker=tracker).apply_points(points)
+
+    assert tracker.snapshot() == _reference_stats(MatchType.SINGLES_GRANDSLAM, points, True)
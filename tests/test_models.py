@@ -1,8 +1,21 @@
 """Tests for core data models."""
 
+import copy
+import pickle
+
 import pytest
 
-from pytennisscorer.models import GameState, MatchState, MatchType, ScoringRules, SetState
+from pytennisscorer.models import (
+    TIEBREAK_CACHE_SIZE,
+    GameHistory,
+    GameState,
+    MatchState,
+    MatchType,
+    ScoringRules,
+    SetState,
+    _intern_long_game,
+    intern_game,
+)
 
 
 @pytest.mark.unit
@@ -137,3 +150,111 @@ def test_match_state_is_immutable() -> None:
 
     with pytest.raises(AttributeError):
         match.is_finished = True  # type: ignore
+
+
+@pytest.mark.unit
+def test_game_history_append_shares_existing_games() -> None:
+    """Test that appending to a GameHistory leaves the original unchanged."""
+    first = GameState(home_score=4, away_score=0, is_tiebreak=False)
+    second = GameState(home_score=1, away_score=4, is_tiebreak=False)
+    history = GameHistory([first])
+    extended = history.append(second)
+
+    assert list(history) == [first]
+    assert list(extended) == [first, second]
+    assert extended[1] == second
+    assert extended[-1:] == (second,)
+    assert len(extended) == 2
+
+
+@pytest.mark.unit
+def test_long_game_history_pickles_and_indexes() -> None:
+    """Test pickling, deep copying and indexing a history far longer than the recursion limit."""
+    games = [
+        GameState(home_score=4, away_score=index % 3, is_tiebreak=False) for index in range(5000)
+    ]
+    history = GameHistory(games)
+
+    assert pickle.loads(pickle.dumps(history)) == history
+    assert copy.deepcopy(history) == history
+    assert history[-1] is games[-1]
+    assert history[4999] is games[-1]
+    assert history[0] == games[0]
+    with pytest.raises(IndexError):
+        GameHistory()[-1]
+
+
+@pytest.mark.unit
+def test_game_history_equality_and_hash() -> None:
+    """Test that GameHistory compares equal to lists and tuples of the same games."""
+    game = GameState(home_score=4, away_score=2, is_tiebreak=False)
+    history = GameHistory().append(game)
+
+    assert history == [game]
+    assert history == (game,)
+    assert history == GameHistory([game])
+    assert history != []
+    assert hash(history) == hash(GameHistory([game]))
+    assert history.__eq__("not a history") is NotImplemented
+    assert repr(GameHistory()) == "GameHistory([])"
+
+
+@pytest.mark.unit
+def test_set_and_match_state_convert_sequences() -> None:
+    """Test that list arguments are stored as persistent/immutable sequences."""
+    game = GameState(home_score=0, away_score=0, is_tiebreak=False)
+    set_state = SetState(home_score=0, away_score=0, current_game=game, games=[game])
+    rules = ScoringRules(
+        best_of=3,
+        final_set_match_tiebreak=False,
+        match_tiebreak_points=10,
+        regular_tiebreak_points=7,
+        deciding_point=False,
+    )
+    match = MatchState(
+        home_score=0,
+        away_score=0,
+        current_set_index=0,
+        sets=[set_state],
+        is_finished=False,
+        match_type=MatchType.DOUBLES_DAVISCUP,
+        rules=rules,
+    )
+
+    assert isinstance(set_state.games, GameHistory)
+    assert match.sets == (set_state,)
+
+
+@pytest.mark.unit
+def test_models_are_slotted_and_picklable() -> None:
+    """Test that model instances have no __dict__ and survive pickling."""
+    game = GameState(home_score=1, away_score=2, is_tiebreak=False)
+    set_state = SetState(home_score=3, away_score=1, current_game=game, games=[game])
+
+    assert not hasattr(game, "__dict__")
+    assert not hasattr(set_state, "__dict__")
+    assert pickle.loads(pickle.dumps(set_state)) == set_state
+
+
+@pytest.mark.unit
+def test_intern_game_returns_shared_instances() -> None:
+    """Test that equal game scores are interned to one instance."""
+    game = intern_game(3, 4, False)
+
+    assert intern_game(3, 4, False) is game
+    assert game == GameState(home_score=3, away_score=4, is_tiebreak=False)
+    assert hash(game) == hash(GameState(home_score=3, away_score=4, is_tiebreak=False))
+    assert game != intern_game(3, 4, True)
+    assert pickle.loads(pickle.dumps(game)) is game
+
+
+@pytest.mark.unit
+def test_intern_game_bounds_long_tiebreaks() -> None:
+    """Test that long tiebreak scores are interned in a bounded cache."""
+    game = intern_game(40, 41, True)
+
+    assert intern_game(40, 41, True) is game
+    for score in range(100, 100 + 2 * TIEBREAK_CACHE_SIZE):
+        assert intern_game(score, score + 1, True).home_score == score
+    assert _intern_long_game.cache_info().currsize == TIEBREAK_CACHE_SIZE
+    assert intern_game(40, 41, True) == game
@@ -0,0 +1,71 @@
+"""Tests for packed match state encoding."""
+
+import random
+from dataclasses import replace
+
+import pytest
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import MatchType
+from pytennisscorer.packing import pack_match_state, unpack_match_state
+from pytennisscorer.progression import score_match_point
+
+
+@pytest.mark.unit
+def test_pack_initial_state_round_trips() -> None:
+    """Test that a fresh match state survives a pack/unpack round trip."""
+    state = create_match_config(MatchType.SINGLES_GRANDSLAM).initial_state
+    packed = pack_match_state(state)
+
+    assert isinstance(packed, bytes)
+    assert unpack_match_state(packed) == state
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("match_type", list(MatchType))
+def test_pack_round_trips_every_point(match_type: MatchType) -> None:
+    """Test that states at every point of a random match round trip losslessly."""
+    rng = random.Random(match_type.value)
+    state = create_match_config(match_type).initial_state
+    while not state.is_finished:
+        state = score_match_point(state, rng.random() < 0.5)
+        unpacked = unpack_match_state(pack_match_state(state))
+        assert unpacked == state
+        assert hash(unpacked) == hash(state)
+
+
+@pytest.mark.unit
+def test_pack_long_tiebreak_scores() -> None:
+    """Test that scores above one byte are encoded correctly."""
+    state = create_match_config(MatchType.DOUBLES_DAVISCUP).initial_state
+    for i in range(12):
+        for _ in range(4):
+            state = score_match_point(state, is_home=i % 2 == 0)
+    for _ in range(200):
+        state = score_match_point(state, is_home=True)
+        state = score_match_point(state, is_home=False)
+
+    assert state.sets[0].current_game.home_score == 200
+    assert unpack_match_state(pack_match_state(state)) == state
+
+
+@pytest.mark.unit
+def test_pack_rejects_custom_rules() -> None:
+    """Test that states whose rules differ from their match type are rejected."""
+    state = create_match_config(MatchType.DOUBLES_DAVISCUP).initial_state
+    state = replace(state, rules=replace(state.rules, deciding_point=True))
+    with pytest.raises(ValueError):
+        pack_match_state(state)
+
+
+@pytest.mark.unit
+def test_unpack_rejects_malformed_data() -> None:
+    """Test that truncated, trailing or unknown data is rejected."""
+    packed = pack_match_state(create_match_config(MatchType.DOUBLES_DAVISCUP).initial_state)
+
+    with pytest.raises(ValueError):
+        unpack_match_state(packed[:-1])
+    with pytest.raises(ValueError):
+        unpack_match_state(packed + b"\x00")
+    with pytest.raises(ValueError):
+        unpack_match_state(b"\x7f")
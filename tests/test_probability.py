@@ -0,0 +1,131 @@
+"""Tests for the exact win-probability engine."""
+
+import pytest
+from _probability_helpers import game_win_probability
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import GameState, MatchType
+from pytennisscorer.probability import (
+    MODEL_CACHE_SIZE,
+    WinProbabilities,
+    exact_win_probabilities,
+    get_probability_model,
+)
+from pytennisscorer.progression import score_match_point
+from pytennisscorer.scorer import TennisScorer
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("match_type", "deciding_point"),
+    [(MatchType.DOUBLES_DAVISCUP, False), (MatchType.DOUBLES_ATPTOUR, True)],
+)
+def test_game_probability_matches_closed_form(match_type: MatchType, deciding_point: bool) -> None:
+    """Test the exact game probability against the analytic formula."""
+    state = create_match_config(match_type).initial_state
+    result = exact_win_probabilities(
+        state, home_serve_win=0.6, away_serve_win=0.6, home_serving=True
+    )
+    assert result.game == pytest.approx(game_win_probability(0.6, deciding_point))
+
+
+@pytest.mark.unit
+def test_equal_players_have_even_match_probability() -> None:
+    """Test that identical players are exactly equally likely to win."""
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+    result = exact_win_probabilities(
+        scorer, home_serve_win=0.65, away_serve_win=0.65, home_serving=True
+    )
+    assert result.match == pytest.approx(0.5)
+    assert result.set == pytest.approx(0.5)
+    assert result.game > 0.5
+
+
+@pytest.mark.unit
+def test_probabilities_are_symmetric() -> None:
+    """Test that swapping the players complements every probability."""
+    state = create_match_config(MatchType.SINGLES_ATP_FINALS).initial_state
+    home = exact_win_probabilities(state, 0.66, 0.6, home_serving=True)
+    away = exact_win_probabilities(state, 0.6, 0.66, home_serving=False)
+    assert home.game == pytest.approx(1 - away.game)
+    assert home.set == pytest.approx(1 - away.set)
+    assert home.match == pytest.approx(1 - away.match)
+
+
+@pytest.mark.unit
+def test_tiebreak_and_late_states() -> None:
+    """Test probabilities from deep into a deciding-set tiebreak."""
+    state = create_match_config(MatchType.SINGLES_ATP_FINALS).initial_state
+    # 6:6 in two sets each way is not reachable in best of 3; play one set each, then 6:6
+    for is_home in [True] * 24 + [False] * 24:
+        state = score_match_point(state, is_home)
+    for _ in range(6):
+        for is_home in [True] * 4 + [False] * 4:
+            state = score_match_point(state, is_home)
+    for is_home in [True, False] * 8:
+        state = score_match_point(state, is_home)
+    game = state.sets[2].current_game
+    assert game.is_tiebreak
+
+    result = exact_win_probabilities(state, 0.6, 0.6, home_serving=True)
+    # At a late tie with equal servers the tiebreak, set and match are all coin flips
+    assert result.game == pytest.approx(0.5)
+    assert result.set == pytest.approx(result.game)
+    assert result.match == pytest.approx(result.game)
+
+
+@pytest.mark.unit
+def test_deep_tiebreak_is_normalized() -> None:
+    """Test that a long tiebreak gives the same answer as its normalized score."""
+    model = get_probability_model(
+        create_match_config(MatchType.SINGLES_ATP_FINALS).rules, 0.7, 0.55
+    )
+    long_tie = model.game(GameState(home_score=15, away_score=15, is_tiebreak=True), True)
+    short_tie = model.game(GameState(home_score=7, away_score=7, is_tiebreak=True), True)
+    assert long_tie == pytest.approx(short_tie)
+    assert 0.0 < long_tie < 1.0
+
+
+@pytest.mark.unit
+def test_finished_match() -> None:
+    """Test that a finished match returns certain probabilities."""
+    state = create_match_config(MatchType.SINGLES_ATP_FINALS).initial_state
+    for _ in range(48):
+        state = score_match_point(state, is_home=False)
+    assert state.is_finished
+    assert exact_win_probabilities(state, 0.6, 0.6, True) == WinProbabilities(0.0, 0.0, 0.0)
+
+
+@pytest.mark.unit
+def test_models_are_shared_per_rules_and_probabilities() -> None:
+    """Test that models are cached on rules and probabilities with bounded size."""
+    rules = create_match_config(MatchType.SINGLES_GRANDSLAM).rules
+    assert get_probability_model(rules, 0.6, 0.6) is get_probability_model(rules, 0.6, 0.6)
+    assert get_probability_model(rules, 0.6, 0.6) is not get_probability_model(rules, 0.6, 0.61)
+    assert get_probability_model.cache_info().maxsize == MODEL_CACHE_SIZE
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [-0.1, 1.5])
+def test_invalid_probability_raises(value: float) -> None:
+    """Test that probabilities outside [0, 1] are rejected."""
+    state = create_match_config(MatchType.SINGLES_GRANDSLAM).initial_state
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        exact_win_probabilities(state, value, 0.6, home_serving=True)
+
+
+@pytest.mark.unit
+def test_agrees_with_simulation() -> None:
+    """Test that Monte Carlo estimates converge to the exact values."""
+    pytest.importorskip("numpy")
+    from pytennisscorer.simulation import simulate_win_probabilities
+
+    state = create_match_config(MatchType.SINGLES_ATP_FINALS).initial_state
+    for is_home in [True, False, True, True, False] * 9:
+        state = score_match_point(state, is_home)
+
+    exact = exact_win_probabilities(state, 0.64, 0.6, home_serving=False)
+    estimate = simulate_win_probabilities(state, 0.64, 0.6, home_serving=False, seed=5)
+    assert estimate.game == pytest.approx(exact.game, abs=0.01)
+    assert estimate.set == pytest.approx(exact.set, abs=0.01)
+    assert estimate.match == pytest.approx(exact.match, abs=0.01)
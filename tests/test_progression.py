@@ -1,14 +1,28 @@
 """Tests for set and match progression logic."""
 
+import random
+from dataclasses import replace
+
 import pytest
 
-from pytennisscorer.models import GameState, MatchState, MatchType, ScoringRules, SetState
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.formatter import format_match_score
+from pytennisscorer.models import (
+    NEW_SET,
+    GameState,
+    MatchState,
+    MatchType,
+    ScoringRules,
+    SetState,
+    intern_game,
+)
 from pytennisscorer.progression import (
     check_match_complete,
     get_match_winner,
     is_set_finished,
     progress_to_next_game,
     progress_to_next_set,
+    score_match_point,
 )
 
 
@@ -280,3 +294,68 @@ def test_progress_to_next_set_creates_new_set() -> None:
     assert new_set.current_game.away_score == 0
     assert new_set.current_game.is_tiebreak is False
     assert len(new_set.games) == 0
+
+
+@pytest.mark.unit
+def test_new_sets_and_games_are_shared() -> None:
+    """Test that fresh sets and games reuse shared instances."""
+    game = GameState(home_score=4, away_score=0, is_tiebreak=False)
+    set_state = SetState(home_score=5, away_score=6, current_game=game, games=[])
+    new_set = progress_to_next_game(set_state, home_won_game=True, deciding_point=False)
+
+    assert new_set.current_game is intern_game(0, 0, True)
+    assert progress_to_next_set(deciding_point=False) is NEW_SET
+    assert set(create_match_config(MatchType.SINGLES_GRANDSLAM).initial_state.sets) == {NEW_SET}
+
+
+@pytest.mark.unit
+def test_score_match_point_progresses_game() -> None:
+    """Test that scoring a game point moves the match to the next game."""
+    match = create_match_config(MatchType.DOUBLES_DAVISCUP).initial_state
+    for _ in range(4):
+        match = score_match_point(match, is_home=True)
+
+    assert match.sets[0].home_score == 1
+    assert match.sets[0].current_game.home_score == 0
+    assert len(match.sets[0].games) == 1
+
+
+@pytest.mark.unit
+def test_score_match_point_ignores_finished_match() -> None:
+    """Test that a finished match is returned unchanged."""
+    match = create_match_config(MatchType.DOUBLES_DAVISCUP).initial_state
+    for _ in range(2 * 6 * 4):
+        match = score_match_point(match, is_home=True)
+
+    assert match.is_finished is True
+    assert score_match_point(match, is_home=False) is match
+
+
+@pytest.mark.unit
+def test_sets_are_added_only_when_reached() -> None:
+    """Test that a straight-sets best-of-5 match never allocates its fourth set."""
+    match = create_match_config(MatchType.SINGLES_GRANDSLAM).initial_state
+    while not match.is_finished:
+        match = score_match_point(match, is_home=True)
+        assert len(match.sets) == match.current_set_index + 1
+
+    assert len(match.sets) == 3
+    assert format_match_score(match) == "6:0;6:0;6:0"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("match_type", list(MatchType))
+def test_preallocated_sets_score_like_lazy_sets(match_type: MatchType) -> None:
+    """Test that states carrying every set up front still score and format the same."""
+    lazy = create_match_config(match_type).initial_state
+    padded = replace(lazy, sets=(NEW_SET,) * lazy.rules.best_of)
+    rng = random.Random(11)
+    while not lazy.is_finished:
+        is_home = rng.random() < 0.5
+        lazy = score_match_point(lazy, is_home)
+        padded = score_match_point(padded, is_home)
+        assert format_match_score(padded) == format_match_score(lazy)
+
+    assert padded.is_finished
+    assert get_match_winner(padded) == get_match_winner(lazy)
+    assert padded.sets[: len(lazy.sets)] == lazy.sets
@@ -0,0 +1,67 @@
+"""Tests for the thread-safe scorer registry."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pytennisscorer.models import MatchType
+from pytennisscorer.registry import ScorerRegistry
+
+
+@pytest.mark.unit
+def test_registry_scores_and_undoes_matches() -> None:
+    """Test the per-match operations."""
+    registry = ScorerRegistry(num_stripes=4)
+    registry.add("a", MatchType.DOUBLES_DAVISCUP)
+    registry.add(7, MatchType.SINGLES_GRANDSLAM)
+    assert len(registry) == 2
+    assert "a" in registry and 7 in registry and "b" not in registry
+
+    assert registry.increase_score("a", is_home=True) == "0:0-15:0"
+    assert registry.get_score(7) == "0:0-0:0"
+    assert registry.undo("a")
+    assert not registry.undo("a")
+    assert registry.get_score("a") == "0:0-0:0"
+
+    for _ in range(48):
+        registry.increase_score("a", is_home=False)
+    assert registry.get_winner("a") == "away"
+    assert registry.get_state("a").is_finished
+    assert registry.remove("a").is_finished
+    assert len(registry) == 1
+
+
+@pytest.mark.unit
+def test_registry_errors() -> None:
+    """Test duplicate and unknown match ids and invalid stripe counts."""
+    registry = ScorerRegistry()
+    registry.add("a", MatchType.DOUBLES_DAVISCUP)
+    with pytest.raises(ValueError, match="already exists"):
+        registry.add("a", MatchType.DOUBLES_DAVISCUP)
+    with pytest.raises(ValueError, match="Unknown match"):
+        registry.increase_score("b", is_home=True)
+    with pytest.raises(ValueError, match="Unknown match"):
+        registry.remove("b")
+    with pytest.raises(ValueError, match="num_stripes"):
+        ScorerRegistry(num_stripes=0)
+
+
+@pytest.mark.unit
+def test_concurrent_points_on_shared_and_separate_matches() -> None:
+    """Test that concurrent updates are neither lost nor interleaved."""
+    registry = ScorerRegistry(num_stripes=8)
+    registry.add("shared", MatchType.SINGLES_GRANDSLAM)
+    for thread in range(8):
+        registry.add(thread, MatchType.SINGLES_GRANDSLAM)
+
+    def work(thread: int) -> None:
+        for _ in range(64):
+            registry.increase_score(thread, is_home=True)
+        for _ in range(8):
+            registry.increase_score("shared", is_home=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(8)))
+
+    assert registry.get_score("shared") == "6:0;6:0;4:0-0:0"
+    assert {registry.get_score(thread) for thread in range(8)} == {"6:0;6:0;4:0-0:0"}
@@ -0,0 +1,90 @@
+"""Tests for streaming point-feed replay."""
+
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from pytennisscorer.formatter import format_match_score
+from pytennisscorer.models import MatchType
+from pytennisscorer.replay import iter_points, replay, replay_states
+from pytennisscorer.scorer import TennisScorer
+
+
+@pytest.mark.unit
+def test_iter_points_accepts_strings_bools_and_ints() -> None:
+    """Test that all supported point encodings are normalized."""
+    assert list(iter_points("HhA a10")) == [True, True, False, False, True, False]
+    assert list(iter_points([True, False, 1, 0])) == [True, False, True, False]
+
+
+@pytest.mark.unit
+def test_iter_points_reads_bytes_like_strings(tmp_path: Path) -> None:
+    """Test bytes feeds and the lines of a file opened in binary mode."""
+    assert list(iter_points(b"HA a1")) == [True, False, False, True]
+    assert list(iter_points([b"HA\n", bytearray(b"0h")])) == [True, False, False, True]
+    with pytest.raises(ValueError):
+        list(iter_points(b"HAX"))
+
+    feed = tmp_path / "points.txt"
+    feed.write_bytes(b"AAAA\nAAAA\n" * 7)
+    with feed.open("rb") as lines:
+        assert list(replay(MatchType.DOUBLES_DAVISCUP, lines))[-1] == "0:6;0:6"
+    assert list(replay(MatchType.DOUBLES_DAVISCUP, b"A" * 56))[-1] == "0:6;0:6"
+
+
+@pytest.mark.unit
+def test_iter_points_rejects_unknown_characters() -> None:
+    """Test that unknown characters in a string feed raise ValueError."""
+    with pytest.raises(ValueError):
+        list(iter_points("HAX"))
+
+
+@pytest.mark.unit
+def test_replay_yields_score_after_each_point() -> None:
+    """Test replaying a short string feed."""
+    assert list(replay(MatchType.DOUBLES_DAVISCUP, "HHA")) == [
+        "0:0-15:0",
+        "0:0-30:0",
+        "0:0-30:15",
+    ]
+
+
+@pytest.mark.unit
+def test_replay_reads_file_lines() -> None:
+    """Test replaying a feed stored one game per line."""
+    feed = io.StringIO("HHHH\nAAAA\n")
+    scores = list(replay(MatchType.DOUBLES_DAVISCUP, feed))
+    assert len(scores) == 8
+    assert scores[-1] == "1:1-0:0"
+
+
+@pytest.mark.unit
+def test_replay_stops_at_match_end() -> None:
+    """Test that replay does not consume points after the match is won."""
+    points = iter([True] * 48 + [False] * 10)
+    scores = list(replay(MatchType.DOUBLES_DAVISCUP, points))
+
+    assert scores[-1] == "6:0;6:0"
+    assert len(scores) == 48
+    assert len(list(points)) == 10
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("match_type", list(MatchType))
+def test_replay_matches_tennis_scorer(match_type: MatchType) -> None:
+    """Test that both replay functions agree with TennisScorer."""
+    rng = random.Random(match_type.value)
+    points = [rng.random() < 0.55 for _ in range(600)]
+
+    scorer = TennisScorer(match_type)
+    expected = []
+    for is_home in points:
+        scorer.increase_score(is_home)
+        expected.append(scorer.get_score())
+        if scorer.get_winner() is not None:
+            break
+
+    assert list(replay(match_type, points)) == expected
+    assert [format_match_score(state) for state in replay_states(match_type, points)] == expected
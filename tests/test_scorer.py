@@ -1,7 +1,10 @@
 """Tests for main TennisScorer API."""
 
+import random
+
 import pytest
 
+from pytennisscorer.formatter import format_match_score
 from pytennisscorer.models import MatchType
 from pytennisscorer.scorer import TennisScorer
 
@@ -164,3 +167,297 @@ def test_tiebreak_scoring() -> None:
     # Score in tiebreak uses numbers
     scorer.increase_score(is_home=True)
     assert scorer.get_score() == "6:6-1:0"
+
+
+@pytest.mark.unit
+def test_undo_reverts_exactly_one_point() -> None:
+    """Test that each undo steps back exactly one point."""
+    scorer = TennisScorer(MatchType.DOUBLES_DAVISCUP)
+    scorer.increase_score(is_home=True)
+    scorer.increase_score(is_home=False)
+    for _ in range(3):
+        scorer.increase_score(is_home=True)
+    assert scorer.get_score() == "1:0-0:0"
+
+    assert scorer.undo() is True
+    assert scorer.get_score() == "0:0-40:15"
+    assert scorer.undo() is True
+    assert scorer.get_score() == "0:0-30:15"
+
+
+@pytest.mark.unit
+def test_undo_across_checkpoints_restores_every_score() -> None:
+    """Test that undoing a long match retraces every intermediate score."""
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+    scores = [scorer.get_score()]
+    for i in range(150):
+        scorer.increase_score(is_home=(i // 7) % 2 == 0)
+        scores.append(scorer.get_score())
+    assert scorer.get_winner() is None
+
+    for expected in reversed(scores[:-1]):
+        assert scorer.undo() is True
+        assert scorer.get_score() == expected
+
+    assert scorer.undo() is False
+
+
+@pytest.mark.unit
+def test_max_undo_limits_undo_depth() -> None:
+    """Test that no more than max_undo points can be undone."""
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM, max_undo=5)
+    scores = [scorer.get_score()]
+    for i in range(100):
+        scorer.increase_score(is_home=i % 2 == 0)
+        scores.append(scorer.get_score())
+
+    for expected in reversed(scores[-6:-1]):
+        assert scorer.undo() is True
+        assert scorer.get_score() == expected
+
+    assert scorer.undo() is False
+    assert scorer.get_score() == scores[-6]
+
+
+@pytest.mark.unit
+def test_max_undo_bounds_history_size() -> None:
+    """Test that the undo log stays bounded with max_undo."""
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM, max_undo=10)
+    for i in range(300):
+        scorer.increase_score(is_home=i % 2 == 0)
+
+    assert len(scorer._points) < 10 + 16
+    assert len(scorer._checkpoints) <= 3
+
+
+@pytest.mark.unit
+def test_max_undo_zero_disables_undo() -> None:
+    """Test that max_undo=0 disables undo."""
+    scorer = TennisScorer(MatchType.DOUBLES_DAVISCUP, max_undo=0)
+    scorer.increase_score(is_home=True)
+    assert scorer.undo() is False
+    assert scorer.get_score() == "0:0-15:0"
+
+
+@pytest.mark.unit
+def test_negative_max_undo_raises() -> None:
+    """Test that a negative max_undo is rejected."""
+    with pytest.raises(ValueError):
+        TennisScorer(MatchType.DOUBLES_DAVISCUP, max_undo=-1)
+
+
+@pytest.mark.unit
+def test_get_score_matches_formatter_through_undo() -> None:
+    """Test that the cached score always equals a freshly formatted score."""
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+    for i in range(200):
+        scorer.increase_score(is_home=(i // 5) % 3 != 0)
+        assert scorer.get_score() == format_match_score(scorer._state)
+
+    while scorer.undo():
+        assert scorer.get_score() == format_match_score(scorer._state)
+
+
+@pytest.mark.unit
+def test_get_score_is_cached_between_points() -> None:
+    """Test that repeated polling returns the same cached string."""
+    scorer = TennisScorer(MatchType.DOUBLES_DAVISCUP)
+    scorer.increase_score(is_home=True)
+    assert scorer.get_score() is scorer.get_score()
+
+
+@pytest.mark.unit
+def test_get_score_after_undo_into_finished_set() -> None:
+    """Test that replaying a reopened set refreshes the finished-sets text."""
+    scorer = TennisScorer(MatchType.DOUBLES_DAVISCUP)
+    for _ in range(24):
+        scorer.increase_score(is_home=True)
+    assert scorer.get_score() == "6:0;0:0-0:0"
+
+    for _ in range(4):
+        scorer.undo()
+    for _ in range(4):
+        scorer.increase_score(is_home=False)
+    for _ in range(8):
+        scorer.increase_score(is_home=True)
+    assert scorer.get_score() == "6:1;1:0-0:0"
+
+
+@pytest.mark.unit
+def test_from_score_continues_like_replayed_scorer() -> None:
+    """Test that a scorer created from a score string continues identically."""
+    rng = random.Random(11)
+    replayed = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+    for _ in range(120):
+        replayed.increase_score(rng.random() < 0.5)
+
+    restored = TennisScorer.from_score(MatchType.SINGLES_GRANDSLAM, replayed.get_score())
+    assert restored.get_score() == replayed.get_score()
+    assert not restored.undo()
+
+    while replayed.get_winner() is None:
+        is_home = rng.random() < 0.5
+        replayed.increase_score(is_home)
+        restored.increase_score(is_home)
+        assert restored.get_score() == replayed.get_score()
+    assert restored.get_winner() == replayed.get_winner()
+    assert restored.undo()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("match_type", list(MatchType))
+@pytest.mark.parametrize("max_undo", [None, 5, 40])
+def test_apply_points_matches_increase_score(match_type: MatchType, max_undo: int) -> None:
+    """Test that batched points give the same state and undo log as single points."""
+    rng = random.Random(13)
+    single = TennisScorer(match_type, max_undo=max_undo)
+    batched = TennisScorer(match_type, max_undo=max_undo)
+
+    while single.get_winner() is None:
+        burst = [rng.random() < 0.5 for _ in range(rng.randrange(1, 40))]
+        for is_home in burst:
+            single.increase_score(is_home)
+        batched.apply_points(burst)
+        assert batched.state == single.state
+        assert batched.get_score() == single.get_score()
+
+    batched.apply_points([True, False])
+    assert batched.state == single.state
+    while single.undo():
+        assert batched.undo()
+        assert batched.get_score() == single.get_score()
+    assert not batched.undo()
+
+
+@pytest.mark.unit
+def test_apply_points_empty_sequence() -> None:
+    """Test that applying no points leaves the scorer unchanged."""
+    scorer = TennisScorer(MatchType.DOUBLES_ATPTOUR)
+    state = scorer.state
+    scorer.apply_points([])
+    assert scorer.state is state
+    assert not scorer.undo()
+
+
+@pytest.mark.unit
+def test_apply_points_through_tiebreak() -> None:
+    """Test batched points across a tiebreak match the single-point path."""
+    points = [game % 2 == 0 for game in range(12) for _ in range(4)]
+    points += [True, False] * 6 + [True, True]
+    single = TennisScorer(MatchType.SINGLES_ATP_FINALS)
+    for is_home in points:
+        single.increase_score(is_home)
+    batched = TennisScorer(MatchType.SINGLES_ATP_FINALS)
+    batched.apply_points(points)
+    assert batched.state == single.state
+    assert batched.get_score() == "7:6;0:0-0:0"
+
+
+def _reference_scores(match_type: MatchType, points: list[bool]) -> list[str]:
+    """Score after each prefix of points, index 0 being the initial score."""
+    scorer = TennisScorer(match_type)
+    scores = [scorer.get_score()]
+    for is_home in points:
+        scorer.increase_score(is_home)
+        scores.append(scorer.get_score())
+    return scores
+
+
+@pytest.mark.unit
+def test_seek_moves_back_and_forth_without_losing_points() -> None:
+    """Test scrubbing through a match with seek, undo and redo."""
+    rng = random.Random(19)
+    points = [rng.random() < 0.5 for _ in range(150)]
+    expected = _reference_scores(MatchType.SINGLES_GRANDSLAM, points)
+
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+    scorer.apply_points(points)
+    assert scorer.point_index == 150
+    assert scorer.seek_range == (0, 150)
+
+    for target in [3, 149, 0, 77, 150, 16, 17, 15, 100]:
+        scorer.seek(target)
+        assert scorer.point_index == target
+        assert scorer.seek_range == (0, 150)
+        assert scorer.get_score() == expected[target]
+
+    assert scorer.undo()
+    assert scorer.get_score() == expected[99]
+    assert scorer.redo()
+    assert scorer.redo()
+    assert scorer.get_score() == expected[101]
+
+    scorer.seek(150)
+    assert not scorer.redo()
+    assert scorer.get_score() == expected[150]
+
+
+@pytest.mark.unit
+def test_new_point_discards_redo() -> None:
+    """Test that scoring after a rewind starts a new timeline."""
+    scorer = TennisScorer(MatchType.DOUBLES_DAVISCUP)
+    scorer.apply_points([True] * 10)
+    scorer.seek(4)
+    scorer.increase_score(is_home=False)
+    assert scorer.seek_range == (0, 5)
+    assert not scorer.redo()
+    assert scorer.get_score() == "1:0-0:15"
+
+    scorer.seek(2)
+    scorer.apply_points([False])
+    assert scorer.seek_range == (0, 3)
+
+
+@pytest.mark.unit
+def test_seek_with_bounded_undo() -> None:
+    """Test point indexes and seek limits once max_undo trims the log."""
+    rng = random.Random(23)
+    points = [rng.random() < 0.5 for _ in range(100)]
+    expected = _reference_scores(MatchType.SINGLES_GRANDSLAM, points)
+
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM, max_undo=20)
+    scorer.apply_points(points)
+    assert scorer.point_index == 100
+    assert scorer.seek_range == (80, 100)
+
+    scorer.seek(80)
+    assert scorer.get_score() == expected[80]
+    scorer.seek(95)
+    assert scorer.get_score() == expected[95]
+    with pytest.raises(ValueError, match="reachable range 80..100"):
+        scorer.seek(79)
+    with pytest.raises(ValueError, match="reachable range"):
+        scorer.seek(101)
+
+    restored = TennisScorer.from_bytes(scorer.to_bytes())
+    assert restored.point_index == 95
+    assert restored.seek_range == (80, 95)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_undo", [None, 30])
+def test_random_seeks_and_new_points_match_reference(max_undo: int) -> None:
+    """Test random scrubbing mixed with new points against a reference replay."""
+    rng = random.Random(29)
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM, max_undo=max_undo)
+    timeline: list[bool] = []
+
+    for _ in range(300):
+        action = rng.random()
+        first, last = scorer.seek_range
+        if action < 0.5:
+            target = rng.randint(first, last)
+            scorer.seek(target)
+        elif action < 0.6:
+            scorer.redo()
+        else:
+            burst = [rng.random() < 0.5 for _ in range(rng.randrange(1, 20))]
+            del timeline[scorer.point_index :]
+            before = scorer.point_index
+            scorer.apply_points(burst)
+            timeline.extend(burst[: scorer.point_index - before])
+        index = scorer.point_index
+        assert (
+            scorer.get_score()
+            == _reference_scores(MatchType.SINGLES_GRANDSLAM, timeline[:index])[-1]
+        )
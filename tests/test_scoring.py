@@ -2,8 +2,8 @@
 
 import pytest
 
-from pytennisscorer.models import GameState
-from pytennisscorer.scoring import is_game_finished, score_game_point
+from pytennisscorer.models import GameState, intern_game
+from pytennisscorer.scoring import is_game_finished, score_game_point, score_tiebreak_point
 
 
 @pytest.mark.unit
@@ -121,3 +121,13 @@ def test_score_game_point_does_not_modify_finished_game() -> None:
     new_game = score_game_point(game, is_home=True, deciding_point=False)
     # Should not change since game is already finished
     assert new_game == game
+
+
+@pytest.mark.unit
+def test_scoring_returns_interned_games() -> None:
+    """Test that scoring a point returns shared game instances instead of new ones."""
+    game = GameState(home_score=1, away_score=1, is_tiebreak=False)
+    tiebreak = GameState(home_score=5, away_score=5, is_tiebreak=True)
+
+    assert score_game_point(game, True, deciding_point=False) is intern_game(2, 1, False)
+    assert score_tiebreak_point(tiebreak, False, tiebreak_points=7) is intern_game(5, 6, True)
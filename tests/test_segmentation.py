@@ -0,0 +1,65 @@
+"""Tests for vectorized segmentation of a match's point sequence."""
+
+import random
+
+import pytest
+
+from pytennisscorer.models import MatchType
+
+np = pytest.importorskip("numpy")
+
+from pytennisscorer.segmentation import segment_match  # noqa: E402
+from pytennisscorer.timeline import COLUMNS, point_timeline  # noqa: E402
+
+
+def _assert_same_timeline(match_type: MatchType, points: list[bool]) -> None:
+    """Assert that segmentation and the transition table scorer agree on every column."""
+    expected = point_timeline(match_type, points)
+    actual = segment_match(match_type, np.array(points, dtype=np.bool_))
+
+    assert tuple(actual.columns) == COLUMNS
+    assert actual.offsets.tolist() == expected.offsets.tolist()
+    for name in COLUMNS:
+        assert actual.columns[name].tolist() == expected.columns[name].tolist(), name
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("match_type", list(MatchType))
+def test_random_matches_match_point_timeline(match_type: MatchType) -> None:
+    """Test random matches of every type, with extra points after the match end."""
+    rng = random.Random(11)
+    for bias in (0.5, 0.5, 0.6, 0.8):
+        _assert_same_timeline(match_type, [rng.random() < bias for _ in range(rng.randint(0, 700))])
+
+
+@pytest.mark.unit
+def test_tiebreak_heavy_matches() -> None:
+    """Test matches where most sets reach a tiebreak, including long tiebreaks."""
+    rng = random.Random(4)
+    for match_type in (MatchType.SINGLES_GRANDSLAM, MatchType.DOUBLES_ATPTOUR):
+        for _ in range(20):
+            points: list[bool] = []
+            for _ in range(5):
+                # Games traded to 6:6, then a tiebreak of random length
+                points += [game % 2 == 0 for game in range(12) for _ in range(4)]
+                points += [bool(point % 2) for point in range(2 * rng.randint(0, 12))]
+                points += [rng.random() < 0.5 for _ in range(rng.randint(0, 10))]
+            _assert_same_timeline(match_type, points)
+
+
+@pytest.mark.unit
+def test_segment_match_columns() -> None:
+    """Test a deciding point game and a partial tiebreak beyond the normalized range."""
+    deciding = segment_match(MatchType.DOUBLES_ATPTOUR, "HAHAHAA")
+    assert deciding.columns["game_end"].tolist() == [False] * 6 + [True]
+    assert deciding.columns["away_games"][-1] == 1
+
+    points = [game % 2 == 0 for game in range(12) for _ in range(4)] + [True, False] * 12
+    tiebreak = segment_match(MatchType.SINGLES_ATP_FINALS, points)
+    assert tiebreak.columns["home_points"][-1] == tiebreak.columns["away_points"][-1] == 12
+    assert tiebreak.columns["tiebreak"][-24:].all()
+    assert not tiebreak.columns["tiebreak"][:-24].any()
+
+    empty = segment_match(MatchType.SINGLES_GRANDSLAM, [])
+    assert len(empty) == 0
+    assert empty.num_matches == 1
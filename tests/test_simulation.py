@@ -0,0 +1,99 @@
+"""Tests for the Monte Carlo win-probability simulator."""
+
+import pytest
+from _probability_helpers import game_win_probability
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import GameState, MatchType
+from pytennisscorer.progression import score_match_point
+from pytennisscorer.scorer import TennisScorer
+
+pytest.importorskip("numpy")
+
+from pytennisscorer.simulation import WinProbabilities, simulate_win_probabilities  # noqa: E402
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("match_type", "deciding_point"),
+    [(MatchType.DOUBLES_DAVISCUP, False), (MatchType.DOUBLES_ATPTOUR, True)],
+)
+def test_game_probability_matches_closed_form(match_type: MatchType, deciding_point: bool) -> None:
+    """Test the simulated game probability against the analytic formula."""
+    state = create_match_config(match_type).initial_state
+    result = simulate_win_probabilities(
+        state, home_serve_win=0.6, away_serve_win=0.6, home_serving=True, seed=1
+    )
+    assert result.game == pytest.approx(game_win_probability(0.6, deciding_point), abs=0.01)
+
+
+@pytest.mark.unit
+def test_equal_players_have_even_match_probability() -> None:
+    """Test that identical players are equally likely to win."""
+    scorer = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+    result = simulate_win_probabilities(
+        scorer, home_serve_win=0.65, away_serve_win=0.65, home_serving=True, seed=2
+    )
+    assert result.match == pytest.approx(0.5, abs=0.01)
+    assert result.game > 0.5
+
+
+@pytest.mark.unit
+def test_best_of_five_favours_stronger_player() -> None:
+    """Test that longer matches favour the stronger player more."""
+    kwargs = {"home_serve_win": 0.64, "away_serve_win": 0.6, "home_serving": True, "seed": 3}
+    best_of_3 = simulate_win_probabilities(
+        create_match_config(MatchType.SINGLES_ATP_FINALS).initial_state, **kwargs
+    )
+    best_of_5 = simulate_win_probabilities(
+        create_match_config(MatchType.SINGLES_GRANDSLAM).initial_state, **kwargs
+    )
+    assert 0.5 < best_of_3.match < best_of_5.match
+
+
+@pytest.mark.unit
+def test_tiebreak_in_progress_is_simulated() -> None:
+    """Test simulating from inside a long tiebreak at 6-6 in the final set."""
+    state = create_match_config(MatchType.DOUBLES_DAVISCUP).initial_state
+    # Split the first two sets 6:0 and 0:6, then trade games to 6-6 in the third
+    for is_home in (True, False):
+        for _ in range(24):
+            state = score_match_point(state, is_home)
+    for _ in range(48):
+        current_set = state.sets[state.current_set_index]
+        state = score_match_point(state, is_home=len(current_set.games) % 2 == 0)
+    assert state.current_set_index == 2
+    for _ in range(12):
+        state = score_match_point(state, is_home=True)
+        state = score_match_point(state, is_home=False)
+    state = score_match_point(state, is_home=True)
+    assert state.sets[2].current_game == GameState(home_score=13, away_score=12, is_tiebreak=True)
+
+    result = simulate_win_probabilities(
+        state, home_serve_win=0.5, away_serve_win=0.5, home_serving=True, seed=4
+    )
+    assert result.game == pytest.approx(0.75, abs=0.01)
+    assert result.set == result.match == result.game
+
+
+@pytest.mark.unit
+def test_finished_match_is_certain() -> None:
+    """Test that a finished match returns the actual outcome."""
+    scorer = TennisScorer(MatchType.DOUBLES_DAVISCUP)
+    for _ in range(48):
+        scorer.increase_score(is_home=False)
+
+    result = simulate_win_probabilities(
+        scorer, home_serve_win=0.9, away_serve_win=0.1, home_serving=True
+    )
+    assert result == WinProbabilities(game=0.0, set=0.0, match=0.0)
+
+
+@pytest.mark.unit
+def test_invalid_arguments_raise() -> None:
+    """Test that invalid probabilities and simulation counts are rejected."""
+    state = create_match_config(MatchType.DOUBLES_DAVISCUP).initial_state
+    with pytest.raises(ValueError):
+        simulate_win_probabilities(state, 1.5, 0.5, home_serving=True)
+    with pytest.raises(ValueError):
+        simulate_win_probabilities(state, 0.5, 0.5, home_serving=True, num_simulations=0)
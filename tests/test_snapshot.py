@@ -0,0 +1,130 @@
+"""Tests for scorer snapshots and bulk snapshot files."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from pytennisscorer.models import MatchType
+from pytennisscorer.scorer import SNAPSHOT_HEADER, TennisScorer
+from pytennisscorer.snapshot import load_snapshots, save_snapshots
+
+
+def _played(match_type: MatchType, points: int, seed: int, **kwargs: int) -> TennisScorer:
+    rng = random.Random(seed)
+    scorer = TennisScorer(match_type, **kwargs)
+    for _ in range(points):
+        scorer.increase_score(rng.random() < 0.5)
+    return scorer
+
+
+@pytest.mark.unit
+def test_round_trip_restores_score_and_state() -> None:
+    """Test that a restored scorer has the same state and score."""
+    scorer = _played(MatchType.SINGLES_GRANDSLAM, 150, seed=1)
+    restored = TennisScorer.from_bytes(scorer.to_bytes())
+    assert restored.state == scorer.state
+    assert restored.get_score() == scorer.get_score()
+    assert restored.get_winner() == scorer.get_winner()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_undo", [None, 20])
+def test_restored_scorer_undoes_like_original(max_undo: int) -> None:
+    """Test that undo and further scoring behave identically after restoring."""
+    original = _played(MatchType.SINGLES_GRANDSLAM, 101, seed=2, max_undo=max_undo)
+    restored = TennisScorer.from_bytes(original.to_bytes())
+
+    rng = random.Random(3)
+    for _ in range(60):
+        if rng.random() < 0.4:
+            assert restored.undo() == original.undo()
+        else:
+            is_home = rng.random() < 0.5
+            original.increase_score(is_home)
+            restored.increase_score(is_home)
+        assert restored.get_score() == original.get_score()
+
+    while original.undo():
+        assert restored.undo()
+        assert restored.get_score() == original.get_score()
+    assert not restored.undo()
+
+
+@pytest.mark.unit
+def test_restored_scorer_rebuilds_checkpoints() -> None:
+    """Test that undo after restoring rebuilds checkpoints and new points add more."""
+    original = _played(MatchType.SINGLES_GRANDSLAM, 155, seed=6)
+    restored = TennisScorer.from_bytes(original.to_bytes())
+    assert len(restored._checkpoints) == 1
+
+    assert restored.undo()
+    assert restored._checkpoints == original._checkpoints
+    assert restored.redo()
+    for is_home in [True, False] * 8:
+        original.increase_score(is_home)
+        restored.increase_score(is_home)
+    assert len(restored._checkpoints) == len(original._checkpoints) == 171 // 16 + 1
+    assert restored._checkpoints == original._checkpoints
+
+    scored = TennisScorer.from_bytes(original.to_bytes())
+    scored.apply_points([True] * 16)
+    original.apply_points([True] * 16)
+    assert scored._checkpoints == original._checkpoints
+
+
+@pytest.mark.unit
+def test_from_bytes_accepts_memoryview() -> None:
+    """Test restoring from a slice of a larger buffer."""
+    snapshot = _played(MatchType.DOUBLES_DAVISCUP, 40, seed=4).to_bytes()
+    buffer = bytearray(b"xx" + snapshot + b"yy")
+    restored = TennisScorer.from_bytes(memoryview(buffer)[2:-2])
+    assert restored.to_bytes() == snapshot
+
+
+@pytest.mark.unit
+def test_from_bytes_rejects_malformed_data() -> None:
+    """Test that corrupt snapshots raise ValueError."""
+    snapshot = _played(MatchType.DOUBLES_DAVISCUP, 40, seed=5).to_bytes()
+    with pytest.raises(ValueError, match="Truncated"):
+        TennisScorer.from_bytes(snapshot[:4])
+    with pytest.raises(ValueError, match="Not a scorer snapshot"):
+        TennisScorer.from_bytes(b"XXXX" + snapshot[4:])
+    with pytest.raises(ValueError, match="version"):
+        TennisScorer.from_bytes(snapshot[:4] + b"\x09" + snapshot[5:])
+    with pytest.raises(ValueError, match="length"):
+        TennisScorer.from_bytes(snapshot + b"\x00")
+
+    corrupt = bytearray(snapshot)
+    corrupt[SNAPSHOT_HEADER.size] = 7
+    with pytest.raises(ValueError, match="point log"):
+        TennisScorer.from_bytes(corrupt)
+
+
+@pytest.mark.unit
+def test_bulk_file_round_trip(tmp_path: Path) -> None:
+    """Test saving and loading many scorers through one mapped file."""
+    scorers = [
+        _played(match_type, 30 * i, seed=i) for i, match_type in enumerate(list(MatchType) * 3)
+    ]
+    path = tmp_path / "live.snap"
+    assert save_snapshots(path, scorers) == len(scorers)
+
+    restored = load_snapshots(path)
+    assert [s.get_score() for s in restored] == [s.get_score() for s in scorers]
+    assert [s.to_bytes() for s in restored] == [s.to_bytes() for s in scorers]
+
+
+@pytest.mark.unit
+def test_bulk_file_empty_and_malformed(tmp_path: Path) -> None:
+    """Test an empty snapshot file and rejection of corrupt files."""
+    path = tmp_path / "empty.snap"
+    save_snapshots(path, [])
+    assert load_snapshots(path) == []
+
+    path.write_bytes(path.read_bytes() + b"\x00")
+    with pytest.raises(ValueError, match="length"):
+        load_snapshots(path)
+    path.write_bytes(b"NOPE" + bytes(8))
+    with pytest.raises(ValueError, match="Not a snapshot file"):
+        load_snapshots(path)
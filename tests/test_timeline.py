@@ -0,0 +1,111 @@
+"""Tests for columnar point-by-point timelines."""
+
+import random
+
+import pytest
+
+from pytennisscorer.models import MatchType
+from pytennisscorer.scorer import TennisScorer
+
+np = pytest.importorskip("numpy")
+
+from pytennisscorer.timeline import COLUMNS, point_timeline, point_timelines  # noqa: E402
+
+
+def _reference_rows(match_type: MatchType, points: list[bool]) -> list[dict[str, object]]:
+    """Timeline rows built point by point from TennisScorer states."""
+    scorer = TennisScorer(match_type)
+    rows: list[dict[str, object]] = []
+    for is_home in points:
+        if scorer.state.is_finished:
+            break
+        before = scorer.state
+        scorer.increase_score(is_home)
+        state = scorer.state
+        current_set = state.sets[state.current_set_index]
+        rows.append(
+            {
+                "point": len(rows),
+                "home_won": is_home,
+                "home_points": current_set.current_game.home_score,
+                "away_points": current_set.current_game.away_score,
+                "home_games": current_set.home_score,
+                "away_games": current_set.away_score,
+                "home_sets": state.home_score,
+                "away_sets": state.away_score,
+                "set_index": state.current_set_index,
+                "tiebreak": before.sets[before.current_set_index].current_game.is_tiebreak,
+                "game_end": current_set.current_game.home_score
+                + current_set.current_game.away_score
+                == 0,
+                "set_end": state.home_score + state.away_score
+                != before.home_score + before.away_score,
+                "match_end": state.is_finished,
+            }
+        )
+    return rows
+
+
+@pytest.mark.unit
+def test_point_timeline_columns() -> None:
+    """Test the columns of a short match feed."""
+    timeline = point_timeline(MatchType.DOUBLES_DAVISCUP, "HHHH A")
+
+    assert tuple(timeline.columns) == COLUMNS
+    assert len(timeline) == 5
+    assert timeline.num_matches == 1
+    assert timeline.columns["home_points"].tolist() == [1, 2, 3, 0, 0]
+    assert timeline.columns["away_points"].tolist() == [0, 0, 0, 0, 1]
+    assert timeline.columns["home_games"].tolist() == [0, 0, 0, 1, 1]
+    assert timeline.columns["game_end"].tolist() == [False, False, False, True, False]
+    assert timeline.columns["match"].dtype == np.int32
+
+
+@pytest.mark.unit
+def test_point_timelines_match_tennis_scorer() -> None:
+    """Test random matches of every type, interleaved, against TennisScorer."""
+    rng = random.Random(3)
+    records = [
+        (match_type, [rng.random() < 0.5 for _ in range(rng.randint(0, 400))])
+        for match_type in list(MatchType) * 4
+    ]
+    rng.shuffle(records)
+    records.append((MatchType.SINGLES_GRANDSLAM, np.array([True] * 80 + [False] * 20)))
+
+    timeline = point_timelines(records)
+
+    assert timeline.num_matches == len(records)
+    for index, (match_type, points) in enumerate(records):
+        expected = _reference_rows(match_type, [bool(point) for point in points])
+        columns = timeline.match(index)
+        assert (columns["match"] == index).all()
+        actual = [
+            {name: column[row].item() for name, column in columns.items() if name != "match"}
+            for row in range(len(columns["point"]))
+        ]
+        assert actual == expected
+
+
+@pytest.mark.unit
+def test_point_timelines_long_tiebreak_and_empty_input() -> None:
+    """Test tiebreak scores beyond the normalized table range and empty input."""
+    points = [game % 2 == 0 for game in range(12) for _ in range(4)] + [True, False] * 12
+    timeline = point_timeline(MatchType.SINGLES_ATP_FINALS, points)
+
+    assert timeline.columns["home_points"][-1] == 12
+    assert timeline.columns["away_points"][-1] == 12
+    assert timeline.columns["tiebreak"][-24:].all()
+
+    empty = point_timelines([])
+    assert len(empty) == 0
+    assert empty.num_matches == 0
+
+
+@pytest.mark.unit
+def test_to_arrow() -> None:
+    """Test conversion to an Arrow table."""
+    pytest.importorskip("pyarrow")
+    table = point_timeline(MatchType.DOUBLES_DAVISCUP, "HHAH").to_arrow()
+
+    assert table.column_names == list(COLUMNS)
+    assert table.num_rows == 4
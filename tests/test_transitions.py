@@ -0,0 +1,101 @@
+"""Tests for the precomputed transition table engine."""
+
+import random
+from dataclasses import replace
+
+import pytest
+
+from pytennisscorer.configs import create_match_config
+from pytennisscorer.models import MatchType
+from pytennisscorer.scorer import TennisScorer
+from pytennisscorer.transitions import TableScorer, compile_transition_table
+
+
+@pytest.mark.unit
+def test_table_is_cached_per_rules() -> None:
+    """Test that match types sharing rules share one compiled table."""
+    davis = compile_transition_table(create_match_config(MatchType.DOUBLES_DAVISCUP).rules)
+    finals = compile_transition_table(create_match_config(MatchType.SINGLES_ATP_FINALS).rules)
+    assert davis is finals
+
+
+@pytest.mark.unit
+def test_table_scorer_initial_score() -> None:
+    """Test that a fresh table scorer starts at 0:0-0:0."""
+    scorer = TableScorer(MatchType.SINGLES_GRANDSLAM)
+    assert scorer.get_score() == "0:0-0:0"
+    assert scorer.get_winner() is None
+
+
+@pytest.mark.unit
+def test_table_scorer_long_tiebreak_display() -> None:
+    """Test that tiebreak scores beyond the normalized range display correctly."""
+    scorer = TableScorer(MatchType.DOUBLES_DAVISCUP)
+    for i in range(12):
+        for _ in range(4):
+            scorer.increase_score(is_home=i % 2 == 0)
+
+    for _ in range(9):
+        scorer.increase_score(is_home=True)
+        scorer.increase_score(is_home=False)
+    assert scorer.get_score() == "6:6-9:9"
+
+    scorer.increase_score(is_home=True)
+    scorer.increase_score(is_home=True)
+    assert scorer.get_score() == "7:6;0:0-0:0"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("match_type", list(MatchType))
+def test_table_scorer_matches_tennis_scorer(match_type: MatchType) -> None:
+    """Test that the table scorer agrees with TennisScorer on random matches."""
+    rng = random.Random(match_type.value)
+    for _ in range(20):
+        reference = TennisScorer(match_type)
+        scorer = TableScorer(match_type)
+        bias = rng.uniform(0.3, 0.7)
+        while reference.get_winner() is None:
+            is_home = rng.random() < bias
+            reference.increase_score(is_home)
+            scorer.increase_score(is_home)
+            assert scorer.get_score() == reference.get_score()
+
+        assert scorer.get_winner() == reference.get_winner()
+        scorer.increase_score(is_home=True)
+        assert scorer.get_score() == reference.get_score()
+
+
+@pytest.mark.unit
+def test_table_scorer_set_scores() -> None:
+    """Test that set scores include finished sets and the current set."""
+    scorer = TableScorer(MatchType.DOUBLES_DAVISCUP)
+    for _ in range(28):
+        scorer.increase_score(is_home=True)
+    assert scorer.get_set_scores() == [(6, 0), (1, 0)]
+
+    for _ in range(20):
+        scorer.increase_score(is_home=True)
+    assert scorer.get_set_scores() == [(6, 0), (6, 0)]
+
+
+@pytest.mark.unit
+def test_state_of_locates_match_states() -> None:
+    """Test that every match state maps to the table state the scorer is in."""
+    rng = random.Random(7)
+    reference = TennisScorer(MatchType.SINGLES_GRANDSLAM)
+    scorer = TableScorer(MatchType.SINGLES_GRANDSLAM)
+    table = compile_transition_table(reference.state.rules)
+    while reference.get_winner() is None:
+        is_home = rng.random() < 0.5
+        reference.increase_score(is_home)
+        scorer.increase_score(is_home)
+        assert table.state_of(reference.state) == (scorer.state, scorer._tiebreak_offset)
+
+
+@pytest.mark.unit
+def test_state_of_rejects_unreachable_state() -> None:
+    """Test that unreachable states are rejected."""
+    state = create_match_config(MatchType.DOUBLES_DAVISCUP).initial_state
+    table = compile_transition_table(state.rules)
+    with pytest.raises(ValueError):
+        table.state_of(replace(state, home_score=5))